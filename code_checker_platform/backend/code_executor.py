@@ -4,9 +4,12 @@
 import sys
 import io
 import traceback
+import types
 from contextlib import redirect_stdout, redirect_stderr
 from RestrictedPython import compile_restricted, safe_globals
-from RestrictedPython.Guards import safe_builtins
+from RestrictedPython.Guards import (
+    safe_builtins, guarded_iter_unpack_sequence, guarded_unpack_sequence
+)
 from RestrictedPython.PrintCollector import PrintCollector
 
 
@@ -24,6 +27,22 @@ class CodeExecutor:
         'hasattr', 'getattr', 'setattr', 'delattr', 'dir', 'vars',
         'all', 'any', 'map', 'filter', 'iter', 'next'
     }
+
+    # Функции для работы с данными, которых нет в safe_builtins RestrictedPython.
+    # Список явный: getattr, type, dir, vars, iter и подобных здесь нет
+    DATA_BUILTINS = {
+        'list': list, 'dict': dict, 'set': set, 'enumerate': enumerate,
+        'max': max, 'min': min, 'sum': sum, 'reversed': reversed,
+        'all': all, 'any': any,
+    }
+
+    # По чему можно идти циклом for (и распаковкой a, b = ...)
+    ITERABLE_TYPES = (
+        list, tuple, dict, str, set, frozenset, range, enumerate, zip, reversed,
+        type({}.keys()), type({}.values()), type({}.items()),
+        type(iter([])), type(iter(())), type(iter('')), type(iter(range(0))),
+        type(reversed([])), types.GeneratorType,
+    )
     
     def __init__(self, timeout=5):
         """
@@ -37,6 +56,10 @@ class CodeExecutor:
             name: func for name, func in safe_builtins.items()
             if name in self.ALLOWED_BUILTINS
         }
+        for name, func in self.DATA_BUILTINS.items():
+            self.safe_builtins.setdefault(name, func)
+        # Нужен для объявления классов (class Cat: ...); берётся из safe_builtins
+        self.safe_builtins['__build_class__'] = safe_builtins['__build_class__']
     
     def execute(self, code, context=None):
         """
@@ -69,15 +92,40 @@ class CodeExecutor:
         
         # Создаём безопасное окружение с необходимыми "стражами"
         restricted_globals = safe_globals.copy()
-        restricted_globals['__builtins__'] = {
-            name: func for name, func in safe_builtins.items()
-            if name in self.ALLOWED_BUILTINS
-        }
-        restricted_globals['_print_'] = PrintCollector
+        restricted_globals['__builtins__'] = dict(self.safe_builtins)
+        restricted_globals['__name__'] = 'exercise'  # Для __module__ классов
+
+        # print() в функциях и методах получает свой PrintCollector;
+        # общий список собирает вывод отовсюду, а не только из модуля
+        printed = []
+
+        class SharedPrintCollector(PrintCollector):
+            def __init__(self, _getattr_=None):
+                super().__init__(_getattr_)
+                self.txt = printed
+
+        restricted_globals['_print_'] = SharedPrintCollector
+
+        # RestrictedPython создаёт каждый класс через __metaclass__.
+        # Запоминаем классы ученика: только их объектам можно читать
+        # и менять свои атрибуты (self.name), но не служебные (_...)
+        user_classes = []
+
+        def user_metaclass(name, bases, namespace):
+            cls = type(name, bases, namespace)
+            user_classes.append(cls)
+            return cls
+
+        def is_user_object(obj):
+            return bool(user_classes) and isinstance(obj, tuple(user_classes))
+
+        restricted_globals['__metaclass__'] = user_metaclass
 
         # Добавляем базовые стражи для работы с атрибутами и элементами
         # Эти функции обеспечивают безопасный доступ к объектам
         def safe_getattr(obj, name):
+            if is_user_object(obj) and not name.startswith('_'):
+                return getattr(obj, name)
             if isinstance(obj, (list, tuple, dict, str, int, float, bool)):
                 try:
                     return getattr(obj, name)
@@ -114,7 +162,22 @@ class CodeExecutor:
             else:
                 raise TypeError("Object does not support item assignment")
 
+        def safe_write(obj):
+            # obj.attr = ... и obj[key] = ... — только списки, словари и объекты ученика
+            if isinstance(obj, (list, dict)) or is_user_object(obj):
+                return obj
+            raise TypeError(f"Изменять объект типа '{type(obj).__name__}' нельзя")
+
+        def safe_getiter(obj):
+            if isinstance(obj, self.ITERABLE_TYPES):
+                return iter(obj)
+            raise TypeError(f"По объекту типа '{type(obj).__name__}' нельзя пройти циклом")
+
         restricted_globals['_getattr_'] = safe_getattr
+        restricted_globals['_write_'] = safe_write
+        restricted_globals['_getiter_'] = safe_getiter
+        restricted_globals['_iter_unpack_sequence_'] = guarded_iter_unpack_sequence
+        restricted_globals['_unpack_sequence_'] = guarded_unpack_sequence
         restricted_globals['_setattr_'] = safe_setattr
         restricted_globals['_getitem_'] = safe_getitem
         restricted_globals['_setitem_'] = safe_setitem
@@ -177,16 +240,8 @@ class CodeExecutor:
             with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
                 exec(code_to_execute, restricted_globals)
             
-            # Получаем вывод из PrintCollector
-            # RestrictedPython создаёт функцию _print после выполнения кода
-            print_output = ''
-            if '_print' in restricted_globals:
-                # Вызываем функцию _print() чтобы получить собранный вывод
-                try:
-                    print_output = restricted_globals['_print']()
-                except:
-                    # Если _print не функция, просто получаем строковое представление
-                    print_output = str(restricted_globals.get('_print', ''))
+            # Весь вывод print() — из модуля, функций и методов
+            print_output = ''.join(printed)
             
             # Получаем переменные из контекста
             variables = {
@@ -0,0 +1,192 @@
+"""
+Регрессионная проверка заданий против эталонных решений.
+
+Для каждого задания из exercises/ прогоняет:
+- встроенный пример ("example" в JSON),
+- правильные решения из exercises/<урок>/solutions/exercise_<N>.py и exercise_<N>_*.py,
+- неправильные решения из exercises/<урок>/wrong/exercise_<N>.py и exercise_<N>_*.py.
+
+Результаты (прошло / не прошло) сравниваются с сохранённым эталоном
+exercises/baseline.json. Если какой-то вердикт поменялся или решение
+ведёт себя не так, как положено его виду (пример или правильное решение
+не прошло, неправильное прошло), — скрипт печатает список и завершается
+с кодом 1. Такие случаи — ошибки проверяющего кода или задания, их нельзя
+"заморозить" в эталоне.
+
+Запуск:
+    python regression.py            # проверить
+    python regression.py --update   # перезаписать эталон
+    python regression.py --jobs 4   # число процессов
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(__file__))
+from test_checker import TestChecker
+
+
+EXERCISES_DIR = os.path.join(os.path.dirname(__file__), '..', 'exercises')
+BASELINE_FILE = os.path.join(EXERCISES_DIR, 'baseline.json')
+
+# Какой вердикт ожидается для каждого вида решения
+EXPECTED = {
+    'example': True,
+    'solutions': True,
+    'wrong': False,
+}
+
+_checker = None
+
+
+def find_fixtures(lesson_dir, kind, name):
+    """
+    Решения для задания name: <name>.py и <name>_*.py.
+
+    Шаблон <name>*.py не подходит: для exercise_1 он подхватил бы
+    и exercise_10.py, exercise_11_short.py и т.д.
+    """
+    folder = os.path.join(lesson_dir, kind)
+    exact = glob.glob(os.path.join(folder, f'{name}.py'))
+    variants = glob.glob(os.path.join(folder, f'{name}_*.py'))
+    return sorted(exact + variants)
+
+
+def collect_cases(exercises_dir=EXERCISES_DIR):
+    """
+    Собирает все проверки: (id, путь к заданию, вид решения, код).
+
+    Returns:
+        list: Отсортированный список кортежей
+    """
+    cases = []
+    pattern = os.path.join(exercises_dir, '*', 'exercise_*.json')
+
+    for exercise_file in sorted(glob.glob(pattern)):
+        lesson = os.path.basename(os.path.dirname(exercise_file))
+        name = os.path.splitext(os.path.basename(exercise_file))[0]
+        exercise_id = f'{lesson}/{name}'
+
+        with open(exercise_file, 'r', encoding='utf-8') as f:
+            exercise_data = json.load(f)
+
+        if exercise_data.get('example'):
+            cases.append((f'{exercise_id}/example', exercise_file, 'example', exercise_data['example']))
+
+        for kind in ('solutions', 'wrong'):
+            for fixture in find_fixtures(os.path.dirname(exercise_file), kind, name):
+                with open(fixture, 'r', encoding='utf-8') as f:
+                    code = f.read()
+                fixture_name = os.path.splitext(os.path.basename(fixture))[0]
+                cases.append((f'{exercise_id}/{kind}/{fixture_name}', exercise_file, kind, code))
+
+    return cases
+
+
+def _run_case(case):
+    """Выполняет одну проверку в процессе-исполнителе."""
+    global _checker
+    if _checker is None:
+        # RestrictedPython шумит предупреждениями про print — они здесь не нужны
+        warnings.simplefilter('ignore')
+        _checker = TestChecker()
+
+    case_id, exercise_file, kind, code = case
+    with open(exercise_file, 'r', encoding='utf-8') as f:
+        exercise_data = json.load(f)
+
+    result = _checker.check_exercise(code, exercise_data)
+    return case_id, kind, result['passed']
+
+
+def run_all(cases, jobs=None):
+    """
+    Прогоняет все проверки параллельно на нескольких ядрах.
+
+    Returns:
+        dict: {id проверки: (вид решения, прошло ли)}
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_run_case, cases, chunksize=4)
+        return {case_id: (kind, passed) for case_id, kind, passed in results}
+
+
+def load_baseline(path=BASELINE_FILE):
+    """Загружает эталонные вердикты. Если файла нет — пустой словарь."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(verdicts, path=BASELINE_FILE):
+    """Сохраняет вердикты как новый эталон."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(verdicts, f, ensure_ascii=False, indent=4, sort_keys=True)
+        f.write('\n')
+
+
+def compare(verdicts, baseline):
+    """
+    Сравнивает текущие вердикты с эталоном.
+
+    Returns:
+        dict: Списки 'flipped', 'added', 'removed'
+    """
+    return {
+        'flipped': sorted(k for k in verdicts if k in baseline and verdicts[k] != baseline[k]),
+        'added': sorted(k for k in verdicts if k not in baseline),
+        'removed': sorted(k for k in baseline if k not in verdicts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Регрессионная проверка заданий')
+    parser.add_argument('--update', action='store_true', help='перезаписать эталон')
+    parser.add_argument('--jobs', type=int, default=None, help='число процессов (по умолчанию — все ядра)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cases = collect_cases()
+    results = run_all(cases, args.jobs)
+    verdicts = {case_id: passed for case_id, (kind, passed) in results.items()}
+    elapsed = time.perf_counter() - start
+
+    print(f'Проверок: {len(cases)}, время: {elapsed:.2f} с')
+
+    # Решения, которые ведут себя не так, как положено их виду
+    unexpected = sorted(
+        case_id for case_id, (kind, passed) in results.items()
+        if passed != EXPECTED[kind]
+    )
+    for case_id in unexpected:
+        print(f'⚠️  Неожиданный вердикт: {case_id} -> {"прошло" if verdicts[case_id] else "не прошло"}')
+
+    if args.update:
+        save_baseline(verdicts)
+        print(f'Эталон сохранён: {BASELINE_FILE}')
+        return 0
+
+    diff = compare(verdicts, load_baseline())
+
+    for case_id in diff['flipped']:
+        print(f'❌ Вердикт изменился: {case_id} -> {"прошло" if verdicts[case_id] else "не прошло"}')
+    for case_id in diff['added']:
+        print(f'➕ Новая проверка (нет в эталоне): {case_id}')
+    for case_id in diff['removed']:
+        print(f'➖ Проверка пропала: {case_id}')
+
+    if diff['flipped'] or diff['removed'] or unexpected:
+        return 1
+
+    print('✅ Все вердикты совпадают с эталоном')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -96,6 +96,17 @@ class TestChecker:
                 'actual': result['output']
             }
         
+        elif test_type == 'code_contains':
+            # Проверка, что в самом коде есть строка (например, "class Cat:")
+            expected = test_config.get('expected', '')
+            passed = expected in code
+
+            return {
+                'passed': passed,
+                'message': f'✅ В коде есть "{expected}"!' if passed else f'❌ В коде нет "{expected}"',
+                'actual': None
+            }
+
         elif test_type == 'no_error':
             # Проверка, что код выполняется без ошибок
             result = self.executor.execute(code)
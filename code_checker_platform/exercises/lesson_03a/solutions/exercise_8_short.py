@@ -0,0 +1,19 @@
+# Правильное решение без лишних веток
+score = 85
+
+if score >= 90:
+    grade = "Отлично"
+    message = "Ты молодец! Продолжай в том же духе!"
+elif score >= 70:
+    grade = "Хорошо"
+    message = "Неплохо! Можно лучше."
+else:
+    grade = "Удовлетворительно"
+    message = "Надо подучить материал."
+
+print(f"Баллы: {score}")
+print(f"Оценка: {grade}")
+print(f"Комментарий: {message}")
+
+if score >= 70:
+    print("Ты прошёл тест!")
@@ -0,0 +1,10 @@
+# Ошибка: забыли добавить "жёлтый" в список
+age = 12
+name = "Игрок"
+colors = ["красный", "синий", "зелёный"]
+is_active = True
+
+print(f"Имя: {name}, Возраст: {age}")
+age = age + 1
+is_active = False
+print(f"Новый возраст: {age}")
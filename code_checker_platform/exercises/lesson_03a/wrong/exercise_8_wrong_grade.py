@@ -0,0 +1,16 @@
+# Ошибка: перепутан порог для оценки "Хорошо"
+score = 85
+
+if score >= 90:
+    grade = "Отлично"
+    message = "Ты молодец! Продолжай в том же духе!"
+elif score >= 86:
+    grade = "Хорошо"
+    message = "Неплохо! Можно лучше."
+else:
+    grade = "Удовлетворительно"
+    message = "Надо подучить материал."
+
+print(f"Баллы: {score}")
+print(f"Оценка: {grade}")
+print(f"Комментарий: {message}")
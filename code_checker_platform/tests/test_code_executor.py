@@ -0,0 +1,161 @@
+"""
+Тесты песочницы CodeExecutor: что ученику можно и что по-прежнему нельзя.
+
+Запуск:
+    python -m pytest code_checker_platform/tests
+"""
+import json
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..', 'backend')
+EXERCISES_DIR = os.path.join(os.path.dirname(__file__), '..', 'exercises')
+sys.path.append(BACKEND_DIR)
+
+import test_checker
+from code_executor import CodeExecutor
+
+# RestrictedPython предупреждает про print() без использования printed
+pytestmark = pytest.mark.filterwarnings('ignore::SyntaxWarning')
+
+
+@pytest.fixture
+def executor():
+    return CodeExecutor()
+
+
+CAT = '''
+class Cat:
+    def __init__(self, name):
+        self.name = name
+        self.is_hungry = True
+
+    def feed(self):
+        self.is_hungry = False
+        print(f"{self.name} покормлена!")
+
+murka = Cat("Мурка")
+murka.feed()
+'''
+
+
+# ===== Что нужно ученикам =====
+
+def test_class_with_attributes_and_methods(executor):
+    result = executor.execute(CAT + 'print(murka.name, murka.is_hungry)')
+    assert result['success'], result['error']
+    assert result['output'] == 'Мурка покормлена!\nМурка False\n'
+
+
+def test_inheritance(executor):
+    code = CAT + '''
+class Kitten(Cat):
+    def play(self):
+        print(self.name + " играет")
+
+Kitten("Пушок").play()
+'''
+    result = executor.execute(code)
+    assert result['success'], result['error']
+    assert result['output'].endswith('Пушок играет\n')
+
+
+def test_print_inside_function_is_collected(executor):
+    code = 'def greet(name):\n    print("Привет,", name)\n\ngreet("Аня")\nprint("конец")'
+    result = executor.execute(code)
+    assert result['success'], result['error']
+    assert result['output'] == 'Привет, Аня\nконец\n'
+
+
+def test_unpacking_and_data_builtins(executor):
+    code = '''
+numbers = [5, 10, 15]
+for i, num in enumerate(numbers, 1):
+    print(i, num)
+a, b = max(numbers), min(numbers)
+total = sum(numbers)
+pairs = {k: v for k, v in {"x": 1}.items()}
+'''
+    result = executor.execute(code)
+    assert result['success'], result['error']
+    assert result['variables']['a'] == 15
+    assert result['variables']['b'] == 5
+    assert result['variables']['total'] == 30
+    assert result['variables']['pairs'] == {'x': 1}
+
+
+def test_list_and_dict_writes(executor):
+    result = executor.execute('scores = [1, 2]\nscores[0] = 5\nd = {}\nd["a"] = 1')
+    assert result['success'], result['error']
+    assert result['variables']['scores'] == [5, 2]
+    assert result['variables']['d'] == {'a': 1}
+
+
+@pytest.mark.parametrize('number', [6, 7, 8, 9, 10])
+def test_lesson_examples_pass(number):
+    with open(os.path.join(EXERCISES_DIR, 'lesson_03a', f'exercise_{number}.json'), encoding='utf-8') as f:
+        exercise = json.load(f)
+    result = test_checker.TestChecker().check_exercise(exercise['example'], exercise)
+    assert result['passed'], [t for t in result['tests'] if not t['passed']]
+
+
+# ===== Что по-прежнему запрещено =====
+
+@pytest.mark.parametrize('code', [
+    # Служебные атрибуты — и у встроенных объектов, и у объектов ученика
+    '().__class__.__bases__[0].__subclasses__()',
+    'x = "".__class__',
+    'def f():\n    pass\ng = f.__globals__',
+    CAT + 'c = murka.__class__',
+    CAT + 'm = murka.feed.__func__',
+    CAT + 's = Cat.__subclasses__()',
+    CAT + 'd = murka.__dict__',
+    # Файлы и импорт
+    'open("/etc/passwd").read()',
+    '__import__("os")',
+    'import os',
+    'from os import system',
+    # Функции, которые обходят стражей
+    'getattr((), "__class__")',
+    'type(())',
+    'vars()',
+    'eval("1")',
+    'exec("x = 1")',
+    'globals()',
+    # Подмена метакласса
+    'class Evil(metaclass=type):\n    pass',
+])
+def test_escape_is_rejected(executor, code):
+    result = executor.execute(code)
+    assert not result['success']
+
+
+def test_cannot_read_attributes_of_foreign_objects(executor):
+    # Функции — не объекты ученика: их атрибуты закрыты
+    result = executor.execute('def f():\n    pass\nname = f.name')
+    assert not result['success']
+    assert 'not allowed' in result['error']
+
+
+def test_cannot_write_to_foreign_objects(executor):
+    for code in ('def f():\n    pass\nf.x = 1', CAT + 'Cat.sound = "мяу"', 's = "abc"\ns.x = 1'):
+        result = executor.execute(code)
+        assert not result['success'], code
+
+
+def test_cannot_iterate_over_non_data(executor):
+    result = executor.execute(CAT + 'for item in Cat:\n    pass')
+    assert not result['success']
+    assert 'циклом' in result['error']
+
+
+# ===== Проверка по тексту кода =====
+
+def test_code_contains_checks_source_not_output():
+    checker = test_checker.TestChecker()
+    exercise = {'tests': [{'type': 'code_contains', 'expected': 'class Cat:'}]}
+    assert checker.check_exercise(CAT, exercise)['passed']
+    # В выводе есть "class Cat:", а в коде — нет
+    assert not checker.check_exercise('print("class " + "Cat:")', exercise)['passed']
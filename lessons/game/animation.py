@@ -0,0 +1,114 @@
+"""Анимация из листа спрайтов (sprite sheet).
+
+Лист — одна картинка, на которой кадры лежат сеткой. Резать его
+subsurface(), отражать flip() и масштабировать scale() каждый кадр
+дорого, поэтому всё это делается один раз при загрузке:
+
+    frames = slice_sheet(sheet, columns=3, rows=2, size=(50, 50))
+    clip = Clip(frames, steps_per_frame=8)   # кадры вправо и влево — готовые списки
+
+Дальше у каждой сущности свой Animator — два поля, без картинок:
+
+    animator = Animator(clip)
+    animator.update()                    # раз в шаг симуляции
+    screen.blit(animator.image("left"), (x, y))
+
+Сотня анимированных врагов — это сотня счётчиков и индексов в общих списках кадров.
+"""
+import pygame
+
+from surfaces import to_display_format
+
+
+def slice_sheet(sheet, columns, rows, size=None, count=None, trim=False):
+    """Режет лист на кадры слева направо, сверху вниз.
+
+    size — до какого размера масштабировать кадр; count — сколько кадров
+    взять (если последняя строка неполная); trim — обрезать пустые поля,
+    общие для всех кадров (кадры остаются выровнены друг относительно друга).
+    """
+    width, height = sheet.get_size()
+    cells = []
+    for row in range(rows):
+        for column in range(columns):
+            # Границы пропорциональные: ширина листа не обязана делиться нацело
+            left = column * width // columns
+            top = row * height // rows
+            right = (column + 1) * width // columns
+            bottom = (row + 1) * height // rows
+            cells.append(pygame.Rect(left, top, right - left, bottom - top))
+    if count is not None:
+        cells = cells[:count]
+
+    if trim:
+        # Общая рамка: объединение непрозрачных областей всех кадров
+        # в координатах ячейки
+        bounds = None
+        for cell in cells:
+            used = sheet.subsurface(cell).get_bounding_rect()
+            bounds = used if bounds is None else bounds.union(used)
+        cells = [pygame.Rect(cell.x + bounds.x, cell.y + bounds.y, bounds.width, bounds.height)
+                 for cell in cells]
+
+    frames = []
+    for cell in cells:
+        frame = sheet.subsurface(cell)
+        if size is not None:
+            frame = pygame.transform.smoothscale(frame, size)
+        frames.append(to_display_format(frame.copy()))
+    return frames
+
+
+class Clip:
+    """Кадры одной анимации в обе стороны и скорость их смены."""
+
+    __slots__ = ("right", "left", "steps_per_frame", "loop")
+
+    def __init__(self, frames, steps_per_frame=6, loop=True, left=None):
+        """left — уже отражённые кадры (например, из атласа); иначе отражаются здесь."""
+        self.right = list(frames)
+        if left is None:
+            left = [to_display_format(pygame.transform.flip(frame, True, False)) for frame in frames]
+        self.left = list(left)
+        self.steps_per_frame = steps_per_frame
+        self.loop = loop
+
+    def __len__(self):
+        return len(self.right)
+
+    def frame_index(self, steps):
+        index = steps // self.steps_per_frame
+        if self.loop:
+            return index % len(self.right)
+        return min(index, len(self.right) - 1)
+
+    def image(self, steps, direction="right"):
+        frames = self.left if direction == "left" else self.right
+        return frames[self.frame_index(steps)]
+
+
+class Animator:
+    """Какая анимация играет у сущности и сколько шагов она уже идёт."""
+
+    __slots__ = ("clip", "steps")
+
+    def __init__(self, clip=None, steps=0):
+        self.clip = clip
+        self.steps = steps  # Разный начальный шаг — враги не машут в унисон
+
+    def play(self, clip):
+        """Переключает анимацию (та же — продолжает играть с текущего кадра)."""
+        if clip is not self.clip:
+            self.clip = clip
+            self.steps = 0
+
+    def update(self, steps=1):
+        self.steps += steps
+
+    @property
+    def finished(self):
+        clip = self.clip
+        return not clip.loop and self.steps >= len(clip) * clip.steps_per_frame
+
+    def image(self, direction="right"):
+        return self.clip.image(self.steps, direction)
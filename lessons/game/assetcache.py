@@ -0,0 +1,82 @@
+"""Кэш уже масштабированных картинок на диске.
+
+Каждый запуск AssetLoader распаковывал PNG и масштабировал его до размера
+спрайта. На слабых компьютерах в классе это заметная часть старта.
+
+DiskCache хранит готовые пиксели (RGBA без сжатия) в файлах с именами
+вида <sha1 исходника>_<ширина>x<высота>.rgba. Ключ — содержимое файла,
+а не его имя или дата: поменяли картинку — получили новый ключ, и она
+распакуется заново; вернули старую — снова попадание в кэш.
+
+    cache = DiskCache(".asset_cache")
+    image = cache.load(source_bytes, (50, 50))     # None — промах
+    cache.save(source_bytes, (50, 50), image)
+
+Папку кэша можно удалить в любой момент — она соберётся при следующем запуске.
+"""
+import hashlib
+import os
+import struct
+import threading
+
+import pygame
+
+CACHE_DIR = ".asset_cache"
+MAGIC = b"NCAC"
+HEADER = struct.Struct("<4sHH")  # метка, ширина, высота
+
+
+class DiskCache:
+    """Готовые пиксели картинок по хешу исходника и размеру."""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, source, size):
+        digest = hashlib.sha1(source).hexdigest()
+        suffix = f"{size[0]}x{size[1]}" if size is not None else "orig"
+        return os.path.join(self.directory, f"{digest}_{suffix}.rgba")
+
+    def load(self, source, size):
+        """Картинка из кэша (одно чтение файла) или None."""
+        try:
+            with open(self.path(source, size), "rb") as file:
+                data = file.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        if len(data) < HEADER.size:
+            self.misses += 1
+            return None
+        magic, width, height = HEADER.unpack_from(data)
+        pixels = data[HEADER.size:]
+        if magic != MAGIC or len(pixels) != width * height * 4:
+            self.misses += 1  # Битый файл — перезапишется при save()
+            return None
+        self.hits += 1
+        return pygame.image.frombuffer(pixels, (width, height), "RGBA")
+
+    def save(self, source, size, image):
+        """Сохраняет пиксели картинки. Ошибки записи не мешают игре."""
+        width, height = image.get_size()
+        data = HEADER.pack(MAGIC, width, height) + pygame.image.tobytes(image, "RGBA")
+        path = self.path(source, size)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp, "wb") as file:
+                file.write(data)
+            os.replace(temp, path)  # Другой поток или запуск не увидит недописанный файл
+        except OSError:
+            pass
+
+    def clear(self):
+        """Удаляет все файлы кэша."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".rgba"):
+                os.remove(os.path.join(self.directory, name))
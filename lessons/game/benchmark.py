@@ -0,0 +1,342 @@
+"""Нагрузочные сцены: как циклы игры растут с числом врагов и снарядов.
+
+Каждая сцена — N врагов (ходячие и летающие пополам) и N сюрикенов
+(летят, падают после рикошета или торчат в земле). Сцена крутится
+без окна заданное число кадров, время фаз меряет FrameProfiler.
+
+Режим world (по умолчанию) — настоящий main_full.World с N врагами
+и пулом из N снарядов; меряются сами World.step() и World.draw():
+
+    step      — шаг игры: движение, попадания снарядов (collidelist
+                в Projectile.update), игрок против врагов, подбор снарядов
+    render    — отрисовка кадра
+
+Режим synthetic — отдельная синтетическая сцена из тех же классов со
+своим циклом на CollisionService. Это не код игры: её числа не ловят
+изменения в World.step(), а только показывают пакетные проверки:
+
+    update    — движение врагов, игрока и снарядов (рикошеты, падение)
+    collision — снаряды против врагов, игрок против врагов, подбор снарядов
+    render    — отрисовка кадра
+
+Сбитые и ушедшие враги между кадрами заменяются новыми, застрявшие
+снаряды запускаются снова — состав сцены не меняется от кадра к кадру
+(эта подкачка в замер не входит).
+
+    python benchmark.py                              # World: сцены 10, 100, 1000
+    python benchmark.py --scenes 100 1000 --frames 600
+    python benchmark.py --mode synthetic             # синтетическая сцена: 10 ... 10000
+    python benchmark.py --repeat 5                   # больше прогонов — меньше шума
+    python benchmark.py --save baseline.json         # запомнить результат
+    python benchmark.py --compare baseline.json      # код выхода 1 при регрессии
+"""
+import os
+import sys
+
+# Пустой видеодрайвер SDL — окно не создаётся. Ставим ДО импорта pygame.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+
+import pygame
+
+from profiler import FrameProfiler
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(HERE, "assets")  # Картинки — откуда бы ни запускали бенчмарк
+
+# Классы полной версии игры (main_full.py в корне репозитория)
+sys.path.append(os.path.join(HERE, "..", ".."))
+from main_full import (AssetLoader, Enemy, FrameInput, Player, Projectile, World, GROUND_Y,
+                       PLAYER_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED)
+from collision import CollisionService
+from hud import HudLabel, TextCache
+from lifecycle import EntityList
+from pool import ObjectPool
+
+# Сцены по умолчанию. В World каждый снаряд проверяется по всем врагам
+# (N × N прямоугольников за кадр), поэтому 10000 — только явно: --scenes 10000
+SCENES = {"world": (10, 100, 1000), "synthetic": (10, 100, 1000, 10000)}
+FRAMES = 300
+REPEAT = 3              # Прогонов сцены; берётся самый быстрый — он меньше всех задет фоновыми процессами
+PHASES = {"world": ("step", "render"), "synthetic": ("update", "collision", "render")}
+RELAUNCH_CHANCE = 0.05  # Доля застрявших снарядов, которые снова летят в каждом кадре
+WARMUP = 30             # Кадров в начале сцены, которые не меряются
+TOLERANCE = 1.25        # Во сколько раз среднее может вырасти, не считаясь регрессией
+P99_TOLERANCE = 2.0     # То же для p99 — он шумит сильнее среднего
+NOISE_MS = 0.05         # Меньше этого разница во времени — просто шум
+
+
+class WorldScene:
+    """main_full.World с N врагами и пулом из N снарядов; игрок ходит туда-сюда."""
+
+    def __init__(self, count, seed=0):
+        random.seed(seed)  # World выбирает сторону и тип новых врагов через модуль random
+        self.rng = random.Random(seed)
+        self.count = count
+        assets = AssetLoader(ASSETS_DIR)
+        self.world = world = World(assets)
+        world.player_lives = 10 ** 9  # Сцена не кончается проигрышем
+        # Пул на N снарядов вместо трёх — те же Projectile, тот же compact()
+        world.max_projectiles = count
+        world.projectile_pool = ObjectPool(lambda: Projectile(assets=assets), count)
+        world.projectiles = world.projectile_pool.active
+        self.lives_label = HudLabel(TextCache(), "Жизни: {}", (0, 0, 0), size=30, name="Arial", system=True)
+
+        self.refill()
+        for index, projectile in enumerate(world.projectiles):
+            if index % 3 == 1:
+                projectile.hit_surface = True  # Уже срикошетил и падает
+            elif index % 3 == 2:
+                projectile.rect.bottom = GROUND_Y  # Уже торчит в земле
+                projectile.stuck = True
+        self.frame = 0
+
+    def new_enemy(self):
+        enemy_type = "walker" if self.rng.random() < 0.5 else "flyer"
+        x = self.rng.randint(-40, SCREEN_WIDTH)
+        y = GROUND_Y - 40 if enemy_type == "walker" else self.rng.randint(100, GROUND_Y - 100)
+        return Enemy(x, y, enemy_type)
+
+    def launch(self, projectile):
+        x = self.rng.randint(0, SCREEN_WIDTH - 24)
+        y = self.rng.randint(100, GROUND_Y - 50)
+        target = (self.rng.randint(0, SCREEN_WIDTH), self.rng.randint(0, SCREEN_HEIGHT))
+        projectile.launch(x, y, target)
+
+    def refill(self):
+        """Доливает врагов до N и снова запускает снаряды. Между кадрами, вне замера."""
+        world = self.world
+        for _ in range(self.count - len(world.enemies)):
+            world.enemies.spawn(self.new_enemy())
+        world.enemies.sweep()
+
+        rng = self.rng
+        for projectile in world.projectiles:
+            if projectile.stuck and rng.random() < RELAUNCH_CHANCE:
+                self.launch(projectile)
+        # Подобранные игроком вернулись в пул — берём их обратно
+        pool = world.projectile_pool
+        while pool.free:
+            self.launch(pool.acquire())
+
+    def step(self):
+        self.frame += 1
+        self.world.step(FrameInput(left=self.frame // 120 % 2 == 0, right=self.frame // 120 % 2 == 1))
+
+    def draw(self, surface):
+        self.world.draw(surface, self.lives_label)
+
+
+class Scene:
+    """Синтетическая сцена: N врагов и N снарядов со своим циклом, без World.step()."""
+
+    def __init__(self, count, seed=0):
+        self.rng = random.Random(seed)
+        self.assets = AssetLoader(ASSETS_DIR)
+        self.player = Player(x=SCREEN_WIDTH // 2, y=GROUND_Y - PLAYER_SIZE, assets=self.assets)
+        self.collisions = CollisionService()
+
+        self.enemies = EntityList()
+        for index in range(count):
+            self.enemies.spawn(self.new_enemy("walker" if index % 2 else "flyer"))
+        self.enemies.sweep()
+
+        self.projectiles = [Projectile(assets=self.assets) for _ in range(count)]
+        for index, projectile in enumerate(self.projectiles):
+            self.launch(projectile)
+            if index % 3 == 1:
+                projectile.hit_surface = True  # Уже срикошетил и падает
+            elif index % 3 == 2:
+                projectile.rect.bottom = GROUND_Y  # Уже торчит в земле
+                projectile.stuck = True
+
+        self.frame = 0
+        self.kills = 0
+
+    def new_enemy(self, enemy_type):
+        x = self.rng.randint(-40, SCREEN_WIDTH)
+        y = GROUND_Y - 40 if enemy_type == "walker" else self.rng.randint(100, GROUND_Y - 100)
+        return Enemy(x, y, enemy_type)
+
+    def launch(self, projectile):
+        x = self.rng.randint(0, SCREEN_WIDTH - 24)
+        y = self.rng.randint(100, GROUND_Y - 50)
+        target = (self.rng.randint(0, SCREEN_WIDTH), self.rng.randint(0, SCREEN_HEIGHT))
+        projectile.launch(x, y, target)
+
+    def update(self):
+        """Движение всех сущностей — без проверок попаданий."""
+        self.frame += 1
+        player = self.player
+        player.prev_x = player.x
+        player.prev_y = player.y
+        player.move("right" if self.frame // 120 % 2 else "left")
+        player.apply_gravity()
+
+        for enemy in self.enemies:
+            enemy.prev_pos = enemy.rect.topleft
+            enemy.update(player.x, player.y, GROUND_Y)
+
+        rng = self.rng
+        for projectile in self.projectiles:
+            projectile.prev_pos = projectile.rect.topleft
+            if projectile.stuck:
+                if rng.random() < RELAUNCH_CHANCE:
+                    self.launch(projectile)
+            else:
+                projectile.update(GROUND_Y, ())  # Попадания — в фазе collision
+
+    def collide(self):
+        """Снаряды против врагов, игрок против врагов, подбор снарядов."""
+        enemies = self.enemies.items
+        flying = [p for p in self.projectiles if not p.hit_surface and not p.stuck]
+        self.collisions.sync("enemies", enemies)
+        self.collisions.sync("projectiles", flying)
+
+        for p_index, e_indices in self.collisions.pairs("projectiles", "enemies").items():
+            for e_index in e_indices:
+                enemy = enemies[e_index]
+                if not enemy.dead:
+                    self.enemies.kill(enemy)
+                    self.kills += 1
+                    flying[p_index].ricochet()  # Тот же отскок, что в Projectile.update()
+                    break
+
+        player_rect = self.player.rect
+        for index in self.collisions.hits(player_rect, "enemies"):
+            self.enemies.kill(enemies[index])
+
+        for projectile in self.projectiles:
+            if projectile.is_close_to_player(player_rect):
+                self.launch(projectile)
+
+        # Взамен сбитых и ушедших — новые враги того же типа
+        for enemy in enemies:
+            if not enemy.dead and enemy.is_off_screen():
+                self.enemies.kill(enemy)
+            if enemy.dead:
+                self.enemies.spawn(self.new_enemy(enemy.type))
+        self.enemies.sweep()
+
+    def draw(self, surface):
+        surface.fill(WHITE)
+        pygame.draw.line(surface, RED, (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 3)
+        for projectile in self.projectiles:
+            projectile.draw(surface)
+        for enemy in self.enemies:
+            enemy.draw(surface)
+        self.player.draw(surface)
+
+
+def run_scene(count, frames=FRAMES, seed=0, screen=None, mode="world"):
+    """Крутит сцену из count врагов и count снарядов. Возвращает {фаза: {"mean", "p99"}} в мс."""
+    if screen is None:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if mode == "world":
+        scene = WorldScene(count, seed)
+        sections = (("step", scene.step), ("render", lambda: scene.draw(screen)))
+        between = scene.refill
+    else:
+        scene = Scene(count, seed)
+        sections = (("update", scene.update), ("collision", scene.collide),
+                    ("render", lambda: scene.draw(screen)))
+        between = None
+
+    for _ in range(WARMUP):
+        for _, run in sections:
+            run()
+        if between is not None:
+            between()
+
+    profiler = FrameProfiler(history=frames, trace_limit=1)
+    for _ in range(frames):
+        profiler.begin_frame()
+        for name, run in sections:
+            with profiler.section(name):
+                run()
+        profiler.end_frame()
+        if between is not None:
+            between()
+
+    summary = profiler.summary()
+    return {phase: {"mean": summary[phase]["mean"], "p99": summary[phase]["p99"]}
+            for phase in PHASES[mode] + ("total",)}
+
+
+def best_of(count, frames=FRAMES, seed=0, screen=None, repeat=REPEAT, mode="world"):
+    """Самый быстрый (по среднему total) из repeat прогонов сцены."""
+    runs = [run_scene(count, frames, seed, screen, mode) for _ in range(repeat)]
+    return min(runs, key=lambda stats: stats["total"]["mean"])
+
+
+def compare(results, baseline, tolerance=TOLERANCE, p99_tolerance=P99_TOLERANCE):
+    """Список строк о регрессиях: фазы, ставшие медленнее baseline больше допуска."""
+    problems = []
+    for scene, phases in results.items():
+        for phase, stats in phases.items():
+            old = baseline.get(scene, {}).get(phase)
+            if old is None:
+                continue
+            for key, limit in (("mean", tolerance), ("p99", p99_tolerance)):
+                if stats[key] > old[key] * limit + NOISE_MS:
+                    problems.append(f"сцена {scene}, {phase} {key}: "
+                                    f"{old[key]:.3f} -> {stats[key]:.3f} мс")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочные сцены игры без окна")
+    parser.add_argument("--mode", choices=sorted(SCENES), default="world",
+                        help="world — шаг и отрисовка main_full.World; synthetic — отдельная сцена")
+    parser.add_argument("--scenes", type=int, nargs="+",
+                        help="сколько врагов (и столько же снарядов) в каждой сцене")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="кадров на сцену")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="прогонов каждой сцены")
+    parser.add_argument("--save", metavar="PATH", help="сохранить результат в JSON")
+    parser.add_argument("--compare", metavar="PATH", help="сравнить с сохранённым результатом")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="допустимое замедление среднего (1.25 — на 25%%)")
+    parser.add_argument("--p99-tolerance", type=float, default=P99_TOLERANCE,
+                        help="допустимое замедление p99")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    mode = args.mode
+    scenes = args.scenes or SCENES[mode]
+    results = {}
+    print("Режим world: main_full.World.step() и draw()" if mode == "world" else
+          "Режим synthetic: синтетическая сцена, не World.step()")
+    print(f"{'сцена':>7} {'фаза':>10} {'среднее, мс':>12} {'p99, мс':>9}")
+    for count in scenes:
+        stats = best_of(count, args.frames, args.seed, screen, args.repeat, mode)
+        # Режим в ключе: сравниваются только сцены того же режима
+        results[f"{mode} {count}"] = stats
+        for phase in PHASES[mode] + ("total",):
+            print(f"{count:>7} {phase:>10} {stats[phase]['mean']:>12.3f} {stats[phase]['p99']:>9.3f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+        print(f"Сохранено: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.tolerance, args.p99_tolerance)
+        if problems:
+            print("Регрессии:")
+            for line in problems:
+                print("  " + line)
+            sys.exit(1)
+        print(f"Регрессий нет (допуск x{args.tolerance}, p99 x{args.p99_tolerance})")
+
+
+if __name__ == "__main__":
+    main()
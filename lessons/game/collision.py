@@ -0,0 +1,92 @@
+"""Пакетная проверка столкновений.
+
+Вместо цикла на Python "каждый с каждым" с rect1.colliderect(rect2)
+каждая группа сущностей хранит параллельный список своих прямоугольников,
+а пересечения ищутся встроенным Rect.collidelistall — цикл идёт внутри C.
+Для больших групп вместо полного перебора используется SpatialHash.
+
+Результат — списки индексов, которые игровой цикл применяет разом:
+
+    collisions.sync("enemies", enemies)
+    collisions.sync("projectiles", projectiles)
+    for p_index, e_indices in collisions.pairs("projectiles", "enemies").items():
+        ...
+"""
+from spatial import SpatialHash
+
+# С какого размера группы выгоднее сетка, чем collidelistall
+GRID_THRESHOLD = 64
+
+
+class CollisionGroup:
+    """Сущности и параллельный список их прямоугольников."""
+
+    def __init__(self, cell_size=64):
+        self.items = []
+        self.rects = []
+        self.grid = SpatialHash(cell_size)
+        self.grid_dirty = True
+
+    def sync(self, items):
+        """Запоминает текущий список сущностей. Вызывать после движения."""
+        self.items = items
+        # Rect у сущностей меняется на месте, поэтому список ссылок на них
+        # остаётся верным, пока не поменялся состав группы
+        self.rects = [item.rect for item in items]
+        self.grid_dirty = True
+
+    def indexed_grid(self):
+        """Сетка, в которой вместо сущностей лежат их индексы."""
+        if self.grid_dirty:
+            self.grid.clear()
+            for index, rect in enumerate(self.rects):
+                self.grid.insert(index, rect)
+            self.grid_dirty = False
+        return self.grid
+
+
+class CollisionService:
+    """Группы сущностей по именам и пакетные запросы между ними."""
+
+    def __init__(self, grid_threshold=GRID_THRESHOLD, cell_size=64):
+        self.grid_threshold = grid_threshold
+        self.cell_size = cell_size
+        self.groups = {}
+
+    def group(self, name):
+        group = self.groups.get(name)
+        if group is None:
+            group = self.groups[name] = CollisionGroup(self.cell_size)
+        return group
+
+    def sync(self, name, items):
+        self.group(name).sync(items)
+
+    def hits(self, rect, name):
+        """Индексы сущностей группы name, пересекающихся с rect (один вызов C)."""
+        return rect.collidelistall(self.group(name).rects)
+
+    def pairs(self, name_a, name_b):
+        """Все пересечения двух групп: {индекс в a: [индексы в b]}.
+
+        Для каждого прямоугольника из a — один вызов collidelistall по всей b.
+        Если b большая, кандидаты берутся из сетки.
+        """
+        group_a = self.group(name_a)
+        group_b = self.group(name_b)
+        result = {}
+
+        if len(group_b.rects) >= self.grid_threshold:
+            grid = group_b.indexed_grid()
+            for index, rect in enumerate(group_a.rects):
+                found = grid.query(rect)
+                if found:
+                    result[index] = sorted(found)
+        else:
+            rects_b = group_b.rects
+            for index, rect in enumerate(group_a.rects):
+                found = rect.collidelistall(rects_b)
+                if found:
+                    result[index] = found
+
+        return result
@@ -0,0 +1,70 @@
+"""Отрисовка "грязными прямоугольниками".
+
+Обычный кадр заливает весь экран фоном, рисует всё заново и отдаёт
+окну целиком через pygame.display.flip(), хотя сдвинулись только
+несколько спрайтов 50×50. DirtyRenderer запоминает, где что было
+нарисовано, и каждый кадр:
+
+1. стирает старые места — копирует туда кусочки готового фона;
+2. рисует сущности и запоминает их новые прямоугольники;
+3. отдаёт окну только старые + новые прямоугольники (display.update).
+
+    renderer = DirtyRenderer(screen, background)
+    while running:
+        renderer.begin()
+        renderer.add(player.draw(screen))   # draw() возвращает Rect
+        renderer.present()
+
+Если меняется весь экран (затемнение, смена фона), нужно вызвать
+invalidate() — следующий кадр будет нарисован и показан целиком.
+"""
+import pygame
+
+# Если прямоугольников слишком много, дешевле обновить окно целиком
+MAX_RECTS = 64
+
+
+class DirtyRenderer:
+    """Перерисовывает и показывает только изменившиеся области экрана."""
+
+    def __init__(self, screen, background, max_rects=MAX_RECTS):
+        self.screen = screen
+        self.background = background
+        self.max_rects = max_rects
+        self.previous = []  # Что было нарисовано в прошлом кадре
+        self.current = []   # Что нарисовано в этом кадре
+        self.full = True    # Первый кадр всегда рисуется целиком
+
+    def invalidate(self):
+        """Следующий кадр — полная перерисовка и flip()."""
+        self.full = True
+
+    def set_background(self, background):
+        self.background = background
+        self.invalidate()
+
+    def begin(self):
+        """Стирает прошлый кадр: фон целиком или только под старыми местами."""
+        if self.full:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            screen = self.screen
+            background = self.background
+            for rect in self.previous:
+                screen.blit(background, rect, rect)
+        self.current = []
+
+    def add(self, rect):
+        """Запоминает нарисованную область (None пропускается)."""
+        if rect:
+            self.current.append(rect)
+
+    def present(self):
+        """Показывает кадр: старые и новые области или весь экран."""
+        dirty = self.previous + self.current
+        if self.full or len(dirty) > self.max_rects:
+            pygame.display.flip()
+            self.full = False
+        else:
+            pygame.display.update(dirty)
+        self.previous = self.current
@@ -0,0 +1,560 @@
+"""Маленький ECS (Entity-Component-System) для игры про ниндзя-кота.
+
+Классы Player, Projectile и Enemy скопированы по всем урокам, и у каждого
+свои x/y/rect, которые надо синхронизировать (self.rect.x = self.x ...).
+Здесь сущность — просто номер, а данные лежат колонками (списками)
+по компонентам:
+
+    Position  — x, y
+    Velocity  — vx, vy, gravity
+    Collider  — w, h (Rect собирается только для проверки столкновений)
+    Sprite    — image
+    AI        — kind, speed, phase
+
+Системы — обычные функции, которые одним циклом проходят по всем
+сущностям с нужным набором компонентов (ecs.query(POSITION | VELOCITY)).
+Варианты игры из уроков — это разные настройки одного движка (PRESETS):
+
+    python ecs.py --preset game               # как lessons/game/game.py
+    python ecs.py --preset full               # как main_full.py: ходячие и летающие
+    python ecs.py --preset swarm --frames 6000  # стресс-тест: сотни врагов
+"""
+import os
+import random
+from collections import namedtuple
+
+import pygame
+
+from enemy import ANIMATION_PHASES
+from motion import PATTERNS, aim
+from surfaces import to_display_format
+
+# Биты компонентов — у каждой сущности маска из этих битов
+POSITION = 1
+VELOCITY = 2
+COLLIDER = 4
+SPRITE = 8
+AI = 16
+# Метки: кто это (нужны системам, данных у них нет)
+PLAYER = 32
+ENEMY = 64
+PROJECTILE = 128
+
+# Компоненты при создании сущности: ecs.create(Position(10, 20), Velocity(...))
+Position = namedtuple("Position", "x y")
+Velocity = namedtuple("Velocity", "vx vy gravity", defaults=(0, 0, 0))
+Collider = namedtuple("Collider", "w h")
+Sprite = namedtuple("Sprite", "image")
+Ai = namedtuple("Ai", "kind speed", defaults=(0,))
+
+# Смещения летающего врага по фазе (колонка phase у AI врага, см. motion.py)
+FLYER_WAVE = PATTERNS["wave"].dy
+
+# Состояния снаряда (колонка phase у AI снаряда)
+FLYING = 0
+FALLING = 1
+STUCK = 2
+
+# Что делает снаряд, попавший во врага (настройка hit_rule)
+HIT_RESET = "reset"        # game.py: бьёт любой активный снаряд, даже застрявший, и исчезает
+HIT_RICOCHET = "ricochet"  # main_full.py: бьёт только летящий, отскакивает и падает
+
+# Пустой прямоугольник ни с чем не пересекается — им "выключают" убитых врагов
+NO_RECT = pygame.Rect(0, 0, 0, 0)
+
+# Настройки вариантов игры
+PRESETS = {
+    # lessons/game/game.py: один тип врага, двойной прыжок, 3 снаряда 12×12.
+    # Скорость по x после первого шага падения там обнуляется (трение 0)
+    "game": dict(
+        enemy_kinds=("walker",), walker_speed=1, flyer_speed=0, enemy_size=50,
+        spawn_delay=180, max_jumps=2, lives=1, max_projectiles=3, projectile_size=12,
+        hit_rule=HIT_RESET, projectile_friction=0,
+    ),
+    # main_full.py: ходячие и летающие враги, один прыжок, 3 жизни
+    "full": dict(
+        enemy_kinds=("walker", "flyer"), walker_speed=2, flyer_speed=1.5, enemy_size=40,
+        spawn_delay=180, max_jumps=1, lives=3, max_projectiles=3, projectile_size=24,
+        hit_rule=HIT_RICOCHET, projectile_friction=0.92,
+    ),
+    # Стресс-тест: враги каждые 2 шага, шквал снарядов
+    "swarm": dict(
+        enemy_kinds=("walker", "flyer"), walker_speed=2, flyer_speed=1.5, enemy_size=40,
+        spawn_delay=2, max_jumps=2, lives=10 ** 9, max_projectiles=200, projectile_size=12,
+        hit_rule=HIT_RICOCHET, projectile_friction=0.92,
+    ),
+}
+
+
+class Registry:
+    """Хранилище сущностей: колонки компонентов и списки запросов по маске.
+
+    Список запроса собирается один раз, а дальше create() дописывает
+    в него новую сущность. Удаление — как в lifecycle.py: destroy() только
+    помечает сущность, а sweep() раз в шаг убирает помеченных из списков
+    одним проходом. Ни полного прохода по всем номерам, ни list.remove()
+    на каждое убийство.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.mask = [0] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+        self.dead = []  # (номер, маска) — уйдут из запросов в sweep()
+
+        # Колонки компонентов
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.gravity = [0.0] * capacity
+        self.w = [0] * capacity
+        self.h = [0] * capacity
+        self.rect = [pygame.Rect(0, 0, 0, 0) for _ in range(capacity)]
+        self.image = [None] * capacity
+        self.kind = [None] * capacity
+        self.speed = [0.0] * capacity
+        self.phase = [0] * capacity
+
+        self.queries = {}  # маска -> список живых сущностей с этими битами
+
+    def create(self, *components, tags=0):
+        """Создаёт сущность из компонентов. Возвращает её номер (или None, если мест нет)."""
+        if not self.free:
+            return None
+        entity = self.free.pop()
+        mask = tags
+        for component in components:
+            if isinstance(component, Position):
+                mask |= POSITION
+                self.x[entity] = component.x
+                self.y[entity] = component.y
+            elif isinstance(component, Velocity):
+                mask |= VELOCITY
+                self.vx[entity] = component.vx
+                self.vy[entity] = component.vy
+                self.gravity[entity] = component.gravity
+            elif isinstance(component, Collider):
+                mask |= COLLIDER
+                self.w[entity] = component.w
+                self.h[entity] = component.h
+                self.rect[entity].size = (component.w, component.h)
+            elif isinstance(component, Sprite):
+                mask |= SPRITE
+                self.image[entity] = component.image
+            elif isinstance(component, Ai):
+                mask |= AI
+                self.kind[entity] = component.kind
+                self.speed[entity] = component.speed
+                self.phase[entity] = 0
+        self.mask[entity] = mask
+        for query, members in self.queries.items():
+            if mask & query == query:
+                members.append(entity)
+        return entity
+
+    def destroy(self, entity):
+        """Помечает сущность удалённой. Из запросов она уйдёт в sweep().
+
+        Повторный вызов безопасен. До sweep() сущность остаётся в списках
+        запросов — системы, которые идут после удалений, проверяют alive().
+        """
+        mask = self.mask[entity]
+        if mask:
+            self.mask[entity] = 0
+            self.dead.append((entity, mask))
+
+    def alive(self, entity):
+        return self.mask[entity] != 0
+
+    def sweep(self):
+        """Убирает удалённых из запросов и освобождает их номера. Раз в шаг.
+
+        Сжимается только список запроса, в который входил кто-то из
+        удалённых, — одним проходом с сохранением порядка.
+        """
+        if not self.dead:
+            return
+        mask = self.mask
+        for query, members in self.queries.items():
+            if any(old & query == query for _, old in self.dead):
+                members[:] = [e for e in members if mask[e]]
+        self.free.extend(entity for entity, _ in self.dead)
+        self.dead.clear()
+
+    def query(self, mask):
+        """Все живые сущности, у которых есть все биты mask (в порядке создания).
+
+        Возвращается сам список запроса — не менять его снаружи.
+        """
+        found = self.queries.get(mask)
+        if found is None:
+            found = [e for e, m in enumerate(self.mask) if m & mask == mask]
+            self.queries[mask] = found
+        return found
+
+    def sync_rects(self, entities):
+        """Переносит x, y в Rect — только для тех, кого будем проверять.
+
+        У удалённых в этом шаге — NO_RECT: в них уже никто не попадёт.
+        """
+        x, y, rect, mask = self.x, self.y, self.rect, self.mask
+        rects = []
+        for e in entities:
+            if not mask[e]:
+                rects.append(NO_RECT)
+                continue
+            r = rect[e]
+            r.x = x[e]
+            r.y = y[e]
+            rects.append(r)
+        return rects
+
+
+# ===== Системы =====
+
+def ai_system(ecs, target_x, target_y, ground_y):
+    """Враги идут к цели; летающие качаются по синусоиде над ней.
+
+    Двигает врагов сам, уже после игрока — как Enemy.position_update()
+    в game.py: направление берётся по новой позиции цели.
+    """
+    x, y, h = ecs.x, ecs.y, ecs.h
+    kind, speed, phase = ecs.kind, ecs.speed, ecs.phase
+    wave = FLYER_WAVE
+    for e in ecs.query(ENEMY | AI | POSITION):
+        x[e] += speed[e] if x[e] < target_x else -speed[e]
+        if kind[e] == "flyer":
+            phase[e] = (phase[e] + 1) % len(wave)
+            fly_y = target_y + wave[phase[e]] - 20
+            y[e] = max(50, min(fly_y, ground_y - h[e]))
+
+
+def physics_system(ecs, ground_y):
+    """Скорость и гравитация; тела с гравитацией не проваливаются под землю."""
+    x, y, vx, vy, gravity, h = ecs.x, ecs.y, ecs.vx, ecs.vy, ecs.gravity, ecs.h
+    for e in ecs.query(POSITION | VELOCITY):
+        g = gravity[e]
+        if g:
+            vy[e] += g
+        x[e] += vx[e]
+        y[e] += vy[e]
+        if g and y[e] + h[e] >= ground_y:
+            y[e] = ground_y - h[e]
+            vy[e] = 0
+
+
+def projectile_system(ecs, screen_width, ground_y, friction=0.92):
+    """Рикошет от стен и потолка, трение при падении, застревание в земле.
+
+    Как Projectile.update() в game.py и main_full.py: координаты снаряда —
+    целые пиксели его Rect, а после удара о стену он в том же шаге
+    делает первый шаг падения.
+    """
+    x, y, vx, vy, gravity = ecs.x, ecs.y, ecs.vx, ecs.vy, ecs.gravity
+    w, h, phase, rect = ecs.w, ecs.h, ecs.phase, ecs.rect
+    for e in ecs.query(PROJECTILE | AI):
+        state = phase[e]
+        if state == STUCK:
+            continue
+        # Округление до пикселя — тем же Rect, что и в игре
+        r = rect[e]
+        r.x = x[e]
+        r.y = y[e]
+        if state == FLYING:
+            if r.x <= 0 or r.x + w[e] >= screen_width:
+                vx[e] *= -0.4
+                state = FALLING
+            if r.y <= 0:
+                vy[e] *= -0.4
+                state = FALLING
+            if state == FALLING and r.y + h[e] < ground_y:
+                gravity[e] = 0.6
+                vy[e] += gravity[e]
+                r.x += vx[e]
+                r.y += vy[e]
+        if state == FALLING:
+            vx[e] = vx[e] * friction if abs(vx[e]) > 0.1 else 0
+        if r.y + h[e] >= ground_y:
+            r.y = ground_y - h[e]
+            vx[e] = vy[e] = gravity[e] = 0
+            state = STUCK
+        x[e] = r.x
+        y[e] = r.y
+        phase[e] = state
+
+
+def hit_system(ecs, rule=HIT_RICOCHET):
+    """Снаряды против врагов. Каждый снаряд убивает не больше одного врага.
+
+    rule — HIT_RESET (game.py: бьёт любой снаряд, даже застрявший,
+    и после попадания исчезает) или HIT_RICOCHET (main_full.py: бьёт
+    только летящий и отскакивает). Возвращает число убитых.
+    """
+    enemies = ecs.query(ENEMY | COLLIDER)
+    if not enemies:
+        return 0
+    mask, phase = ecs.mask, ecs.phase
+    if rule == HIT_RESET:
+        shots = [e for e in ecs.query(PROJECTILE | COLLIDER) if mask[e]]
+    else:
+        shots = [e for e in ecs.query(PROJECTILE | COLLIDER) if mask[e] and phase[e] == FLYING]
+    if not shots:
+        return 0
+
+    enemy_rects = ecs.sync_rects(enemies)
+    kills = 0
+    for p, rect in zip(shots, ecs.sync_rects(shots)):
+        index = rect.collidelist(enemy_rects)
+        if index == -1:
+            continue
+        ecs.destroy(enemies[index])
+        enemy_rects[index] = NO_RECT  # В убитого больше никто не попадёт
+        kills += 1
+        if rule == HIT_RESET:
+            ecs.destroy(p)
+            continue
+        # Рикошет от врага: по оси с большей скоростью
+        if abs(ecs.vx[p]) > abs(ecs.vy[p]):
+            ecs.vx[p] *= -0.4
+        else:
+            ecs.vy[p] *= -0.4
+        phase[p] = FALLING
+        ecs.gravity[p] = 0.6
+    return kills
+
+
+def cleanup_system(ecs, screen_width, margin=50):
+    """Удаляет врагов, ушедших далеко за экран."""
+    x, w = ecs.x, ecs.w
+    for e in ecs.query(ENEMY | POSITION):
+        if x[e] + w[e] < -margin or x[e] > screen_width + margin:
+            ecs.destroy(e)
+
+
+def render_system(ecs, surface):
+    """Все спрайты одним вызовом blits()."""
+    x, y, image = ecs.x, ecs.y, ecs.image
+    surface.blits([(image[e], (x[e], y[e])) for e in ecs.query(SPRITE | POSITION)], doreturn=False)
+
+
+# ===== Игра на ECS =====
+
+def make_box(width, height, color):
+    image = pygame.Surface((width, height))
+    image.fill(color)
+    return to_display_format(image)
+
+
+class EcsGame:
+    """Игра про ниндзя-кота на ECS. Тот же ввод, что у World (FrameInput)."""
+
+    def __init__(self, preset="game", seed=0, width=800, height=600, capacity=4096):
+        self.config = PRESETS[preset] if isinstance(preset, str) else preset
+        self.width = width
+        self.height = height
+        self.ground_y = height - 100
+        self.rng = random.Random(seed)
+        self.capacity = capacity
+
+        size = self.config["enemy_size"]
+        projectile_size = self.config["projectile_size"]
+        self.images = {
+            "player": make_box(50, 50, (100, 100, 100)),
+            "walker": make_box(size, size, (200, 0, 0)),
+            "flyer": make_box(size, size, (100, 100, 255)),
+            "projectile": make_box(projectile_size, projectile_size, (50, 50, 50)),
+        }
+        self.background = make_box(width, height, (255, 255, 255))
+        pygame.draw.line(self.background, (255, 0, 0), (0, self.ground_y), (width, self.ground_y), 3)
+        self.running = True
+        self.frame = 0
+        self.kills = 0   # Счётчики на всю сессию, reset() их не трогает
+        self.deaths = 0
+        self.reset()
+
+    def reset(self):
+        self.ecs = Registry(self.capacity)
+        self.player = self.ecs.create(
+            Position(100, self.ground_y - 50), Velocity(gravity=1), Collider(50, 50),
+            Sprite(self.images["player"]), tags=PLAYER,
+        )
+        self.jumps = 0
+        self.lives = self.config["lives"]
+        self.spawn_timer = 0
+        self.game_over = False
+
+    def spawn_enemy(self):
+        config = self.config
+        size = config["enemy_size"]
+        # Сторона — тем же вызовом, что в game.py: с одним типом врага
+        # последовательность появлений совпадает с World при том же зерне
+        side = self.rng.choice(["left", "right"])
+        x = -size if side == "left" else self.width + size
+        kinds = config["enemy_kinds"]
+        kind = kinds[0] if len(kinds) == 1 else self.rng.choice(kinds)
+        if kind == "walker":
+            y = self.ground_y - size
+            speed = config["walker_speed"]
+        else:
+            y = self.rng.randint(100, self.ground_y - 100)
+            speed = config["flyer_speed"]
+        # World берёт из генератора ещё и начальный шаг анимации врага.
+        # Здесь анимации нет, но вызов тот же — иначе следующие появления разойдутся
+        self.rng.randrange(ANIMATION_PHASES)
+        self.ecs.create(
+            Position(x, y), Collider(size, size),
+            Sprite(self.images[kind]), Ai(kind, speed), tags=ENEMY,
+        )
+
+    def shoot(self, target):
+        ecs = self.ecs
+        if len(ecs.query(PROJECTILE)) >= self.config["max_projectiles"]:
+            return
+        px = ecs.x[self.player] + 25
+        py = ecs.y[self.player] + 25
+        vx, vy = aim(target[0] - px, target[1] - py, 10)
+        size = self.config["projectile_size"]
+        ecs.create(
+            Position(px, py), Velocity(vx, vy), Collider(size, size),
+            Sprite(self.images["projectile"]), Ai("projectile"), tags=PROJECTILE,
+        )
+
+    def step(self, inputs):
+        """Один шаг симуляции — в том же порядке, что World.step() в game.py."""
+        self.frame += 1
+        if inputs.quit:
+            self.running = False
+        restarted = False
+        if self.game_over:
+            if not inputs.restart:
+                return
+            self.reset()
+            restarted = True
+
+        ecs = self.ecs
+        player = self.player
+        config = self.config
+
+        # Ввод игрока — прямо в колонки скорости
+        if ecs.y[player] + 50 >= self.ground_y:
+            self.jumps = 0
+        if inputs.jump and not restarted and self.jumps < config["max_jumps"]:
+            ecs.vy[player] = -15
+            self.jumps += 1
+        if inputs.shoot is not None:
+            self.shoot(inputs.shoot)
+        ecs.vx[player] = (inputs.right - inputs.left) * 5
+
+        physics_system(ecs, self.ground_y)
+        ecs.x[player] = max(0, min(ecs.x[player], self.width - 50))
+        projectile_system(ecs, self.width, self.ground_y, config["projectile_friction"])
+
+        # Подбор застрявших снарядов
+        player_rect = ecs.sync_rects([player])[0]
+        pickup_zone = player_rect.inflate(40, 40)
+        phase = ecs.phase
+        for p in ecs.query(PROJECTILE | AI):
+            if phase[p] == STUCK and pickup_zone.colliderect(ecs.sync_rects([p])[0]):
+                ecs.destroy(p)
+
+        ai_system(ecs, ecs.x[player], ecs.y[player], self.ground_y)
+
+        # Игрок против врагов. Последняя жизнь — игра окончена, а враг
+        # остаётся до рестарта (как в game.py)
+        enemies = ecs.query(ENEMY | COLLIDER)
+        touched = player_rect.collidelistall(ecs.sync_rects(enemies))
+        if touched:
+            self.lives -= len(touched)
+            if self.lives <= 0:
+                self.game_over = True
+                self.deaths += 1
+            else:
+                for index in touched:
+                    ecs.destroy(enemies[index])
+
+        self.kills += hit_system(ecs, config["hit_rule"])
+        cleanup_system(ecs, self.width)
+        ecs.sweep()
+
+        # Новый враг появляется после sweep() и в этом шаге ещё не ходит —
+        # как EntityList.spawn() в game.py
+        self.spawn_timer += 1
+        if self.spawn_timer >= config["spawn_delay"]:
+            self.spawn_timer = 0
+            self.spawn_enemy()
+
+    def draw(self, surface):
+        surface.blit(self.background, (0, 0))
+        render_system(self.ecs, surface)
+
+
+def bot_input(game, rng):
+    """Тот же бот, что в headless.py: убегает от ближайшего врага и стреляет в него."""
+    from game import FrameInput
+
+    if game.game_over:
+        return FrameInput(restart=True)
+
+    ecs = game.ecs
+    inputs = FrameInput()
+    player_x = ecs.x[game.player] + 25
+    enemies = ecs.query(ENEMY | POSITION)
+    if enemies:
+        target = min(enemies, key=lambda e: abs(ecs.x[e] + ecs.w[e] / 2 - player_x))
+        target_x = ecs.x[target] + ecs.w[target] / 2
+        if target_x > player_x:
+            inputs.left = True
+        else:
+            inputs.right = True
+        if rng.random() < 0.05:
+            inputs.shoot = (int(target_x), int(ecs.y[target] + ecs.h[target] / 2))
+        if abs(target_x - player_x) < 120 and rng.random() < 0.2:
+            inputs.jump = True
+    else:
+        # Врагов нет — собираем снаряды с земли
+        inputs.left = rng.random() < 0.3
+        inputs.right = not inputs.left and rng.random() < 0.3
+    return inputs
+
+
+def run(frames, preset="game", seed=0, draw=False):
+    """Крутит EcsGame frames шагов с ботом, как headless.run().
+
+    Возвращает (игра, наибольшее число врагов одновременно).
+    """
+    screen = pygame.display.set_mode((800, 600))
+    game = EcsGame(preset, seed=seed)
+    rng = random.Random(seed)
+    most = 0
+    for _ in range(frames):
+        game.step(bot_input(game, rng))
+        most = max(most, len(game.ecs.query(ENEMY)))
+        if draw:
+            game.draw(screen)
+    return game, most
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Игра на ECS без окна")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="game")
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--draw", action="store_true", help="рисовать кадры (в невидимый экран)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    game, most = run(args.frames, args.preset, args.seed, args.draw)
+    elapsed = time.perf_counter() - start
+
+    print(f"Шагов: {args.frames} за {elapsed:.2f} с ({elapsed / args.frames * 1000:.3f} мс на шаг)")
+    print(f"Убито врагов: {game.kills}, проигрышей: {game.deaths}, врагов одновременно до {most}")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    main()
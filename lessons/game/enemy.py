@@ -1,13 +1,10 @@
 import pygame
 
-pygame.init()
+from animation import Animator
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Игра про нинзя кота")
-
 WHITE = (255, 255, 255)
 BLUE = (0, 0 ,255)
 RED = (255, 0 , 0)
@@ -17,13 +14,19 @@ ENEMY_WIDTH = 50
 ENEMY_SPEED = 1 # Нужно добавить в первую очередь
 SPAWN_DELAY = 180 # Спавн задержка между появлением противника
 # 180 тиков поделить на fps = 3 секунды.
+ANIMATION_PHASES = 48 # Шагов в цикле анимации призрака: 6 кадров по 8 шагов
 class Enemy:
-    def __init__(self, x, y):
+    def __init__(self, x, y, clip=None, phase=0):
         self.x = x
         self.y = y
         self.width = ENEMY_WIDTH
         self.height = ENEMY_HEIGHT
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.prev_x = x  # Позиция на прошлом шаге — для плавной отрисовки
+        self.dead = False  # Помечен на удаление (см. lifecycle.py)
+        # Анимация из листа спрайтов (animation.py); без неё — синий квадрат.
+        # phase — начальный шаг анимации, чтобы враги не двигались в унисон
+        self.animator = Animator(clip, steps=phase) if clip is not None else None
 
         if x >= SCREEN_WIDTH //2:
             self.direction = -1
@@ -50,14 +53,27 @@ class Enemy:
         
         self.x += self.direction * ENEMY_SPEED
         self.rect.topleft = (self.x, self.y)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, BLUE, self.rect)
+        if self.animator is not None:
+            self.animator.update()
+
+    def draw(self, screen, alpha=1.0):
+        if self.animator is not None:
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            image = self.animator.image("left" if self.direction < 0 else "right")
+            return screen.blit(image, (x, self.y))
+        if alpha == 1.0:
+            return pygame.draw.rect(screen, BLUE, self.rect)
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        return pygame.draw.rect(screen, BLUE, (x, self.y, self.width, self.height))
 
     def is_off_screen(self):
         return self.rect.right < -50 or self.rect.left > SCREEN_WIDTH + 50
 
 def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Игра про нинзя кота")
+
     enemy = Enemy(x=0, y=SCREEN_HEIGHT - ENEMY_HEIGHT - 100)
 
     clock = pygame.time.Clock()
@@ -0,0 +1,210 @@
+"""Поле направлений (flow field) для толпы врагов.
+
+Enemy.position_update() знает только "игрок левее или правее" и упирается
+в первую же стену. A* для каждого врага отдельно — сотни поисков за кадр.
+
+Здесь один поиск в ширину (BFS) идёт от клетки игрока по всем свободным
+клеткам карты. Каждая клетка запоминает, в какую соседнюю идти, чтобы
+приблизиться к игроку. Враг просто смотрит направление в своей клетке —
+один индекс в списке, сколько бы врагов ни было.
+
+Поле пересчитывается, только когда игрок переходит в другую клетку,
+и только в окне из radius столбцов вокруг него: врагов дальше всё равно
+не обновляют (см. tilemap.py).
+
+    field = FlowField(tilemap)
+    field.update(player_x, player_y)          # пересчёт, если игрок сменил клетку
+    dx, dy = field.steer(enemy_x, enemy_y)    # к центру следующей клетки
+
+Проверка скорости:
+    python flowfield.py --enemies 500
+"""
+import math
+from collections import deque
+
+RADIUS = 40  # Столбцов поля в каждую сторону от игрока (два экрана)
+
+# Соседи клетки: (dx, dy). Сначала прямые — так BFS предпочитает их диагоналям
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1))
+DIAGONAL = 1 / math.sqrt(2)
+NO_DIRECTION = (0.0, 0.0)
+
+
+class FlowField:
+    """Направления к цели для каждой свободной клетки окна карты.
+
+    Окно хранится с рамкой в одну клетку (stride = width + 2): соседи
+    клетки — постоянные сдвиги индекса, и BFS не проверяет границы.
+    """
+
+    def __init__(self, tilemap, radius=RADIUS):
+        self.map = tilemap
+        self.radius = radius
+        self.target = None   # (столбец, строка) клетки, от которой считано поле
+        self.left = 0        # Первый столбец окна
+        self.width = 0
+        self.stride = 2      # Длина строки окна вместе с рамкой
+        self.directions = []  # Для каждой клетки окна: (dx, dy) к цели или NO_DIRECTION
+        self.steps = []       # То же в клетках: (-1..1, -1..1) — какая соседняя следующая
+        self.distance = []    # Шагов до цели (-1 — не дойти или рамка)
+        self.recomputes = 0
+
+    def update(self, x, y):
+        """Пересчитывает поле, если точка (x, y) в другой клетке. Возвращает True при пересчёте."""
+        ts = self.map.tile_size
+        cell = (int(x // ts), int(y // ts))
+        if cell == self.target:
+            return False
+        self.compute(*cell)
+        return True
+
+    def compute(self, target_col, target_row):
+        """BFS от клетки цели по свободным клеткам окна."""
+        tilemap = self.map
+        height = tilemap.height
+        left = max(0, target_col - self.radius)
+        right = min(tilemap.width, target_col + self.radius + 1)
+        width = right - left
+        stride = width + 2
+
+        size = stride * (height + 2)
+        distance = [-1] * size
+        directions = [NO_DIRECTION] * size
+        steps = [(0, 0)] * size
+        self.target = (target_col, target_row)
+        self.left = left
+        self.width = width
+        self.stride = stride
+        self.distance = distance
+        self.directions = directions
+        self.steps = steps
+        self.recomputes += 1
+
+        # Стены окна с рамкой из стен; closed — стены плюс уже найденные клетки
+        walls = bytearray(b"\x01") * size
+        for row, line in enumerate(tilemap.solid):
+            offset = (row + 1) * stride + 1
+            walls[offset:offset + width] = line[left:right]
+        closed = bytearray(walls)
+
+        target_row = max(0, min(target_row, height - 1))
+        if not 0 <= target_col - left < width:
+            return  # Цель за картой — поле пустое
+        start = (target_row + 1) * stride + (target_col - left) + 1
+        if walls[start]:
+            return  # Цель в стене
+        distance[start] = 0
+        closed[start] = 1
+        queue = deque([start])
+
+        # Сдвиги индекса соседей и что записать соседу: из него идти сюда,
+        # обратно тому, как мы к нему пришли. Прямые — первыми
+        straight = [(dx + dy * stride, (float(-dx), float(-dy)), (-dx, -dy))
+                    for dx, dy in NEIGHBOURS if not (dx and dy)]
+        diagonal = [(dx + dy * stride, dx, dy * stride, (-dx * DIAGONAL, -dy * DIAGONAL), (-dx, -dy))
+                    for dx, dy in NEIGHBOURS if dx and dy]
+
+        while queue:
+            index = queue.popleft()
+            next_distance = distance[index] + 1
+            for offset, direction, step in straight:
+                near = index + offset
+                if closed[near]:
+                    continue
+                closed[near] = 1
+                distance[near] = next_distance
+                directions[near] = direction
+                steps[near] = step
+                queue.append(near)
+            for offset, side_x, side_y, direction, step in diagonal:
+                near = index + offset
+                if closed[near] or walls[index + side_x] or walls[index + side_y]:
+                    continue  # Занято или срезали бы угол стены
+                closed[near] = 1
+                distance[near] = next_distance
+                directions[near] = direction
+                steps[near] = step
+                queue.append(near)
+
+    def cell_index(self, x, y):
+        ts = self.map.tile_size
+        col = int(x // ts) - self.left
+        row = int(y // ts)
+        if 0 <= col < self.width and 0 <= row < self.map.height:
+            return (row + 1) * self.stride + col + 1
+        return -1
+
+    def direction_at(self, x, y):
+        """Единичный вектор к цели из точки (x, y); (0, 0) — цель здесь или пути нет."""
+        index = self.cell_index(x, y)
+        return self.directions[index] if index >= 0 else NO_DIRECTION
+
+    def steer(self, x, y):
+        """Единичный вектор из (x, y) к центру следующей клетки пути.
+
+        Лучше direction_at() для тел размером с клетку: тело выравнивается
+        по проходу и не цепляется краем за угол стены.
+        """
+        index = self.cell_index(x, y)
+        if index < 0 or self.distance[index] <= 0:
+            return NO_DIRECTION  # Вне окна, пути нет или уже в клетке цели
+        step_x, step_y = self.steps[index]
+        ts = self.map.tile_size
+        goal_x = (int(x // ts) + step_x + 0.5) * ts
+        goal_y = (int(y // ts) + step_y + 0.5) * ts
+        dx = goal_x - x
+        dy = goal_y - y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return NO_DIRECTION
+        return dx / length, dy / length
+
+    def distance_at(self, x, y):
+        """Шагов (клеток) до цели; -1 — пути нет или точка вне окна."""
+        index = self.cell_index(x, y)
+        return self.distance[index] if index >= 0 else -1
+
+
+def main():
+    import argparse
+    import os
+    import random
+    import time
+
+    from tilemap import LEVELS_DIR, TileMap
+
+    parser = argparse.ArgumentParser(description="Скорость поля направлений")
+    parser.add_argument("level", nargs="?", default=os.path.join(LEVELS_DIR, "level1.txt"))
+    parser.add_argument("--enemies", type=int, default=500)
+    parser.add_argument("--moves", type=int, default=200, help="сколько раз игрок меняет клетку")
+    args = parser.parse_args()
+
+    tilemap = TileMap.load(args.level)
+    field = FlowField(tilemap)
+    rng = random.Random(0)
+    ts = tilemap.tile_size
+
+    compute_time = sample_time = 0.0
+    reachable = 0
+    for move in range(args.moves):
+        player_x = (10 + move % (tilemap.width - 20)) * ts + ts / 2
+        player_y = 5 * ts
+        start = time.perf_counter()
+        field.update(player_x, player_y)
+        compute_time += time.perf_counter() - start
+
+        enemies = [(player_x + rng.uniform(-800, 800), rng.uniform(0, tilemap.pixel_height))
+                   for _ in range(args.enemies)]
+        start = time.perf_counter()
+        for x, y in enemies:
+            if field.direction_at(x, y) != NO_DIRECTION:
+                reachable += 1
+        sample_time += time.perf_counter() - start
+
+    print(f"Поле {field.width}×{tilemap.height} клеток: пересчёт {compute_time / args.moves * 1000:.3f} мс")
+    print(f"{args.enemies} врагов: направление за {sample_time / args.moves * 1000:.3f} мс "
+          f"(путь есть у {reachable / args.moves / args.enemies:.0%})")
+
+
+if __name__ == "__main__":
+    main()
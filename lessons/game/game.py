@@ -1,15 +1,34 @@
+import argparse
 import pygame
 import random
-from enemy import Enemy, ENEMY_HEIGHT, ENEMY_WIDTH, SPAWN_DELAY
+from enemy import Enemy, ENEMY_HEIGHT, ENEMY_WIDTH, SPAWN_DELAY, ANIMATION_PHASES
+from hud import TextCache, HudLabel
+from collision import CollisionService
+from pool import ObjectPool
+from timestep import FixedTimestep, lerp
+from dirty import DirtyRenderer
+from surfaces import FormatAudit, to_display_format
+from screens import LoadingScreen, OverlayScreen, PLAYING, PAUSED, GAME_OVER
+from replay import InputRecorder
+from lifecycle import EntityList
+from loading import AssetManager, decode
+from assetcache import DiskCache
+from animation import Animator, Clip, slice_sheet
+from motion import aim
+import particles
+from particles import ParticleSystem, HIT, RICOCHET, LANDING
 
 DEBUG = False # Изменять только самостоятельно
+DIRTY_RECTS = True # Перерисовывать только изменившиеся области экрана
+ASSET_CACHE = True # Хранить уменьшенные картинки на диске (папка .asset_cache)
+PARTICLES = True # Искры и пыль от снарядов (нужен NumPy, без него — выключено)
 
 # Константы экрана
 pygame.init()
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Основная игра")
+FPS = 60  # Шагов симуляции в секунду
+RENDER_FPS = 144  # Кадров отрисовки в секунду (не больше)
 
 # Константы игрока
 PLAYER_SIZE = 50
@@ -29,31 +48,101 @@ MAX_COUNT_PROJECTILES = 3
 PICUP_DISTANCE = 40
 
 class AssetLoader:
-    def __init__(self):
+    # Картинки игры: имя -> (файл, размер)
+    SPRITES = {
+        "player_idle": ("assets/idle.png", (PLAYER_SIZE, PLAYER_SIZE)),
+        "player_walk": ("assets/walk.png", (PLAYER_SIZE, PLAYER_SIZE)),
+        "player_jump": ("assets/jump.png", (PLAYER_SIZE, PLAYER_SIZE)),
+        "projectile": ("assets/projectile.png", (24, 24)),
+    }
+    # Листы спрайтов: имя -> (файл, столбцов, строк, размер кадра, шагов на кадр)
+    SHEETS = {
+        "enemy_ghost": ("assets/спрайт-no-bg-preview (carve.photos).png", 3, 2,
+                        (ENEMY_WIDTH, ENEMY_HEIGHT), 8),
+    }
+
+    def __init__(self, background=False):
+        """background=True — картинки грузятся в фоне, готовность проверять через update()"""
         self.sprites = {}
+        self.atlas = {}  # (имя, направление) -> готовый спрайт
+        self.clips = {}  # имя -> Clip: кадры анимации в обе стороны
+        self.manager = AssetManager(cache=DiskCache() if ASSET_CACHE else None)
         self.load_all()
+        if not background:
+            self.manager.wait()
+            self.finish()
+
+    @property
+    def ready(self):
+        return bool(self.atlas)
+
+    @property
+    def progress(self):
+        return self.manager.progress
 
     def load_image(self, path, width, height):
-        """Загружает изображение или возвращает заглушку"""
-        try:
-            image = pygame.image.load(path).convert_alpha()
-        except (FileNotFoundError, pygame.error):
-            print(f"Файл не найден: {path}. Создаём заглушку.")
-            image = pygame.Surface((width, height), pygame.SRCALPHA)
-            pygame.draw.rect(image, (100, 100, 100), (5, 5, width - 10, height - 10), border_radius=8)
-            pygame.draw.circle(image, (255, 255, 255), (15, 15), 5)  # Глазик
-        return pygame.transform.scale(image, (width, height))
+        """Загружает изображение сразу, в главном потоке (или возвращает заглушку)"""
+        return self.manager.finish(decode(path, (width, height)), path, (width, height))
 
     def load_all(self):
-        """Загружаем все спрайты для игры"""
-        self.sprites["player_idle"] = self.load_image("assets/idle.png", PLAYER_SIZE, PLAYER_SIZE)
-        self.sprites["player_walk"] = self.load_image("assets/walk.png", PLAYER_SIZE, PLAYER_SIZE)
-        self.sprites["player_jump"] = self.load_image("assets/jump.png", PLAYER_SIZE, PLAYER_SIZE)
-        self.sprites["projectile"] = self.load_image("assets/projectile.png", 24, 24)
-
-    def get(self, name):
-        """Возвращает спрайт по имени"""
-        return self.sprites.get(name, None)
+        """Ставим все спрайты игры в очередь фоновой загрузки"""
+        for name, (path, size) in self.SPRITES.items():
+            self.manager.load(name, path, size)
+        for name, (path, *_) in self.SHEETS.items():
+            self.manager.load(name, path)  # Лист целиком — режется в finish()
+
+    def update(self):
+        """Доводит загруженные картинки до ума; вызывать каждый кадр, пока не ready"""
+        self.manager.poll()
+        if self.manager.ready and not self.ready:
+            self.finish()
+        return self.ready
+
+    def finish(self):
+        self.sprites.update(self.manager.images)
+        self.build_atlas(["player_idle", "player_walk", "player_jump", "projectile"])
+        # Состояния игрока — анимации из одного кадра; листы режутся на кадры один раз
+        for name in ("player_idle", "player_walk", "player_jump"):
+            self.clips[name] = Clip([self.atlas[(name, "right")]], left=[self.atlas[(name, "left")]])
+        for name, (_, columns, rows, size, steps) in self.SHEETS.items():
+            sheet = self.sprites.pop(name)
+            self.clips[name] = Clip(slice_sheet(sheet, columns, rows, size, trim=True), steps)
+
+    def clip(self, name):
+        """Анимация по имени (None, если такой нет)"""
+        return self.clips.get(name)
+
+    def build_atlas(self, names):
+        """Заранее готовим отражённые копии спрайтов, чтобы не делать flip каждый кадр"""
+        for name in names:
+            image = self.sprites[name]
+            self.atlas[(name, "right")] = image
+            self.atlas[(name, "left")] = to_display_format(pygame.transform.flip(image, True, False))
+
+    def add_scaled(self, name, width, height):
+        """Добавляет в атлас копию спрайта другого размера (в обе стороны)"""
+        for direction in ("right", "left"):
+            image = pygame.transform.scale(self.atlas[(name, direction)], (width, height))
+            self.atlas[(name, direction, (width, height))] = to_display_format(image)
+
+    def audit(self, audit):
+        """Проверяет, что все картинки загрузчика в формате экрана (см. surfaces.py)"""
+        audit.check_all("sprites/", self.sprites)
+        audit.check_all("atlas/", self.atlas)
+        for name, clip in self.clips.items():
+            for index, (right, left) in enumerate(zip(clip.right, clip.left)):
+                audit.check(f"clips/{name}/{index}", right)
+                audit.check(f"clips/{name}/{index}/left", left)
+
+    def get(self, name, direction="right", size=None):
+        """Возвращает спрайт по имени, направлению и размеру (если задан)"""
+        key = (name, direction) if size is None else (name, direction, size)
+        image = self.atlas.get(key)
+        if image is None:
+            image = self.sprites.get(name)
+        if image is None:
+            image = self.manager.get(name)  # Ленивые картинки — при первом обращении
+        return image
     
 
 class Player:
@@ -70,6 +159,11 @@ class Player:
         self.assets = assets
         
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # Позиция на прошлом шаге — для плавной отрисовки между шагами
+        self.prev_x = x
+        self.prev_y = y
+        self.animator = Animator()
+        self.update_animation(moving=False)  # Спрайт нужен уже до первого шага
 
     def move(self, direction):
         if direction == "left":
@@ -104,24 +198,24 @@ class Player:
 
         self.rect.y = self.y
 
-    def update_animation(self):
-        keys = pygame.key.get_pressed()
-        moving = keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]
-
+    def update_animation(self, moving):
         if self.is_jumping:
-            self.current_sprite = self.assets.get("player_jump")
+            name = "player_jump"
         elif moving:
-            self.current_sprite = self.assets.get("player_walk")
+            name = "player_walk"
         else:
-            self.current_sprite = self.assets.get("player_idle")
-
-        if self.direction == "left":
-            self.flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
-        else:
-            self.flipped_sprite = self.current_sprite
-
-    def draw(self, surface):
-        surface.blit(self.flipped_sprite, (self.x, self.y))
+            name = "player_idle"
+
+        # Кадры в обе стороны уже нарезаны и отражены — только выбираем нужный
+        self.animator.play(self.assets.clip(name))
+        self.animator.update()
+        self.current_sprite = self.animator.image()
+        self.flipped_sprite = self.animator.image(self.direction)
+
+    def draw(self, surface, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        return surface.blit(self.flipped_sprite, (x, y))
     
     @property
     def center(self):
@@ -129,24 +223,35 @@ class Player:
 
 
 class Projectile:
-    def __init__(self, x, y, target_pos):
-        self.rect = pygame.Rect(x, y, 12, 12)
+    # __slots__: у снаряда фиксированный набор полей — объект меньше и быстрее
+    __slots__ = ("rect", "prev_pos", "velocity", "active", "stuck", "hit_surface", "gravity")
 
-        direction = pygame.math.Vector2(target_pos[0]-x, 
-                                        target_pos[1]-y) 
+    def __init__(self, x=0, y=0, target_pos=None):
+        self.rect = pygame.Rect(x, y, 12, 12)
+        self.prev_pos = (x, y)
+        self.velocity = pygame.math.Vector2(0, 0)
 
-        if direction.length() > 0:
-            direction = direction.normalize()
-            self.velocity = direction * PROJECTILE_SPEED
-        else:
-            self.velocity = 0 #pygame.math.Vector2(0, 0)
-        
-        self.active = True
+        self.active = False
         self.stuck = False # Снаряд застрял в земле
         self.hit_surface = False
 
         self.gravity = 0.6
-    
+
+        if target_pos is not None:
+            self.launch(x, y, target_pos)
+
+    def launch(self, x, y, target_pos):
+        """Запускает снаряд из (x, y) в сторону target_pos. Объект переиспользуется."""
+        self.rect.topleft = (x, y)
+        self.prev_pos = (x, y)
+
+        # Меняем вектор на месте, а не создаём новый
+        self.velocity.update(aim(target_pos[0] - x, target_pos[1] - y, PROJECTILE_SPEED))
+
+        self.active = True
+        self.stuck = False
+        self.hit_surface = False
+
     def update(self):
         if self.stuck or not self.active:
             return
@@ -192,10 +297,14 @@ class Projectile:
                 self.velocity.y = 0
 
     
-    def draw(self, surface):
-        
-        if self.active:
-            pygame.draw.rect(surface, RED, self.rect)
+    def draw(self, surface, alpha=1.0):
+        if not self.active:
+            return None
+        if alpha == 1.0:
+            return pygame.draw.rect(surface, RED, self.rect)
+        x = lerp(self.prev_pos[0], self.rect.x, alpha)
+        y = lerp(self.prev_pos[1], self.rect.y, alpha)
+        return pygame.draw.rect(surface, RED, (x, y, self.rect.width, self.rect.height))
 
     def is_close_to_player(self, player_rect):
         if not self.stuck:
@@ -208,133 +317,426 @@ class Projectile:
         self.active = False
         self.stuck = False
         self.hit_surface = False
-        self.velocity = 0
+        self.velocity.update(0, 0)
+
 
-asset_loader = AssetLoader()
-player = Player(x=100, y=GROUND_Y - PLAYER_SIZE, assets=asset_loader)
+class FrameInput:
+    """Ввод игрока за один кадр.
 
-#enemy = Enemy(x=0, y=SCREEN_HEIGHT - ENEMY_HEIGHT - 100)
-#enemy_direction = "right"
-enemies = []
-spawn_timer = 0
-projectiles = []
+    Зажатые клавиши (left, right) и события кадра (jump, shoot, restart, pause, quit).
+    shoot — точка прицела (x, y) или None, если выстрела не было.
+    Ввод можно собрать с клавиатуры (read_input) или написать скриптом.
+    """
 
-clock = pygame.time.Clock()
-running = True
-game_over = False
+    def __init__(self, left=False, right=False, jump=False, shoot=None, restart=False, quit=False,
+                 pause=False):
+        self.left = left
+        self.right = right
+        self.jump = jump
+        self.shoot = shoot
+        self.restart = restart
+        self.quit = quit
+        self.pause = pause
 
-def check_collisions(rect1, rect2):
-    return rect1.colliderect(rect2)
+    @property
+    def moving(self):
+        return self.left or self.right
 
-while running:
-    clock.tick(60)  
-    screen.fill(WHITE)
-    pygame.draw.line(screen, RED, (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 3)
+    def held(self):
+        """Только зажатые клавиши, без нажатий — для второго и следующих шагов кадра."""
+        return FrameInput(left=self.left, right=self.right, quit=self.quit)
+
+    def merge_events(self, earlier):
+        """Добавляет нажатия из более раннего ввода, который ещё не обработан."""
+        self.jump = self.jump or earlier.jump
+        if self.shoot is None:
+            self.shoot = earlier.shoot
+        self.restart = self.restart or earlier.restart
+        self.pause = self.pause or earlier.pause
+        self.quit = self.quit or earlier.quit
+
+
+def read_input():
+    """Собирает FrameInput из событий и клавиатуры pygame."""
+    inputs = FrameInput()
 
-# БЛОК ЭВЕНТОВ (СОБЫТИЙ)
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
-            running = False
+            inputs.quit = True
         # Проверка нажатия пробела и кнопки R
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE and not game_over:
-                player.jump()
-            elif event.key == pygame.K_r and game_over:
-                game_over = False
-                player.x = 100
-                player.y = GROUND_Y - PLAYER_SIZE
-                player.vel_y = 0
-                player.is_jumping = False
-                enemy.x = 0
-                enemy.y = SCREEN_HEIGHT - ENEMY_HEIGHT - 100
-                enemy_direction = "right"
+            if event.key == pygame.K_SPACE:
+                inputs.jump = True
+            elif event.key == pygame.K_r:
+                inputs.restart = True
+            elif event.key in (pygame.K_p, pygame.K_ESCAPE):
+                inputs.pause = True
         # Проверка нажатия левой кнопки мыши
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            active_count = len([p for p in projectiles if p.active])
-            
-            if active_count < MAX_COUNT_PROJECTILES:
-                px, py = player.center
-                mouse_pos = pygame.mouse.get_pos()
-                projectile = Projectile(px, py, mouse_pos)
-                projectiles.append(projectile)
+            inputs.shoot = pygame.mouse.get_pos()
+
     # Проверка нажатия клавиш управления
     keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        player.move("left")
-    if keys[pygame.K_RIGHT]:
-        player.move("right")
- # Отрисовка гравитациии и передвижения
-    if not game_over:
-        player.apply_gravity()
-        player.update_animation()
-        
-        # if enemy.x >= SCREEN_WIDTH - ENEMY_WIDTH:
-        #         enemy_direction = "left"
-        # elif enemy.x <= 0:
-        #     enemy_direction = "right"
-        
-        # enemy.move(enemy_direction)
-        # enemy.position_update()
-
-        # if check_collisions(player.rect, enemy.rect) and not DEBUG:
-        #     game_over = True
-    player_rect = player.rect
-    # Управление снарядами
-    for projectile in projectiles:
-        projectile.update()
-        projectile.draw(screen)
-        if projectile.is_close_to_player(player_rect):
-            projectile.reset()
-
-    projectiles = [p for p in projectiles if p.active]
-
-    spawn_timer += 1
-    if spawn_timer >= SPAWN_DELAY:
-        spawn_timer = 0
-        side = random.choice(["left", "right"])
-
-        if side == "left":
-            en_x = -ENEMY_WIDTH
-        else:
-            en_x = SCREEN_WIDTH + ENEMY_WIDTH
+    inputs.left = keys[pygame.K_LEFT]
+    inputs.right = keys[pygame.K_RIGHT]
+    return inputs
 
-        en_y = GROUND_Y - ENEMY_HEIGHT
 
-        new_enemy = Enemy(en_x, en_y)
-        enemies.append(new_enemy)
+class World:
+    """Всё состояние игры и один шаг симуляции.
 
-    for enemy in enemies[:]:
-        enemy.position_update(player.x)
-        enemy.draw(screen)
+    step() ничего не рисует и не читает клавиатуру — только считает.
+    Поэтому мир можно крутить без окна и быстрее реального времени.
+    """
+
+    def __init__(self, assets, max_projectiles=MAX_COUNT_PROJECTILES, seed=None):
+        self.assets = assets
+        # Свой генератор случайных чисел: с тем же зерном и тем же вводом
+        # мир повторяется точь-в-точь (см. replay.py)
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.max_projectiles = max_projectiles
+        self.player = Player(x=100, y=GROUND_Y - PLAYER_SIZE, assets=assets)
+        self.enemies = EntityList()  # Удаление — пометкой и одним проходом в конце шага
+        self.collisions = CollisionService()
+        self.spawn_timer = 0
+
+        # Снаряды берутся из пула: все объекты созданы заранее.
+        # max_projectiles можно поднять для режима "шквал снарядов".
+        self.projectile_pool = ObjectPool(Projectile, max_projectiles)
+        self.projectiles = self.projectile_pool.active
+        self.running = True
+
+        # Частицы только для красоты: на симуляцию не влияют
+        self.particles = None
+        if PARTICLES and particles.available():
+            self.particles = ParticleSystem(seed=seed)
+
+        # Состояние экрана: игра идёт, пауза или "игра окончена".
+        # Вне PLAYING мир стоит, и кадр надо рисовать только после смены состояния.
+        self.state = PLAYING
+        self.screen_changed = True
+
+        # Фон рисуется один раз и потом только копируется на экран
+        self.background = self.build_background()
+        # Оверлеи пауз собираются один раз (затемнение + надписи) при первом показе
+        self.screens = {
+            GAME_OVER: OverlayScreen([
+                ("ИГРА ОКОНЧЕНА!", WHITE, 74, 0),
+                ("Нажми R для рестарта", WHITE, 36, 50),
+            ]),
+            PAUSED: OverlayScreen([
+                ("ПАУЗА", WHITE, 74, 0),
+                ("P — продолжить", WHITE, 36, 50),
+            ]),
+        }
+        self.overlay_shown = False  # В прошлом кадре экран был затемнён
+
+        # Текст HUD: шрифты и надписи создаются один раз
+        self.text = TextCache()
+        self.count_label = HudLabel(self.text, "Снарядов: {}", (0,0,255))
+
+        # Счётчики для статистики (пригодятся для баланса)
+        self.frame = 0
+        self.kills = 0
+        self.deaths = 0
+
+    def build_background(self):
+        """Белый фон с линией земли — в формате экрана, чтобы blit был быстрым."""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(WHITE)
+        pygame.draw.line(background, RED, (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 3)
+        return background
+
+    def audit(self, audit=None):
+        """Проверка форматов всех картинок, которые рисует мир. Возвращает FormatAudit."""
+        if audit is None:
+            audit = FormatAudit()
+        self.assets.audit(audit)
+        audit.check("world/background", self.background)
+        for state, screen in self.screens.items():
+            audit.check(f"world/screen/{state}", screen.image)
+        audit.check_all("text/", self.text.surfaces)
+        return audit
 
-        if check_collisions(player.rect, enemy.rect) and not DEBUG:
-             game_over = True
+    @property
+    def game_over(self):
+        return self.state == GAME_OVER
+
+    @property
+    def needs_redraw(self):
+        """Нужно ли рисовать кадр: в игре — всегда, на паузе — только после смены экрана."""
+        return self.state == PLAYING or self.screen_changed
 
-        for projectile in projectiles:
-            if check_collisions(projectile.rect, enemy.rect):
+    def set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.screen_changed = True
+
+    def reset(self):
+        """Рестарт после Game Over."""
+        self.set_state(PLAYING)
+        self.player.x = 100
+        self.player.y = GROUND_Y - PLAYER_SIZE
+        self.player.vel_y = 0
+        self.player.is_jumping = False
+        self.player.prev_x = self.player.x
+        self.player.prev_y = self.player.y
+        self.enemies.clear()
+        self.projectile_pool.release_all()
+        if self.particles is not None:
+            self.particles.clear()
+        self.spawn_timer = 0
+
+    def step(self, inputs):
+        """Один кадр симуляции по вводу inputs (FrameInput)."""
+        self.frame += 1
+        player = self.player
+        self.remember_positions()
+
+        # БЛОК ЭВЕНТОВ (СОБЫТИЙ)
+        if inputs.quit:
+            self.running = False
+
+        # Смена экрана. Вне PLAYING мир стоит — симуляцию не считаем
+        restarted = False
+        if self.state == GAME_OVER:
+            if not inputs.restart:
+                return
+            self.reset()
+            restarted = True
+        elif inputs.pause:
+            self.set_state(PAUSED if self.state == PLAYING else PLAYING)
+        if self.state == PAUSED:
+            return
+
+        if inputs.jump and not restarted:
+            player.jump()
+
+        if inputs.shoot is not None:
+            # Пул пуст — значит, все снаряды уже в полёте
+            projectile = self.projectile_pool.acquire()
+            if projectile is not None:
+                px, py = player.center
+                projectile.launch(px, py, inputs.shoot)
+
+        if inputs.left:
+            player.move("left")
+        if inputs.right:
+            player.move("right")
+
+        # Гравитация и анимация
+        player.apply_gravity()
+        player.update_animation(inputs.moving)
+
+        # Управление снарядами
+        fx = self.particles
+        for projectile in self.projectiles:
+            flying = not projectile.hit_surface and not projectile.stuck
+            was_stuck = projectile.stuck
+            projectile.update()
+            if fx is not None:
+                if flying and projectile.hit_surface:
+                    fx.burst(*projectile.rect.center, RICOCHET)  # Рикошет от стены
+                if projectile.stuck and not was_stuck:
+                    # Воткнулся в землю — с прямого полёта или после рикошета
+                    fx.burst(*projectile.rect.midbottom, LANDING)
+            if projectile.is_close_to_player(player.rect):
                 projectile.reset()
-                enemies.remove(enemy)
 
-        if enemy.is_off_screen():
-            enemies.remove(enemy)
+        # Неактивные снаряды возвращаются в пул (сжатие списка на месте)
+        self.projectile_pool.compact()
+
+        self.spawn_timer += 1
+        if self.spawn_timer >= SPAWN_DELAY:
+            self.spawn_timer = 0
+            side = self.rng.choice(["left", "right"])
 
-    player.draw(screen)
-    #enemy.draw(screen)
+            if side == "left":
+                en_x = -ENEMY_WIDTH
+            else:
+                en_x = SCREEN_WIDTH + ENEMY_WIDTH
+
+            en_y = GROUND_Y - ENEMY_HEIGHT
+            # Начальный шаг анимации — из генератора мира: враги с одной стороны
+            # не машут в унисон, а с тем же зерном игра повторяется кадр в кадр
+            phase = self.rng.randrange(ANIMATION_PHASES)
+            # Появится в конце шага; кадры анимации общие для всех врагов
+            self.enemies.spawn(Enemy(en_x, en_y, self.assets.clip("enemy_ghost"), phase))
+
+        enemies = self.enemies.items
+        for enemy in enemies:
+            enemy.position_update(player.x)
+
+        # Пакетная проверка столкновений: прямоугольники групп лежат в списках,
+        # пересечения ищет Rect.collidelistall (для больших групп — сетка)
+        damaging = [p for p in self.projectiles if p.active]
+        self.collisions.sync("enemies", enemies)
+        self.collisions.sync("projectiles", damaging)
 
-    if game_over:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        if self.collisions.hits(player.rect, "enemies") and not DEBUG:
+            self.deaths += 1
+            self.set_state(GAME_OVER)
+
+        # Каждый снаряд убивает одного врага, каждого врага убивает один снаряд
+        for p_index, e_indices in self.collisions.pairs("projectiles", "enemies").items():
+            for e_index in e_indices:
+                enemy = enemies[e_index]
+                if not enemy.dead:
+                    self.enemies.kill(enemy)
+                    self.kills += 1
+                    if fx is not None:
+                        fx.burst(*enemy.rect.center, HIT)
+                    damaging[p_index].reset()
+                    break
+
+        for enemy in enemies:
+            if enemy.is_off_screen():
+                self.enemies.kill(enemy)
+
+        # Мёртвые уходят из списка одним проходом, новые враги добавляются
+        self.enemies.sweep()
+
+        if fx is not None:
+            fx.update()
+
+    def remember_positions(self):
+        """Запоминает позиции перед шагом — между ними и новыми рисуется кадр."""
+        player = self.player
+        player.prev_x = player.x
+        player.prev_y = player.y
+        for projectile in self.projectiles:
+            projectile.prev_pos = projectile.rect.topleft
+        for enemy in self.enemies:
+            enemy.prev_x = enemy.x
+
+    def draw(self, surface, alpha=1.0):
+        """Рисует текущее состояние мира на surface.
+
+        alpha — доля пути от прошлого шага к текущему (см. timestep.py).
+        """
+        surface.blit(self.background, (0, 0))
+
+        for projectile in self.projectiles:
+            projectile.draw(surface, alpha)
+
+        for enemy in self.enemies:
+            enemy.draw(surface, alpha)
+
+        if self.particles is not None:
+            self.particles.draw(surface, alpha)
+
+        self.player.draw(surface, alpha)
+
+        active_count = len([p for p in self.projectiles if p.active])
+        self.count_label.draw(surface, (10, 10), active_count)
+
+        self.draw_screen(surface)
+
+    def draw_dirty(self, renderer, alpha=1.0):
+        """Как draw(), но перерисовывает и показывает только изменившиеся области.
+
+        renderer — DirtyRenderer с фоном self.background. Сам вызывает
+        present(), поэтому pygame.display.flip() после него не нужен.
+        """
+        # Затемнение накрывает весь экран — такие кадры и первый после них целиком
+        paused = self.state != PLAYING
+        if paused or self.overlay_shown:
+            renderer.invalidate()
+        self.overlay_shown = paused
+
+        renderer.begin()
+        surface = renderer.screen
+        add = renderer.add
+
+        for projectile in self.projectiles:
+            add(projectile.draw(surface, alpha))
+
+        for enemy in self.enemies:
+            add(enemy.draw(surface, alpha))
+
+        if self.particles is not None:
+            add(self.particles.draw(surface, alpha))
+
+        add(self.player.draw(surface, alpha))
+
+        active_count = len([p for p in self.projectiles if p.active])
+        add(self.count_label.draw(surface, (10, 10), active_count))
+
+        self.draw_screen(surface)
+        renderer.present()
+
+    def draw_screen(self, surface):
+        """Оверлей текущего экрана (пауза, "игра окончена") — одна готовая картинка."""
+        self.screen_changed = False
+        screen = self.screens.get(self.state)
+        if screen is not None:
+            screen.draw(surface, self.text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Игра про ниндзя-кота")
+    parser.add_argument("--record", metavar="PATH", help="записать ввод в файл (повтор: replay.py)")
+    parser.add_argument("--seed", type=int, help="зерно случайности (по умолчанию — случайное)")
+    args = parser.parse_args()
+
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Основная игра")
+
+    clock = pygame.time.Clock()
+
+    # Картинки грузятся в фоне, а пока — экран загрузки
+    asset_loader = AssetLoader(background=True)
+    loading_screen = LoadingScreen()
+    text_cache = TextCache()
+    while not asset_loader.update():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+        loading_screen.draw(screen, text_cache, asset_loader.progress)
+        pygame.display.flip()
+        clock.tick(FPS)
+
+    world = World(asset_loader, seed=args.seed)
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(args.record, world.seed, world.max_projectiles)
+    if DEBUG:
+        print(world.audit().report())
+    # Физика идёт шагами по 1/FPS секунды независимо от скорости отрисовки
+    timestep = FixedTimestep(step_rate=FPS)
+    renderer = DirtyRenderer(screen, world.background)
+
+    while world.running:
+        idle = not world.needs_redraw
+        if idle:
+            # Пауза или "игра окончена": кадр уже на экране и не меняется.
+            # Спим до следующего события вместо 144 пустых кадров в секунду
+            pygame.event.post(pygame.event.wait())
+
+        frame_seconds = clock.tick(RENDER_FPS) / 1000
+        if idle:
+            frame_seconds = timestep.dt  # Время сна не в счёт: ровно один шаг на событие
+        for inputs in timestep.steps(frame_seconds, read_input()):
+            if recorder is not None:
+                recorder.record(inputs)
+            world.step(inputs)
+        if not world.needs_redraw:
+            continue
+        if DIRTY_RECTS:
+            world.draw_dirty(renderer, timestep.alpha)
+        else:
+            world.draw(screen, timestep.alpha)
+            pygame.display.flip()
 
-        font = pygame.font.Font(None, 74)
-        game_over_text = font.render("ИГРА ОКОНЧЕНА!", True, WHITE)
+    if recorder is not None:
+        recorder.close()
+        print(f"Записано шагов: {recorder.steps} в {args.record}")
+    pygame.quit()
 
-        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT //2))
-        screen.blit(game_over_text, text_rect)
 
-    active_count = len([p for p in projectiles if p.active])
-    font = pygame.font.Font(None, 36)
-    count_text = font.render(f"Снарядов: {active_count}", True, (0,0,255))
-    screen.blit(count_text, (10, 10))
-    
-    pygame.display.flip()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
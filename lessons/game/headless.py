@@ -0,0 +1,119 @@
+"""Запуск игры без окна и без ограничения FPS.
+
+Нужен для проверки баланса и для CI: за несколько секунд можно
+"прожить" часы игрового времени по заранее заданному вводу.
+
+Запуск:
+    python headless.py --frames 216000 --seed 1   # 1 час игры при 60 FPS
+    python headless.py --draw                     # считать ещё и отрисовку
+    python headless.py --draw --dirty             # отрисовка грязными прямоугольниками
+    python headless.py --record bot.rec           # сохранить ввод бота (повтор: replay.py)
+"""
+import os
+
+# Пустой видеодрайвер SDL — окно не создаётся. Ставим ДО импорта pygame.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import time
+
+import pygame
+
+from dirty import DirtyRenderer
+from replay import InputRecorder
+from game import (AssetLoader, FrameInput, World, FPS, SCREEN_WIDTH,
+                  SCREEN_HEIGHT, MAX_COUNT_PROJECTILES)
+
+
+def bot_input(world, rng):
+    """Простой бот: бегает, прыгает и стреляет в ближайшего врага."""
+    if world.game_over:
+        return FrameInput(restart=True)
+
+    player = world.player
+    inputs = FrameInput()
+
+    # Убегаем от ближайшего врага и стреляем в него
+    if world.enemies:
+        target = min(world.enemies, key=lambda e: abs(e.rect.centerx - player.rect.centerx))
+        if target.rect.centerx > player.rect.centerx:
+            inputs.left = True
+        else:
+            inputs.right = True
+        if rng.random() < 0.05:
+            inputs.shoot = target.rect.center
+        if abs(target.rect.centerx - player.rect.centerx) < 120 and rng.random() < 0.2:
+            inputs.jump = True
+    else:
+        # Врагов нет — собираем снаряды с земли
+        inputs.left = rng.random() < 0.3
+        inputs.right = not inputs.left and rng.random() < 0.3
+
+    return inputs
+
+
+def run(frames, seed=0, draw=False, script=bot_input, max_projectiles=MAX_COUNT_PROJECTILES,
+        dirty=False, record=None):
+    """Крутит мир frames кадров подряд и возвращает World.
+
+    script(world, rng) -> FrameInput — откуда брать ввод на каждом кадре.
+    dirty — рисовать через DirtyRenderer (вместе с draw=True).
+    record — путь к файлу, куда записать ввод (см. replay.py).
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    rng = random.Random(seed)
+    world = World(AssetLoader(), max_projectiles=max_projectiles, seed=seed)
+    renderer = DirtyRenderer(screen, world.background)
+    recorder = InputRecorder(record, seed, max_projectiles) if record else None
+
+    for _ in range(frames):
+        inputs = script(world, rng)
+        if recorder is not None:
+            recorder.record(inputs)
+        world.step(inputs)
+        if draw and dirty:
+            world.draw_dirty(renderer)
+        elif draw:
+            world.draw(screen)
+            pygame.display.flip()
+        if not world.running:
+            break
+
+    if recorder is not None:
+        recorder.close()
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Симуляция игры без окна")
+    parser.add_argument("--frames", type=int, default=FPS * 60 * 60, help="сколько кадров прожить")
+    parser.add_argument("--seed", type=int, default=0, help="зерно случайности")
+    parser.add_argument("--draw", action="store_true", help="рисовать кадры (в невидимый экран)")
+    parser.add_argument("--max-projectiles", type=int, default=MAX_COUNT_PROJECTILES,
+                        help="размер пула снарядов (больше — режим шквала)")
+    parser.add_argument("--audit", action="store_true",
+                        help="после прогона вывести картинки не в формате экрана")
+    parser.add_argument("--record", metavar="PATH", help="записать ввод бота в файл")
+    parser.add_argument("--dirty", action="store_true",
+                        help="с --draw: перерисовывать только изменившиеся области")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    world = run(args.frames, args.seed, args.draw, max_projectiles=args.max_projectiles,
+                dirty=args.dirty, record=args.record)
+    elapsed = time.perf_counter() - start
+
+    game_seconds = world.frame / FPS
+    print(f"Кадров: {world.frame} ({game_seconds / 60:.1f} мин игры) за {elapsed:.2f} с "
+          f"— в {game_seconds / elapsed:.0f} раз быстрее реального времени")
+    print(f"Убито врагов: {world.kills}, проигрышей: {world.deaths}")
+    if args.audit:
+        print(world.audit().report())
+
+
+if __name__ == "__main__":
+    main()
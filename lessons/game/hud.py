@@ -0,0 +1,73 @@
+"""Кэш текста для HUD.
+
+pygame.font.Font(...) читает файл шрифта, а font.render(...) растеризует
+каждую букву. Делать это каждый кадр дорого, поэтому:
+
+- шрифты создаются один раз и хранятся по ключу (имя, размер);
+- готовые надписи хранятся по ключу (шрифт, текст, цвет) с вытеснением
+  самых старых (LRU), когда кэш переполнен;
+- HudLabel перерисовывает надпись только когда поменялось значение.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from surfaces import to_display_format
+
+
+class TextCache:
+    """Шрифты и отрендеренные надписи, созданные один раз."""
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+
+    def font(self, size, name=None, system=False):
+        """Шрифт размера size. system=True — системный шрифт по имени (SysFont)."""
+        key = (name, size, system)
+        font = self.fonts.get(key)
+        if font is None:
+            if system:
+                font = pygame.font.SysFont(name, size)
+            else:
+                font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, color, size=36, name=None, system=False):
+        """Готовая поверхность с текстом. Рендерит только при промахе кэша."""
+        key = (name, size, system, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.font(size, name, system).render(text, True, color)
+        surface = to_display_format(surface)  # Формат экрана — быстрый blit
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Выкидываем самую старую надпись
+        return surface
+
+
+class HudLabel:
+    """Надпись вида "Снарядов: {}" — обновляется только при смене значения."""
+
+    def __init__(self, cache, template, color, size=36, name=None, system=False):
+        self.cache = cache
+        self.template = template
+        self.color = color
+        self.size = size
+        self.name = name
+        self.system = system
+        self.values = None
+        self.image = None
+
+    def draw(self, surface, pos, *values):
+        """Рисует надпись в точке pos и возвращает занятый прямоугольник."""
+        if values != self.values or self.image is None:
+            self.values = values
+            text = self.template.format(*values)
+            self.image = self.cache.render(text, self.color, self.size, self.name, self.system)
+        return surface.blit(self.image, pos)
@@ -0,0 +1,68 @@
+"""Жизненный цикл сущностей: пометить и убрать одним проходом.
+
+Удалять врага прямо в цикле (enemies.remove(enemy)) дорого и опасно:
+remove() ищет врага по всему списку, цикл приходится вести по копии
+enemies[:], а одного и того же врага легко удалить дважды.
+
+Здесь во время кадра никто ничего не удаляет:
+
+- kill(entity) только ставит entity.dead = True (повторный вызов безопасен);
+- spawn(entity) откладывает новичка в очередь;
+- sweep() раз в кадр выкидывает мёртвых и добавляет новичков.
+
+Удаление — "swap-remove": на место мёртвого встаёт последний элемент.
+Порядок врагов может поменяться, зато весь проход O(n) и без копий списка.
+
+    enemies = EntityList()
+    enemies.spawn(Enemy(x, y))
+    for enemy in enemies:
+        if enemy.is_off_screen():
+            enemies.kill(enemy)
+    enemies.sweep()
+"""
+
+
+class EntityList:
+    """Список живых сущностей с отложенным появлением и удалением."""
+
+    def __init__(self):
+        self.items = []
+        self.spawned = []  # Появятся при следующем sweep()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def spawn(self, entity):
+        """Добавляет сущность (у неё должен быть атрибут dead) в конце кадра."""
+        self.spawned.append(entity)
+
+    def kill(self, entity):
+        """Помечает сущность мёртвой. Из списка она уйдёт в sweep()."""
+        entity.dead = True
+
+    def sweep(self):
+        """Убирает мёртвых (swap-remove) и добавляет новичков. Раз в кадр."""
+        items = self.items
+        end = len(items)
+        index = 0
+        while index < end:
+            if items[index].dead:
+                end -= 1
+                items[index] = items[end]  # Последний встаёт на место мёртвого
+            else:
+                index += 1
+        del items[end:]
+
+        if self.spawned:
+            items.extend(self.spawned)
+            self.spawned.clear()
+
+    def clear(self):
+        self.items.clear()
+        self.spawned.clear()
@@ -0,0 +1,156 @@
+"""Загрузка картинок в фоне с прогрессом.
+
+Раньше AssetLoader.__init__ читал и масштабировал все PNG подряд, и до
+первого кадра окно просто висело. С настоящими фонами и кадрами анимации
+это время растёт с каждым файлом.
+
+AssetManager делит работу на две части:
+
+- чтение PNG и масштабирование — в пуле потоков (pygame отпускает GIL
+  на распаковке картинки, так что файлы читаются параллельно);
+- перевод в формат экрана (convert_alpha) — только в главном потоке,
+  в poll(), потому что он обращается к окну.
+
+С DiskCache (assetcache.py) уже масштабированные картинки читаются
+с диска одним чтением, без распаковки PNG.
+
+    manager = AssetManager()
+    manager.load("player_idle", "assets/idle.png", (50, 50))
+    manager.lazy("boss", "assets/boss.png", (200, 200))  # только при первом get()
+    while not manager.ready:
+        manager.poll()
+        loading_screen.draw(screen, text_cache, manager.progress)
+    image = manager.get("player_idle")
+"""
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from surfaces import display_ready, to_display_format
+
+WORKERS = 4
+
+
+def decode(path, size=None, cache=None):
+    """Читает и масштабирует картинку (в рабочем потоке). Без файла — None.
+
+    cache — DiskCache (assetcache.py): готовые пиксели берутся из него,
+    а распакованная и масштабированная картинка туда сохраняется.
+    """
+    try:
+        with open(path, "rb") as file:
+            source = file.read()
+    except OSError:
+        return None
+
+    if cache is not None:
+        image = cache.load(source, size)
+        if image is not None:
+            return image
+
+    try:
+        image = pygame.image.load(io.BytesIO(source), path)  # path — подсказка формата
+    except pygame.error:
+        return None
+    if size is not None and image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+    if cache is not None:
+        cache.save(source, size, image)
+    return image
+
+
+def placeholder(size):
+    """Серый квадрат с глазиком вместо ненайденной картинки."""
+    width, height = size
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(image, (100, 100, 100), (5, 5, width - 10, height - 10), border_radius=8)
+    pygame.draw.circle(image, (255, 255, 255), (15, 15), 5)  # Глазик
+    return image
+
+
+class AssetManager:
+    """Картинки по именам: загрузка в фоне, подготовка в главном потоке."""
+
+    def __init__(self, workers=WORKERS, cache=None):
+        """cache — DiskCache с готовыми пикселями (None — без кэша на диске)."""
+        self.workers = workers
+        self.cache = cache
+        self.executor = None   # Пул создаётся при первой загрузке
+        self.pending = {}      # имя -> (Future, путь, размер)
+        self.lazy_specs = {}   # имя -> (путь, размер): грузятся при первом get()
+        self.images = {}
+        self.total = 0
+
+    def load(self, name, path, size=None):
+        """Ставит картинку в очередь фоновой загрузки."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+        future = self.executor.submit(decode, path, size, self.cache)
+        self.pending[name] = (future, path, size)
+        self.total += 1
+
+    def lazy(self, name, path, size=None):
+        """Запоминает картинку, которая загрузится только при первом get()."""
+        self.lazy_specs[name] = (path, size)
+
+    @property
+    def ready(self):
+        return not self.pending
+
+    @property
+    def progress(self):
+        """Доля готовых картинок от 0 до 1."""
+        if not self.total:
+            return 1.0
+        return (self.total - len(self.pending)) / self.total
+
+    def poll(self):
+        """Доводит до ума загруженные картинки. Вызывать из главного потока каждый кадр.
+
+        Возвращает, сколько картинок стало готово.
+        """
+        finished = [name for name, (future, _, _) in self.pending.items() if future.done()]
+        for name in finished:
+            future, path, size = self.pending.pop(name)
+            self.images[name] = self.finish(future.result(), path, size)
+        if self.ready:
+            self.shutdown()
+        return len(finished)
+
+    def wait(self):
+        """Дожидается всех картинок из очереди (без экрана загрузки)."""
+        for name in list(self.pending):
+            future, path, size = self.pending.pop(name)
+            self.images[name] = self.finish(future.result(), path, size)
+        self.shutdown()
+
+    def get(self, name, default=None):
+        """Готовая картинка. Ленивая или ещё не загруженная — загружается сейчас."""
+        image = self.images.get(name)
+        if image is not None:
+            return image
+        if name in self.pending:
+            future, path, size = self.pending.pop(name)
+            image = self.images[name] = self.finish(future.result(), path, size)
+            return image
+        spec = self.lazy_specs.pop(name, None)
+        if spec is None:
+            return default
+        path, size = spec
+        image = self.images[name] = self.finish(decode(path, size, self.cache), path, size)
+        return image
+
+    def finish(self, image, path, size):
+        """Главный поток: заглушка вместо ненайденного файла и перевод в формат экрана."""
+        if image is None:
+            print(f"Файл не найден: {path}. Создаём заглушку.")
+            image = placeholder(size or (50, 50))
+        if display_ready() and not image.get_flags() & pygame.SRCALPHA:
+            image = image.convert_alpha()  # Спрайты всегда с прозрачностью
+        return to_display_format(image)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
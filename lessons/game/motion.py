@@ -0,0 +1,168 @@
+"""Траектории полёта врагов: таблицы синуса и готовые смещения по фазе.
+
+Летающий враг раньше считал math.sin(self.fly_angle) каждый шаг. Для
+волны в сотни врагов это сотни вызовов тригонометрии за кадр, а новый
+рисунок полёта (зигзаг, петля) — ещё одна ветка с формулами в update().
+
+Здесь траектория считается один раз при загрузке и хранится списком
+шагов: для каждой фазы — сдвиг по x (целые пиксели) и смещение по y
+от линии полёта. Враг хранит только номер фазы:
+
+    path = PATTERNS["zigzag"]
+    phase = (phase + 1) % len(path)
+    dx, dy = path.steps[phase]        # один индекс в списке
+
+Новый рисунок полёта — это данные, а не код:
+
+    PATTERNS["dive"] = pattern_from({"type": "bezier", "points": [(0, 0), (40, 80), (80, -80), (0, 0)]})
+
+Снаряды: aim() даёт скорость к цели без создания Vector2.
+"""
+import math
+
+# Размер таблиц синуса — степень двойки, индекс берётся маской
+TABLE_SIZE = 64
+TABLE_MASK = TABLE_SIZE - 1
+SINE = tuple(math.sin(2 * math.pi * i / TABLE_SIZE) for i in range(TABLE_SIZE))
+COSINE = SINE[TABLE_SIZE // 4:] + SINE[:TABLE_SIZE // 4]  # cos(a) = sin(a + 90°)
+
+
+def sine(index):
+    """Синус угла index * 360° / TABLE_SIZE по таблице."""
+    return SINE[index & TABLE_MASK]
+
+
+def cosine(index):
+    return COSINE[index & TABLE_MASK]
+
+
+def aim(dx, dy, speed):
+    """Скорость (vx, vy) длины speed в сторону (dx, dy); (0, 0), если направления нет."""
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return 0.0, 0.0
+    scale = speed / length
+    return dx * scale, dy * scale
+
+
+class Pattern:
+    """Траектория: для каждого шага фазы — (сдвиг по x, смещение по y)."""
+
+    __slots__ = ("name", "steps", "dy")
+
+    def __init__(self, name, points):
+        """points — замкнутый путь: позиции (x, y) относительно линии полёта по шагам."""
+        self.name = name
+        xs = [round(x) for x, _ in points]
+        # Сдвиги по x из округлённых позиций: за период враг возвращается
+        # ровно туда же, дробные пиксели не теряются в Rect
+        self.steps = tuple((xs[i] - xs[i - 1], round(y)) for i, (_, y) in enumerate(points))
+        self.dy = tuple(dy for _, dy in self.steps)  # Только смещения по y (для массивов NumPy)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        return f"Pattern({self.name!r}, {len(self.steps)} шагов)"
+
+
+def wave(amplitude=15, period=TABLE_SIZE, name="wave"):
+    """Синусоида по вертикали (как старый fly_angle += 0.1)."""
+    step = TABLE_SIZE // period if TABLE_SIZE % period == 0 else None
+    points = []
+    for i in range(period):
+        value = SINE[i * step] if step else math.sin(2 * math.pi * i / period)
+        points.append((0, value * amplitude))
+    return Pattern(name, points)
+
+
+def zigzag(amplitude=20, period=48, name="zigzag"):
+    """Ломаная вверх-вниз с постоянной скоростью."""
+    points = []
+    for i in range(period):
+        t = i / period
+        # Треугольник: 0 → 1 → -1 → 0 за период
+        value = 4 * t if t < 0.25 else 2 - 4 * t if t < 0.75 else 4 * t - 4
+        points.append((0, value * amplitude))
+    return Pattern(name, points)
+
+
+def loop(radius=25, period=TABLE_SIZE, name="loop"):
+    """Петля: круг радиуса radius поверх движения к игроку."""
+    step = TABLE_SIZE // period if TABLE_SIZE % period == 0 else None
+    points = []
+    for i in range(period):
+        if step:
+            c, s = COSINE[i * step], SINE[i * step]
+        else:
+            angle = 2 * math.pi * i / period
+            c, s = math.cos(angle), math.sin(angle)
+        points.append(((c - 1) * radius, s * radius))
+    return Pattern(name, points)
+
+
+def bezier(points, period=TABLE_SIZE, name="bezier"):
+    """Кубическая кривая Безье по четырём точкам; первая и последняя должны совпадать."""
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
+    path = []
+    for i in range(period):
+        t = i / period
+        u = 1 - t
+        a, b, c, d = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+        path.append((a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3))
+    return Pattern(name, path)
+
+
+MAKERS = {"wave": wave, "zigzag": zigzag, "loop": loop, "bezier": bezier}
+
+
+def pattern_from(spec, name=None):
+    """Траектория из описания: {"type": "zigzag", "amplitude": 30, ...}."""
+    spec = dict(spec)
+    maker = MAKERS[spec.pop("type")]
+    return maker(name=name or maker.__name__, **spec)
+
+
+# Готовые траектории — общие для всех врагов
+PATTERNS = {
+    "wave": wave(),
+    "zigzag": zigzag(),
+    "loop": loop(),
+    "swoop": bezier(((0, 0), (40, -100), (80, 100), (0, 0)), name="swoop"),
+}
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Синус в каждом шаге против таблицы траектории")
+    parser.add_argument("--enemies", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    angles = [0.0] * args.enemies
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for i in range(args.enemies):
+            angles[i] += 0.1
+            offset = math.sin(angles[i]) * 15
+    trig = time.perf_counter() - start
+
+    path = PATTERNS["wave"].steps
+    size = len(path)
+    phases = [0] * args.enemies
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for i in range(args.enemies):
+            phases[i] = (phases[i] + 1) % size
+            dx, offset = path[phases[i]]
+    table = time.perf_counter() - start
+
+    frames = args.frames
+    print(f"{args.enemies} летающих врагов: math.sin {trig / frames * 1000:.3f} мс, "
+          f"таблица {table / frames * 1000:.3f} мс на кадр")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Частицы на NumPy: искры попаданий, рикошетов и пыль при приземлении.
+
+Частица-объект на Python с update() и draw() — это тысячи вызовов методов
+за кадр. Здесь все частицы лежат в массивах (позиция, скорость, время
+жизни, цвет), гравитация, сопротивление воздуха и старение считаются
+несколькими операциями над массивами, а рисуются одним вызовом
+Surface.fblits() (есть в pygame-ce; в обычном pygame — blits()) из заранее
+нарисованных картинок.
+
+NumPy не обязателен для игры: без него частиц просто нет.
+
+    particles = ParticleSystem(capacity=4096)
+    particles.burst(x, y, HIT)       # вспышка из HIT["count"] частиц
+    particles.update()               # раз в шаг симуляции
+    particles.draw(screen, alpha)    # возвращает Rect вокруг всех частиц
+
+Проверка скорости:
+    python particles.py --particles 5000
+"""
+import math
+
+import pygame
+
+from surfaces import to_display_format
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен — игра без частиц
+    np = None
+
+# Цвета частиц (индекс в массиве color)
+PALETTE = [
+    (220, 40, 40),    # 0 — попадание во врага
+    (255, 200, 40),   # 1 — искры рикошета
+    (150, 130, 110),  # 2 — пыль
+]
+SIZES = (2, 3, 4, 5)  # Размер частицы по мере "взросления": молодые крупнее
+
+# Готовые вспышки: сколько частиц, цвет, скорость, время жизни (в шагах)
+# и направление разлёта (углы в радианах; вверх — от pi до 2*pi)
+HIT = dict(count=24, color=0, speed=(2.0, 6.0), life=(20, 40))
+RICOCHET = dict(count=10, color=1, speed=(2.0, 5.0), life=(10, 20))
+LANDING = dict(count=12, color=2, speed=(0.5, 2.5), life=(15, 30), angle=(math.pi, 2 * math.pi))
+
+
+def available():
+    """Можно ли создавать ParticleSystem (установлен ли NumPy)."""
+    return np is not None
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("Для частиц нужен NumPy: pip install numpy")
+
+
+def build_sprites(palette=PALETTE, sizes=SIZES):
+    """Картинки частиц: для каждого цвета — квадратики всех размеров."""
+    sprites = []
+    for color in palette:
+        for size in sizes:
+            image = pygame.Surface((size, size))
+            image.fill(color)
+            sprites.append(to_display_format(image))
+    return sprites
+
+
+class ParticleSystem:
+    """Все частицы в массивах NumPy фиксированной ёмкости."""
+
+    def __init__(self, capacity=4096, gravity=0.25, drag=0.96, seed=None):
+        require_numpy()
+        self.capacity = capacity
+        self.gravity = gravity
+        self.drag = drag
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)      # Сколько шагов осталось
+        self.max_life = np.ones(capacity, dtype=np.int16)
+        self.color = np.zeros(capacity, dtype=np.int16)
+
+        self.sizes = len(SIZES)
+        self.sprites = build_sprites()
+        # fblits есть только в pygame-ce — иначе blits без списка прямоугольников
+        self.fblits = hasattr(pygame.Surface, "fblits")
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, count, color=0, speed=(1.0, 4.0), life=(15, 30), angle=(0.0, 2 * math.pi)):
+        """Выпускает count частиц из точки (x, y). Лишние сверх ёмкости отбрасываются."""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start = self.count
+        end = start + count
+        rng = self.rng
+
+        angles = rng.uniform(angle[0], angle[1], count)
+        speeds = rng.uniform(speed[0], speed[1], count)
+        self.pos[start:end] = (x, y)
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        lives = rng.integers(life[0], life[1] + 1, count)
+        self.life[start:end] = lives
+        self.max_life[start:end] = lives
+        self.color[start:end] = color
+        self.count = end
+
+    def burst(self, x, y, preset):
+        """Вспышка по готовому описанию (HIT, RICOCHET, LANDING)."""
+        self.emit(x, y, **preset)
+
+    def update(self):
+        """Один шаг: гравитация, сопротивление, движение, старение, удаление."""
+        n = self.count
+        if not n:
+            return
+        vel = self.vel[:n]
+        vel[:, 1] += self.gravity
+        vel *= self.drag
+        self.pos[:n] += vel
+        life = self.life[:n]
+        life -= 1
+
+        alive = life > 0
+        if not alive.all():
+            # Живые сдвигаются в начало массивов, порядок сохраняется
+            keep = int(alive.sum())
+            for array in (self.pos, self.vel, self.life, self.max_life, self.color):
+                array[:keep] = array[:n][alive]
+            self.count = keep
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surface, alpha=1.0):
+        """Рисует все частицы одним вызовом. Возвращает Rect вокруг них (или None)."""
+        n = self.count
+        if not n:
+            return None
+        # Интерполяция: позиция на доле alpha пути от прошлого шага
+        pos = self.pos[:n]
+        if alpha != 1.0:
+            pos = pos - self.vel[:n] * (1.0 - alpha)
+        xy = pos.astype(np.int32)
+
+        # Размер зависит от оставшейся жизни: от крупных к мелким
+        level = (self.life[:n] * self.sizes - 1) // self.max_life[:n]
+        index = self.color[:n] * self.sizes + level
+
+        sprites = self.sprites
+        sequence = zip(map(sprites.__getitem__, index.tolist()), xy.tolist())
+        if self.fblits:
+            surface.fblits(sequence)
+        else:
+            surface.blits(sequence, doreturn=False)
+
+        low = xy.min(axis=0)
+        high = xy.max(axis=0) + SIZES[-1]
+        return pygame.Rect(int(low[0]), int(low[1]), int(high[0] - low[0]), int(high[1] - low[1]))
+
+
+def main():
+    import argparse
+    import os
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    parser = argparse.ArgumentParser(description="Скорость системы частиц")
+    parser.add_argument("--particles", type=int, default=5000, help="сколько частиц держать в воздухе")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    particles = ParticleSystem(capacity=args.particles * 2, seed=0)
+    presets = (HIT, RICOCHET, LANDING)
+
+    update_time = draw_time = 0.0
+    for frame in range(args.frames):
+        # Подсыпаем вспышки, пока частиц меньше заданного
+        while len(particles) < args.particles:
+            preset = presets[frame % 3]
+            particles.burst(particles.rng.uniform(0, 800), particles.rng.uniform(100, 500), preset)
+
+        start = time.perf_counter()
+        particles.update()
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        screen.fill((255, 255, 255))
+        particles.draw(screen, 0.5)
+        draw_time += time.perf_counter() - start
+
+    print(f"{args.particles} частиц, {args.frames} кадров: update {update_time / args.frames * 1000:.3f} мс, "
+          f"draw {draw_time / args.frames * 1000:.3f} мс на кадр")
+
+
+if __name__ == "__main__":
+    main()
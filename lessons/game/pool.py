@@ -0,0 +1,61 @@
+"""Пул объектов фиксированного размера.
+
+Все объекты создаются один раз при старте. Выстрел берёт свободный объект
+из пула, а после reset() (объект стал неактивным) он возвращается в пул
+при ближайшем сжатии. Новых объектов в игре не создаётся — сборщику мусора
+нечего убирать, и посреди боя не бывает пауз.
+
+    pool = ObjectPool(Projectile, capacity=3)
+    projectile = pool.acquire()          # None, если все заняты
+    if projectile is not None:
+        projectile.launch(x, y, target)
+    ...
+    pool.compact()                        # раз в кадр
+"""
+
+
+class ObjectPool:
+    """Пул объектов: список живых (active) и стек свободных (free)."""
+
+    def __init__(self, factory, capacity):
+        self.capacity = capacity
+        self.free = [factory() for _ in range(capacity)]
+        self.active = []  # Живые объекты. Этот список можно отдавать в игру
+
+    def __len__(self):
+        return len(self.active)
+
+    def acquire(self):
+        """Берёт свободный объект и кладёт в active. None — если пул пуст."""
+        if not self.free:
+            # Возможно, кто-то уже выключен, но ещё не вернулся в пул
+            self.compact()
+            if not self.free:
+                return None
+        obj = self.free.pop()
+        self.active.append(obj)
+        return obj
+
+    def compact(self):
+        """Возвращает выключенные объекты (active == False) в пул.
+
+        Сжатие на месте: живые объекты сдвигаются к началу списка
+        с сохранением порядка, хвост обрезается. Новый список не создаётся.
+        """
+        active = self.active
+        free = self.free
+        write = 0
+        for obj in active:
+            if obj.active:
+                active[write] = obj
+                write += 1
+            else:
+                free.append(obj)
+        del active[write:]
+
+    def release_all(self):
+        """Возвращает в пул все объекты (например, при рестарте)."""
+        for obj in self.active:
+            obj.reset()
+        self.free.extend(self.active)
+        self.active.clear()
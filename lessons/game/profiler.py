@@ -0,0 +1,215 @@
+"""Профайлер кадра: сколько миллисекунд уходит на каждую часть игрового цикла.
+
+Использование:
+    profiler = FrameProfiler()
+
+    while running:
+        profiler.begin_frame()
+        with profiler.section("events"):
+            ...
+        with profiler.section("flip"):
+            pygame.display.flip()
+        profiler.end_frame()
+
+F3 в игре — показать/скрыть график, F4 — сохранить трассу в CSV и JSON.
+"""
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+# Цвета фаз на графике (по кругу, если фаз больше)
+PHASE_COLORS = [
+    (230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200),
+    (245, 130, 48), (145, 30, 180), (70, 240, 240), (240, 50, 230),
+    (210, 245, 60), (250, 190, 190), (0, 128, 128), (170, 110, 40),
+]
+
+FRAME_BUDGET_MS = 1000 / 60  # 16.7 мс — бюджет кадра при 60 FPS
+
+
+class _Section:
+    """Контекстный менеджер для одной фазы. Один объект на фазу — без мусора."""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NullSection:
+    """Заглушка, когда профайлер выключен."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Замеряет фазы кадра, хранит скользящее окно и полную трассу."""
+
+    def __init__(self, history=300, trace_limit=36000, enabled=True):
+        self.enabled = enabled
+        self.visible = False       # Показывать ли график поверх игры
+        self.phases = []           # Фазы в порядке первого появления
+        self.frames = deque(maxlen=history)  # Последние кадры для перцентилей
+        self.trace = deque(maxlen=trace_limit)  # Кадры для выгрузки (10 минут при 60 FPS)
+        self.current = {}
+        self.frame_start = 0.0
+        self.frame_index = 0
+
+        self._sections = {}
+        self._font = None
+        self._legend = None
+        self._legend_frame = -1
+
+    def section(self, name):
+        """Возвращает контекстный менеджер для замера фазы name."""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+            self.phases.append(name)
+        return section
+
+    def begin_frame(self):
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.current["total"] = (time.perf_counter() - self.frame_start) * 1000
+        self.frames.append(self.current)
+        self.trace.append(self.current)
+        self.frame_index += 1
+
+    def handle_event(self, event):
+        """F3 — показать/скрыть график, F4 — выгрузить трассу."""
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_F3:
+            self.visible = not self.visible
+        elif event.key == pygame.K_F4:
+            self.export_csv("profile_trace.csv")
+            self.export_json("profile_trace.json")
+            print("Трасса сохранена: profile_trace.csv, profile_trace.json")
+
+    # ----- Статистика -----
+
+    def percentile(self, name, p):
+        """p-й перцентиль времени фазы name (мс) по скользящему окну."""
+        values = sorted(frame.get(name, 0.0) for frame in self.frames)
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+        return values[index]
+
+    def mean(self, name):
+        if not self.frames:
+            return 0.0
+        return sum(frame.get(name, 0.0) for frame in self.frames) / len(self.frames)
+
+    def summary(self):
+        """{фаза: {"mean", "p50", "p95", "p99"}} по скользящему окну."""
+        return {
+            name: {
+                "mean": self.mean(name),
+                "p50": self.percentile(name, 50),
+                "p95": self.percentile(name, 95),
+                "p99": self.percentile(name, 99),
+            }
+            for name in self.phases + ["total"]
+        }
+
+    # ----- Выгрузка -----
+
+    def export_csv(self, path):
+        columns = self.phases + ["total"]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + columns)
+            for index, frame in enumerate(self.trace):
+                writer.writerow([index] + [f"{frame.get(name, 0.0):.4f}" for name in columns])
+
+    def export_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "phases": self.phases,
+                "summary": self.summary(),
+                "frames": list(self.trace),
+            }, f, indent=1)
+
+    # ----- График -----
+
+    def draw_overlay(self, surface, x=10, y=None, height=120):
+        """Рисует столбики последних кадров (цвет = фаза) и легенду с p95."""
+        if not self.visible or not self.frames:
+            return
+
+        width = len(self.frames)
+        if y is None:
+            y = surface.get_height() - height - 10
+        scale = height / (FRAME_BUDGET_MS * 2)  # Высота графика = два бюджета кадра
+
+        panel = pygame.Rect(x, y, width, height)
+        surface.fill((20, 20, 20), panel)
+
+        for column, frame in enumerate(self.frames):
+            bottom = y + height
+            for index, name in enumerate(self.phases):
+                bar = int(frame.get(name, 0.0) * scale)
+                if bar <= 0:
+                    continue
+                top = max(y, bottom - bar)
+                color = PHASE_COLORS[index % len(PHASE_COLORS)]
+                pygame.draw.line(surface, color, (x + column, bottom - 1), (x + column, top))
+                bottom = top
+
+        # Линия бюджета 16.7 мс
+        budget_y = y + height - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 255, 255), (x, budget_y), (x + width, budget_y))
+
+        # Легенду перерисовываем раз в полсекунды — рендер текста дорогой
+        if self._legend is None or self.frame_index - self._legend_frame >= 30:
+            self._legend = self._render_legend()
+            self._legend_frame = self.frame_index
+        surface.blit(self._legend, (x + width + 10, y))
+
+    def _render_legend(self):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        lines = []
+        for index, name in enumerate(self.phases + ["total"]):
+            color = PHASE_COLORS[index % len(PHASE_COLORS)] if name != "total" else (255, 255, 255)
+            text = f"{name}: {self.mean(name):.2f} / p95 {self.percentile(name, 95):.2f} / p99 {self.percentile(name, 99):.2f} ms"
+            lines.append(self._font.render(text, True, color))
+
+        width = max(line.get_width() for line in lines) + 8
+        height = sum(line.get_height() for line in lines) + 8
+        legend = pygame.Surface((width, height))
+        legend.fill((20, 20, 20))
+        offset = 4
+        for line in lines:
+            legend.blit(line, (4, offset))
+            offset += line.get_height()
+        return legend
@@ -0,0 +1,187 @@
+"""Запись и повтор ввода игрока.
+
+World.step() зависит только от ввода и от зерна случайности (world.seed).
+Если записать и то, и другое, любую сессию — с багом или с просадкой FPS —
+можно прокрутить заново точь-в-точь, в окне или без окна и без ограничения FPS.
+
+Формат файла (все числа little-endian):
+
+    заголовок:  b"NCRP", версия (1 байт), зерно (4 байта), размер пула снарядов (2 байта)
+    каждый шаг: флаги (1 байт) и, если был выстрел, точка прицела x, y (по 2 байта)
+
+Шаг без выстрела — 1 байт, минута игры — около 4 КБ.
+
+Запись:    python game.py --record session.rec
+Повтор:    python replay.py session.rec              # в окне, 60 FPS
+           python replay.py session.rec --headless   # без окна, на скорость
+"""
+import os
+import struct
+
+MAGIC = b"NCRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBIH")
+POINT = struct.Struct("<hh")
+
+# Биты в байте флагов
+LEFT = 1
+RIGHT = 2
+JUMP = 4
+RESTART = 8
+QUIT = 16
+PAUSE = 32
+SHOOT = 64
+
+
+class InputRecorder:
+    """Пишет ввод каждого шага симуляции в файл."""
+
+    def __init__(self, path, seed, max_projectiles):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, max_projectiles))
+        self.steps = 0
+
+    def record(self, inputs):
+        flags = 0
+        if inputs.left:
+            flags |= LEFT
+        if inputs.right:
+            flags |= RIGHT
+        if inputs.jump:
+            flags |= JUMP
+        if inputs.restart:
+            flags |= RESTART
+        if inputs.quit:
+            flags |= QUIT
+        if inputs.pause:
+            flags |= PAUSE
+        if inputs.shoot is not None:
+            flags |= SHOOT
+        self.file.write(bytes((flags,)))
+        if inputs.shoot is not None:
+            self.file.write(POINT.pack(*inputs.shoot))
+        self.steps += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Replay:
+    """Прочитанная запись: зерно, размер пула и ввод по шагам."""
+
+    def __init__(self, seed, max_projectiles, inputs):
+        self.seed = seed
+        self.max_projectiles = max_projectiles
+        self.inputs = inputs
+
+    def __len__(self):
+        return len(self.inputs)
+
+
+def load_replay(path):
+    """Читает файл записи и возвращает Replay со списком FrameInput."""
+    from game import FrameInput
+
+    with open(path, "rb") as file:
+        data = file.read()
+
+    magic, version, seed, max_projectiles = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: это не файл записи игры")
+    if version != VERSION:
+        raise ValueError(f"{path}: версия записи {version}, поддерживается {VERSION}")
+
+    inputs = []
+    pos = HEADER.size
+    size = len(data)
+    while pos < size:
+        flags = data[pos]
+        pos += 1
+        shoot = None
+        if flags & SHOOT:
+            shoot = POINT.unpack_from(data, pos)
+            pos += POINT.size
+        inputs.append(FrameInput(
+            left=bool(flags & LEFT),
+            right=bool(flags & RIGHT),
+            jump=bool(flags & JUMP),
+            shoot=shoot,
+            restart=bool(flags & RESTART),
+            quit=bool(flags & QUIT),
+            pause=bool(flags & PAUSE),
+        ))
+    return Replay(seed, max_projectiles, inputs)
+
+
+def play(replay, screen=None, fps=None):
+    """Прокручивает запись через World.step(). Возвращает (World, время каждого шага в мс).
+
+    screen — куда рисовать (None — не рисовать); fps — ограничение скорости
+    (None — как можно быстрее).
+    """
+    import time
+
+    import pygame
+    from game import AssetLoader, World
+
+    world = World(AssetLoader(), max_projectiles=replay.max_projectiles, seed=replay.seed)
+    clock = pygame.time.Clock()
+    step_times = []
+
+    for inputs in replay.inputs:
+        start = time.perf_counter()
+        world.step(inputs)
+        step_times.append((time.perf_counter() - start) * 1000)
+
+        if screen is not None:
+            pygame.event.pump()
+            world.draw(screen)
+            pygame.display.flip()
+        if fps:
+            clock.tick(fps)
+        if not world.running:
+            break
+
+    return world, step_times
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Повтор записанной сессии игры")
+    parser.add_argument("path", help="файл записи (python game.py --record ...)")
+    parser.add_argument("--headless", action="store_true", help="без окна и без ограничения FPS")
+    parser.add_argument("--uncapped", action="store_true", help="в окне, но без ограничения FPS")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+    from game import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+
+    replay = load_replay(args.path)
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(f"Повтор: {args.path}")
+
+    fps = None if args.headless or args.uncapped else FPS
+    world, step_times = play(replay, None if args.headless else screen, fps)
+
+    step_times.sort()
+    mean = sum(step_times) / len(step_times) if step_times else 0
+    p99 = step_times[int(len(step_times) * 0.99)] if step_times else 0
+    print(f"Шагов: {len(step_times)} из {len(replay)}, зерно {replay.seed}")
+    print(f"Шаг симуляции: среднее {mean:.3f} мс, p99 {p99:.3f} мс")
+    print(f"Убито врагов: {world.kills}, проигрышей: {world.deaths}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
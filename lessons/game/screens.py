@@ -0,0 +1,74 @@
+"""Состояния экрана и готовые оверлеи.
+
+Игра бывает в одном из состояний: идёт (PLAYING), на паузе (PAUSED)
+или окончена (GAME_OVER). Во всех, кроме PLAYING, картинка не меняется:
+симуляция стоит, а поверх замершей сцены лежит затемнение с надписями.
+
+Такой оверлей собирается один раз — затемнение и все надписи сразу
+в одну картинку — и дальше просто копируется на экран:
+
+    game_over = OverlayScreen([("ИГРА ОКОНЧЕНА!", WHITE, 74, 0)])
+    game_over.draw(screen, text_cache)
+
+Пока картинки грузятся (loading.py), показывается LoadingScreen с полосой прогресса.
+"""
+import pygame
+
+from surfaces import to_display_format
+
+PLAYING = "playing"
+PAUSED = "paused"
+GAME_OVER = "game_over"
+
+
+class OverlayScreen:
+    """Затемнение и строки текста по центру, собранные в одну картинку."""
+
+    def __init__(self, lines, shade=(0, 0, 0, 180)):
+        self.lines = lines  # [(текст, цвет, размер шрифта, сдвиг от центра по y)]
+        self.shade = shade
+        self.image = None
+
+    def build(self, size, text_cache):
+        """Собирает картинку оверлея для экрана размера size."""
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.fill(self.shade)
+        center_x = size[0] // 2
+        center_y = size[1] // 2
+        for text, color, font_size, dy in self.lines:
+            rendered = text_cache.render(text, color, size=font_size)
+            image.blit(rendered, rendered.get_rect(center=(center_x, center_y + dy)))
+        return to_display_format(image)
+
+    def draw(self, surface, text_cache):
+        """Рисует оверлей; собирает его только в первый раз или при смене размера."""
+        if self.image is None or self.image.get_size() != surface.get_size():
+            self.image = self.build(surface.get_size(), text_cache)
+        return surface.blit(self.image, (0, 0))
+
+
+class LoadingScreen:
+    """Экран загрузки: надпись и полоса прогресса."""
+
+    def __init__(self, title="Загрузка...", color=(255, 255, 255), background=(0, 0, 0)):
+        self.title = title
+        self.color = color
+        self.background = background
+
+    def draw(self, surface, text_cache, progress):
+        """Рисует экран для progress от 0 до 1."""
+        surface.fill(self.background)
+        width, height = surface.get_size()
+        title = text_cache.render(self.title, self.color, size=48)
+        surface.blit(title, title.get_rect(center=(width // 2, height // 2 - 50)))
+
+        bar = pygame.Rect(0, 0, width // 2, 24)
+        bar.center = (width // 2, height // 2 + 10)
+        pygame.draw.rect(surface, self.color, bar, 2)
+        filled = bar.inflate(-8, -8)
+        filled.width = int(filled.width * max(0.0, min(progress, 1.0)))
+        if filled.width:
+            surface.fill(self.color, filled)
+
+        percent = text_cache.render(f"{int(progress * 100)}%", self.color, size=30)
+        surface.blit(percent, percent.get_rect(center=(width // 2, bar.bottom + 30)))
@@ -0,0 +1,88 @@
+"""Пространственная хеш-сетка для быстрого поиска столкновений.
+
+Проверять каждый снаряд с каждым врагом — это P × E проверок за кадр.
+Сетка делит экран на клетки; каждый объект записывается в клетки, которые
+накрывает его прямоугольник. Чтобы узнать, кто пересекается с rect,
+достаточно посмотреть только соседей по клеткам.
+
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(enemies)                 # раз в кадр, после движения
+    for enemy in grid.query(projectile.rect):
+        ...
+"""
+
+
+class SpatialHash:
+    """Равномерная сетка: клетка (cx, cy) -> список (объект, прямоугольник)."""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        x0 = rect.left // size
+        y0 = rect.top // size
+        # right/bottom не входят в прямоугольник — поэтому "- 1"
+        x1 = (rect.right - 1) // size
+        y1 = (rect.bottom - 1) // size
+        return x0, y0, x1, y1
+
+    def insert(self, item, rect):
+        """Записывает объект во все клетки, которые накрывает rect."""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        entry = (item, rect)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def remove(self, item, rect):
+        """Убирает объект из сетки (rect — тот, с которым его вставляли)."""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    bucket[:] = [entry for entry in bucket if entry[0] is not item]
+
+    def rebuild(self, items):
+        """Пересобирает сетку из объектов с атрибутом .rect."""
+        self.cells.clear()
+        for item in items:
+            self.insert(item, item.rect)
+
+    def query(self, rect):
+        """Объекты, чьи прямоугольники пересекаются с rect (без повторов)."""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self.cells
+
+        # Частый случай — rect целиком в одной клетке: повторов быть не может
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            return [item for item, item_rect in bucket if rect.colliderect(item_rect)]
+
+        found = []
+        seen = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item, item_rect in bucket:
+                    key = id(item)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if rect.colliderect(item_rect):
+                        found.append(item)
+        return found
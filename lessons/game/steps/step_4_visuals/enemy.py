@@ -16,7 +16,7 @@ class Enemy:
     """Враг, который появляется с краёв экрана и идёт к игроку."""
 
     # >>> ШАГ 4: добавлен параметр sprite=None (раньше было только x, y)
-    def __init__(self, x, y, sprite=None):
+    def __init__(self, x, y, sprite=None, sprite_left=None):
         self.x = x
         self.y = y
         self.width = ENEMY_WIDTH
@@ -24,6 +24,12 @@ class Enemy:
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         # >>> ШАГ 4: сохраняем спрайт (раньше этой строки не было)
         self.sprite = sprite
+        # Спрайт "смотрит влево" берём готовым из атласа AssetLoader.
+        # Если его не передали — отражаем один раз здесь, а не в каждом кадре.
+        if sprite_left is None and sprite is not None:
+            sprite_left = pygame.transform.flip(sprite, True, False)
+        self.sprites = {1: sprite, -1: sprite_left}
+        self.dead = False  # Помечен на удаление (см. lifecycle.py)
 
         # Определяем начальное направление по стороне спавна:
         # если появился справа — идём влево (-1), иначе вправо (1)
@@ -44,13 +50,9 @@ class Enemy:
 
     # >>> ШАГ 4: раньше draw() был одной строкой: pygame.draw.rect(surface, (0,0,255), self.rect)
     def draw(self, surface):
-        """Рисует врага. Если есть спрайт — отражает по направлению."""
+        """Рисует врага. Если есть спрайт — берёт готовый вариант по направлению."""
         if self.sprite:
-            if self.direction == -1:
-                flipped = pygame.transform.flip(self.sprite, True, False)
-                surface.blit(flipped, (self.x, self.y))
-            else:
-                surface.blit(self.sprite, (self.x, self.y))
+            surface.blit(self.sprites[self.direction], (self.x, self.y))
         else:
             pygame.draw.rect(surface, (0, 0, 255), self.rect)
 
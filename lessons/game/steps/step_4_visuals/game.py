@@ -1,7 +1,16 @@
+import os
+import sys
 import pygame
 import random
 from enemy import Enemy, ENEMY_HEIGHT, ENEMY_WIDTH, SPAWN_DELAY, MAX_ENEMIES
 
+# Общие модули игры лежат в lessons/game (на две папки выше)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from profiler import FrameProfiler
+from hud import TextCache, HudLabel
+from surfaces import FormatAudit, to_display_format
+from lifecycle import EntityList
+
 DEBUG = False
 
 # ===== КОНСТАНТЫ ЭКРАНА =====
@@ -26,6 +35,16 @@ SKY_BLUE = (135, 200, 235)       # Цвет неба (заглушка, если
 GROUND_COLOR = (100, 70, 40)     # Цвет земли (заглушка, если нет ground.png)
 GROUND_Y = SCREEN_HEIGHT - 100   # Линия земли на 100 пикселей от низа
 
+# ===== СЛОИ ФОНА =====
+# (имя спрайта, y, скорость параллакса). Скорость 0 — слой неподвижен,
+# такие слои склеиваются в одну картинку. 0.3 — слой сдвигается на 30%
+# от движения игрока (дальние холмы). Слоя без файла просто нет.
+BACKGROUND_LAYERS = [
+    ("sky", 0, 0),
+    ("hills", GROUND_Y - 150, 0.3),
+    ("ground", GROUND_Y, 0),
+]
+
 # ===== КОНСТАНТЫ СНАРЯДА =====
 PROJECTILE_SPEED = 10
 MAX_COUNT_PROJECTILES = 3
@@ -40,7 +59,11 @@ class AssetLoader:
 
     def __init__(self):
         self.sprites = {}
+        self.atlas = {}  # (имя, направление) -> готовый спрайт
+        self.backgrounds = {}  # (слои, размер экрана) -> готовый Background
+        self.background_layers = BACKGROUND_LAYERS
         self.load_all()
+        self.build_atlas(["player_idle", "player_walk", "player_jump", "projectile", "enemy"])
 
     def load_image(self, path, width, height):
         """Загружает изображение или возвращает заглушку."""
@@ -51,20 +74,29 @@ class AssetLoader:
             image = pygame.Surface((width, height), pygame.SRCALPHA)
             pygame.draw.rect(image, (100, 100, 100), (5, 5, width - 10, height - 10), border_radius=8)
             pygame.draw.circle(image, (255, 255, 255), (15, 15), 5)
-        return pygame.transform.scale(image, (width, height))
+        # Масштабированная копия — тоже в формате экрана, иначе blit будет медленным
+        return to_display_format(pygame.transform.scale(image, (width, height)))
 
     # >>> ШАГ 4: новый метод — загрузка фонов (раньше был только load_image)
     def load_background(self, path, width, height, fallback_color):
         """Загружает фоновое изображение или создаёт заливку цветом."""
         try:
             image = pygame.image.load(path).convert()
-            return pygame.transform.scale(image, (width, height))
+            return to_display_format(pygame.transform.scale(image, (width, height)))
         except (FileNotFoundError, pygame.error):
             print(f"Файл не найден: {path}. Используем заливку цветом.")
-            surface = pygame.Surface((width, height))
+            surface = pygame.Surface((width, height)).convert()
             surface.fill(fallback_color)
             return surface
 
+    def load_layer(self, path, width, height):
+        """Загружает прозрачный слой фона. Нет файла — слоя нет (None)."""
+        try:
+            image = pygame.image.load(path).convert_alpha()
+        except (FileNotFoundError, pygame.error):
+            return None
+        return to_display_format(pygame.transform.scale(image, (width, height)))
+
     def load_all(self):
         """Загружаем все спрайты и фоны для игры."""
         # Спрайты персонажей
@@ -79,10 +111,98 @@ class AssetLoader:
         ground_height = SCREEN_HEIGHT - GROUND_Y
         self.sprites["sky"] = self.load_background("assets/sky.png", SCREEN_WIDTH, SCREEN_HEIGHT, SKY_BLUE)
         self.sprites["ground"] = self.load_background("assets/ground.png", SCREEN_WIDTH, ground_height, GROUND_COLOR)
+        # Необязательный слой параллакса: холмы с прозрачным небом
+        self.sprites["hills"] = self.load_layer("assets/hills.png", SCREEN_WIDTH, 150)
+
+    def build_atlas(self, names):
+        """Заранее готовим отражённые копии спрайтов, чтобы не делать flip каждый кадр."""
+        for name in names:
+            image = self.sprites[name]
+            self.atlas[(name, "right")] = image
+            self.atlas[(name, "left")] = to_display_format(pygame.transform.flip(image, True, False))
+
+    def add_scaled(self, name, width, height):
+        """Добавляет в атлас копию спрайта другого размера (в обе стороны)."""
+        for direction in ("right", "left"):
+            image = pygame.transform.scale(self.atlas[(name, direction)], (width, height))
+            self.atlas[(name, direction, (width, height))] = to_display_format(image)
+
+    def set_background_layers(self, layers):
+        """Смена темы фона. Готовые фоны старой темы остаются в кэше."""
+        self.background_layers = layers
+
+    def get_background(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """Готовый фон для экрана size. Собирается один раз на тему и размер."""
+        key = (tuple(self.background_layers), size)
+        background = self.backgrounds.get(key)
+        if background is None:
+            background = self.compose_background(size)
+            self.backgrounds[key] = background
+        return background
+
+    def compose_background(self, size):
+        """Склеивает неподвижные слои в одну картинку в формате экрана.
+
+        Слои с параллаксом готовятся отдельно: каждый уже в формате экрана
+        и нужного размера, так что в кадре остаётся только blit.
+        """
+        scale_x = size[0] / SCREEN_WIDTH
+        scale_y = size[1] / SCREEN_HEIGHT
+
+        static = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        parallax = []
+        for name, y, speed in self.background_layers:
+            image = self.sprites.get(name)
+            if image is None:
+                continue
+            if speed == 0:
+                static.blit(image, (0, y))
+            else:
+                width = round(image.get_width() * scale_x)
+                height = round(image.get_height() * scale_y)
+                layer = pygame.transform.smoothscale(image, (width, height)).convert_alpha()
+                parallax.append((layer, round(y * scale_y), speed))
+
+        if size != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            static = pygame.transform.smoothscale(static, size)
+        return Background(static.convert(), parallax)
+
+    def audit(self, audit):
+        """Проверяет, что все картинки загрузчика в формате экрана (см. surfaces.py)."""
+        audit.check_all("sprites/", self.sprites)
+        audit.check_all("atlas/", self.atlas)
+        for key, background in self.backgrounds.items():
+            audit.check(f"background/{key[1]}", background.static)
+            for index, (layer, y, speed) in enumerate(background.parallax):
+                audit.check(f"background/{key[1]}/layer{index}", layer)
+
+    def get(self, name, direction="right", size=None):
+        """Возвращает спрайт по имени, направлению и размеру (если задан)."""
+        key = (name, direction) if size is None else (name, direction, size)
+        image = self.atlas.get(key)
+        if image is None:
+            image = self.sprites.get(name, None)
+        return image
+
 
-    def get(self, name):
-        """Возвращает спрайт по имени."""
-        return self.sprites.get(name, None)
+# =============================================================================
+# КЛАСС: Готовый фон
+# =============================================================================
+class Background:
+    """Фон из AssetLoader.get_background(): одна склеенная картинка и слои параллакса."""
+
+    def __init__(self, static, parallax):
+        self.static = static      # Все неподвижные слои — один blit
+        self.parallax = parallax  # [(картинка, y, скорость)]
+
+    def draw(self, surface, camera_x=0):
+        surface.blit(self.static, (0, 0))
+        for image, y, speed in self.parallax:
+            # Слой повторяется по горизонтали: рисуем его дважды со сдвигом
+            width = image.get_width()
+            x = -int(camera_x * speed) % width
+            surface.blit(image, (x - width, y))
+            surface.blit(image, (x, y))
 
 
 # =============================================================================
@@ -150,17 +270,15 @@ class Player:
 
         # Приоритет: прыжок > бег > стоять
         if self.is_jumping:
-            self.current_sprite = self.assets.get("player_jump")
+            name = "player_jump"
         elif moving:
-            self.current_sprite = self.assets.get("player_walk")
+            name = "player_walk"
         else:
-            self.current_sprite = self.assets.get("player_idle")
+            name = "player_idle"
 
-        # Отражаем спрайт, если смотрим влево
-        if self.direction == "left":
-            self.flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
-        else:
-            self.flipped_sprite = self.current_sprite
+        # Отражённый спрайт уже лежит в атласе — просто берём нужный вариант
+        self.current_sprite = self.assets.get(name)
+        self.flipped_sprite = self.assets.get(name, self.direction)
 
     def draw(self, surface):
         """Рисует игрока на экране."""
@@ -292,17 +410,35 @@ player = Player(x=100, y=GROUND_Y - PLAYER_SIZE, assets=asset_loader)
 
 # >>> ШАГ 4: достаём спрайт врага и фоны из AssetLoader (раньше этого блока не было)
 enemy_sprite = asset_loader.get("enemy")
-sky_surface = asset_loader.get("sky")
-ground_surface = asset_loader.get("ground")
+enemy_sprite_left = asset_loader.get("enemy", "left")  # Отражён заранее в атласе
 
-enemies = []       # Список активных врагов
+enemies = EntityList()  # Активные враги: удаление пометкой, один проход за кадр
 spawn_timer = 0    # Таймер спавна врагов
 projectiles = []   # Список активных снарядов
 
 clock = pygame.time.Clock()
+profiler = FrameProfiler()  # F3 — график времени кадра, F4 — выгрузка трассы
+
+# Текст HUD: шрифты создаются один раз, надписи рендерятся только при смене значения
+text_cache = TextCache()
+# >>> ШАГ 4: цвет текста BLACK вместо (0, 0, 255) — синий плохо видно на голубом фоне
+count_label = HudLabel(text_cache, "Снарядов: {}", BLACK)
+enemy_label = HudLabel(text_cache, "Врагов: {} / {}", BLACK)
 running = True
 game_over = False
 
+# Затемнение для Game Over создаём один раз, а не каждый кадр
+game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+game_over_overlay.fill((0, 0, 0, 180))  # Полупрозрачный чёрный фон
+
+if DEBUG:
+    # Отчёт: какие картинки не в формате экрана (их blit медленный)
+    format_audit = FormatAudit()
+    asset_loader.get_background(screen.get_size())
+    asset_loader.audit(format_audit)
+    format_audit.check("game_over_overlay", game_over_overlay)
+    print(format_audit.report())
+
 
 def check_collisions(rect1, rect2):
     """Проверяет столкновение двух прямоугольников."""
@@ -314,67 +450,75 @@ def check_collisions(rect1, rect2):
 # =============================================================================
 while running:
     clock.tick(60)  # 60 кадров в секунду
+    profiler.begin_frame()
 
     # --- Отрисовка фона ---
     # >>> ШАГ 4: было screen.fill(WHITE) + pygame.draw.line(красная линия)
-    screen.blit(sky_surface, (0, 0))               # Небо
-    screen.blit(ground_surface, (0, GROUND_Y))     # Земля
+    # Небо и земля заранее склеены в одну картинку (собирается один раз)
+    with profiler.section("background"):
+        background = asset_loader.get_background(screen.get_size())
+        background.draw(screen, player.x)
 
     # --- Обработка событий ---
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        if event.type == pygame.KEYDOWN:
-            # Пробел — прыжок
-            if event.key == pygame.K_SPACE and not game_over:
-                player.jump()
-            # R — рестарт после Game Over
-            elif event.key == pygame.K_r and game_over:
-                game_over = False
-                player.x = 100
-                player.y = GROUND_Y - PLAYER_SIZE
-                player.vel_y = 0
-                player.is_jumping = False
-                enemies.clear()
-                projectiles.clear()
-                spawn_timer = 0
-
-        # Левая кнопка мыши — выстрел
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not game_over:
-            active_count = len([p for p in projectiles if p.active])
-
-            if active_count < MAX_COUNT_PROJECTILES:
-                px, py = player.center
-                mouse_pos = pygame.mouse.get_pos()
-                projectile = Projectile(px, py, mouse_pos)
-                projectiles.append(projectile)
-
-    # --- Управление движением (зажатые клавиши) ---
-    keys = pygame.key.get_pressed()
-    if not game_over:
-        if keys[pygame.K_LEFT]:
-            player.move("left")
-        if keys[pygame.K_RIGHT]:
-            player.move("right")
+    with profiler.section("events"):
+        for event in pygame.event.get():
+            profiler.handle_event(event)
+
+            if event.type == pygame.QUIT:
+                running = False
+
+            if event.type == pygame.KEYDOWN:
+                # Пробел — прыжок
+                if event.key == pygame.K_SPACE and not game_over:
+                    player.jump()
+                # R — рестарт после Game Over
+                elif event.key == pygame.K_r and game_over:
+                    game_over = False
+                    player.x = 100
+                    player.y = GROUND_Y - PLAYER_SIZE
+                    player.vel_y = 0
+                    player.is_jumping = False
+                    enemies.clear()
+                    projectiles.clear()
+                    spawn_timer = 0
+
+            # Левая кнопка мыши — выстрел
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not game_over:
+                active_count = len([p for p in projectiles if p.active])
+
+                if active_count < MAX_COUNT_PROJECTILES:
+                    px, py = player.center
+                    mouse_pos = pygame.mouse.get_pos()
+                    projectile = Projectile(px, py, mouse_pos)
+                    projectiles.append(projectile)
+
+        # --- Управление движением (зажатые клавиши) ---
+        keys = pygame.key.get_pressed()
+        if not game_over:
+            if keys[pygame.K_LEFT]:
+                player.move("left")
+            if keys[pygame.K_RIGHT]:
+                player.move("right")
 
     # --- Обновление игрока ---
-    if not game_over:
-        player.apply_gravity()
-        player.update_animation()
+    with profiler.section("player"):
+        if not game_over:
+            player.apply_gravity()
+            player.update_animation()
 
     player_rect = player.rect
 
     # --- Обновление снарядов ---
-    for projectile in projectiles:
-        projectile.update()
-        projectile.draw(screen)
-        # Подбор застрявшего снаряда при приближении
-        if projectile.is_close_to_player(player_rect):
-            projectile.reset()
+    with profiler.section("projectiles"):
+        for projectile in projectiles:
+            projectile.update()
+            projectile.draw(screen)
+            # Подбор застрявшего снаряда при приближении
+            if projectile.is_close_to_player(player_rect):
+                projectile.reset()
 
-    # Убираем неактивные снаряды из списка
-    projectiles = [p for p in projectiles if p.active]
+        # Убираем неактивные снаряды из списка
+        projectiles = [p for p in projectiles if p.active]
 
     # --- Спавн врагов (с лимитом) ---
     spawn_timer += 1
@@ -390,55 +534,64 @@ while running:
         en_y = GROUND_Y - ENEMY_HEIGHT  # На уровне земли
 
         # >>> ШАГ 4: передаём спрайт (раньше было просто Enemy(en_x, en_y))
-        new_enemy = Enemy(en_x, en_y, sprite=enemy_sprite)
-        enemies.append(new_enemy)
+        new_enemy = Enemy(en_x, en_y, sprite=enemy_sprite, sprite_left=enemy_sprite_left)
+        enemies.spawn(new_enemy)  # Появится в конце кадра, после sweep()
 
     # --- Обновление врагов ---
-    for enemy in enemies[:]:  # [:] — копия списка, чтобы безопасно удалять
-        enemy.position_update(player.x)
-        enemy.draw(screen)
-
-        # Столкновение игрок-враг
-        if check_collisions(player.rect, enemy.rect) and not DEBUG:
-            game_over = True
-
-        # Столкновение снаряд-враг (только летящие снаряды наносят урон!)
-        for projectile in projectiles:
-            if projectile.can_damage and check_collisions(projectile.rect, enemy.rect):
-                projectile.reset()
-                enemies.remove(enemy)
-                break  # Враг уже удалён — выходим из цикла снарядов
-
-        # Удаляем врага, если ушёл далеко за экран
-        if enemy in enemies and enemy.is_off_screen():
-            enemies.remove(enemy)
-
-    player.draw(screen)
+    # Движение и отрисовка отдельно от столкновений — так профайлер видит,
+    # сколько стоит сама проверка "каждый враг с каждым снарядом"
+    with profiler.section("enemies"):
+        for enemy in enemies:
+            enemy.position_update(player.x)
+            enemy.draw(screen)
+
+    with profiler.section("collisions"):
+        # Во время цикла никого не удаляем — только помечаем (kill),
+        # поэтому копия списка enemies[:] не нужна
+        for enemy in enemies:
+            # Столкновение игрок-враг
+            if check_collisions(player.rect, enemy.rect) and not DEBUG:
+                game_over = True
+
+            # Столкновение снаряд-враг (только летящие снаряды наносят урон!)
+            for projectile in projectiles:
+                if projectile.can_damage and check_collisions(projectile.rect, enemy.rect):
+                    projectile.reset()
+                    enemies.kill(enemy)
+                    break  # Враг уже убит — выходим из цикла снарядов
+
+            # Враг ушёл далеко за экран
+            if enemy.is_off_screen():
+                enemies.kill(enemy)
+
+        # Убитые уходят из списка одним проходом, новые враги добавляются
+        enemies.sweep()
+
+    with profiler.section("player"):
+        player.draw(screen)
 
     # --- Экран Game Over ---
-    if game_over:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Полупрозрачный чёрный фон
-        screen.blit(overlay, (0, 0))
+    with profiler.section("game_over"):
+        if game_over:
+            screen.blit(game_over_overlay, (0, 0))
 
-        font = pygame.font.Font(None, 74)
-        game_over_text = font.render("ИГРА ОКОНЧЕНА!", True, WHITE)
-        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(game_over_text, text_rect)
+            game_over_text = text_cache.render("ИГРА ОКОНЧЕНА!", WHITE, size=74)
+            text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            screen.blit(game_over_text, text_rect)
 
-        font_small = pygame.font.Font(None, 36)
-        restart_text = font_small.render("Нажми R для рестарта", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        screen.blit(restart_text, restart_rect)
+            restart_text = text_cache.render("Нажми R для рестарта", WHITE, size=36)
+            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+            screen.blit(restart_text, restart_rect)
 
     # --- HUD: счётчик снарядов и врагов ---
-    active_count = len([p for p in projectiles if p.active])
-    font = pygame.font.Font(None, 36)
-    # >>> ШАГ 4: цвет текста BLACK вместо (0, 0, 255) — синий плохо видно на голубом фоне
-    count_text = font.render(f"Снарядов: {active_count}", True, BLACK)
-    screen.blit(count_text, (10, 10))
+    with profiler.section("hud"):
+        active_count = len([p for p in projectiles if p.active])
+        count_label.draw(screen, (10, 10), active_count)
+        enemy_label.draw(screen, (10, 40), len(enemies), MAX_ENEMIES)
+
+    profiler.draw_overlay(screen)
 
-    enemy_text = font.render(f"Врагов: {len(enemies)} / {MAX_ENEMIES}", True, BLACK)
-    screen.blit(enemy_text, (10, 40))
+    with profiler.section("flip"):
+        pygame.display.flip()
 
-    pygame.display.flip()
+    profiler.end_frame()
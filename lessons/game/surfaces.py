@@ -0,0 +1,83 @@
+"""Формат пикселей картинок и проверка "медленных" blit.
+
+Если формат картинки (глубина цвета, порядок каналов) не совпадает
+с форматом экрана, pygame при каждом blit переводит её попиксельно —
+и так каждый кадр. convert() / convert_alpha() делают это один раз.
+
+    image = to_display_format(pygame.transform.scale(image, size))
+
+    audit = FormatAudit()
+    assets.audit(audit)          # AssetLoader проверяет все свои картинки
+    print(audit.report())        # только те, что не в формате экрана
+"""
+import pygame
+
+
+def display_ready():
+    """Есть ли окно (без него convert() бросает pygame.error)."""
+    return pygame.display.get_surface() is not None
+
+
+def has_alpha(surface):
+    return bool(surface.get_flags() & pygame.SRCALPHA)
+
+
+def to_display_format(surface):
+    """Копия в формате экрана: convert_alpha() для прозрачных, иначе convert().
+
+    Если картинка уже в нужном формате или окна ещё нет — возвращает её же.
+    """
+    if not display_ready() or is_display_format(surface):
+        return surface
+    if has_alpha(surface):
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def _reference_formats():
+    """(глубина, маски) экрана для непрозрачных и прозрачных картинок."""
+    probe = pygame.Surface((1, 1))
+    opaque = probe.convert()
+    alpha = probe.convert_alpha()
+    return ((opaque.get_bitsize(), opaque.get_masks()),
+            (alpha.get_bitsize(), alpha.get_masks()))
+
+
+def is_display_format(surface):
+    """Совпадает ли формат картинки с форматом экрана (blit без перевода)."""
+    if not display_ready():
+        return True  # Сравнивать не с чем
+    opaque, alpha = _reference_formats()
+    reference = alpha if has_alpha(surface) else opaque
+    return (surface.get_bitsize(), surface.get_masks()) == reference
+
+
+class FormatAudit:
+    """Собирает картинки, которые при blit будут переводиться попиксельно."""
+
+    def __init__(self):
+        self.checked = 0
+        self.problems = []  # (имя, размер, глубина, маски)
+
+    def check(self, name, surface):
+        if surface is None:
+            return
+        self.checked += 1
+        if not is_display_format(surface):
+            self.problems.append((name, surface.get_size(), surface.get_bitsize(), surface.get_masks()))
+
+    def check_all(self, prefix, surfaces):
+        """Проверяет словарь картинок; ключи попадают в имя."""
+        for key, surface in surfaces.items():
+            self.check(f"{prefix}{key}", surface)
+
+    @property
+    def ok(self):
+        return not self.problems
+
+    def report(self):
+        """Текстовый отчёт: что не в формате экрана и почему."""
+        lines = [f"Проверено картинок: {self.checked}, не в формате экрана: {len(self.problems)}"]
+        for name, size, bits, masks in self.problems:
+            lines.append(f"  {name}: {size[0]}x{size[1]}, {bits} бит, маски {masks}")
+        return "\n".join(lines)
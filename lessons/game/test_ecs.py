@@ -0,0 +1,29 @@
+"""Пресет "game" в ecs.py — та же игра, что World в game.py.
+
+Запуск (из корня репозитория или из lessons/game):
+    python -m pytest lessons/game/test_ecs.py
+"""
+import os
+
+# Пустой видеодрайвер SDL — окно не создаётся. Ставим ДО импорта pygame.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+import ecs
+import game
+import headless
+
+FRAMES = 6000  # 100 секунд игры: десятки врагов и выстрелов
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_game_preset_kills_match_world(seed, monkeypatch):
+    """С тем же зерном и тем же ботом ECS убивает столько же врагов, сколько World."""
+    monkeypatch.setattr(game, "ASSET_CACHE", False)  # Не писать .asset_cache из теста
+    world = headless.run(FRAMES, seed)
+    ecs_game, _ = ecs.run(FRAMES, "game", seed)
+
+    assert world.kills > 0
+    assert (ecs_game.kills, ecs_game.deaths) == (world.kills, world.deaths)
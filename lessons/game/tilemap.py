@@ -0,0 +1,473 @@
+"""Уровни из тайлов с прокруткой: карта из файла, камера и отсечение.
+
+Уровень — текстовый файл в папке levels/, один символ на тайл:
+
+    .  пусто            #  земля (твёрдая)
+    =  платформа        P  старт игрока
+    E  враг (ходит)     F  летающий враг (летит к игроку в обход стен)
+
+Карта шириной в тысячи тайлов не рисуется и не считается целиком:
+
+- тайлы заранее нарисованы в куски (chunk) по CHUNK_TILES столбцов,
+  на экран копируются только куски, попавшие в камеру; куски собираются
+  при первом показе и хранятся в небольшом кэше (LRU);
+- столкновения — по сетке: проверяются только тайлы под прямоугольником
+  сущности, без списка всех тайлов;
+- враги лежат по корзинам кусков, обновляются и рисуются только те,
+  что рядом с камерой. Остальные стоят, пока игрок не подойдёт;
+- летающие враги ищут путь по общему полю направлений (flowfield.py):
+  один поиск в ширину на всех, а не по поиску на каждого.
+
+Поэтому кадр на уровне в 600 экранов стоит столько же, сколько на одном.
+
+    python tilemap.py                         # levels/level1.txt в окне
+    python tilemap.py --headless --frames 6000
+"""
+import os
+from collections import OrderedDict
+
+import pygame
+
+from flowfield import FlowField
+from surfaces import to_display_format
+
+TILE_SIZE = 40
+CHUNK_TILES = 16       # Столбцов тайлов в одном заранее нарисованном куске
+MAX_CHUNKS = 8         # Сколько кусков держать в кэше (на экране 2–3)
+ACTIVE_MARGIN = 1      # Сколько кусков за краем камеры ещё живут
+
+EMPTY = "."
+GROUND = "#"
+PLATFORM = "="
+PLAYER_START = "P"
+ENEMY_SPAWN = "E"
+FLYER_SPAWN = "F"
+SOLID = frozenset((GROUND, PLATFORM))
+
+SKY = (190, 225, 255)
+TILE_COLORS = {
+    GROUND: ((130, 90, 50), (70, 170, 60)),   # земля и трава сверху
+    PLATFORM: ((120, 120, 130), (90, 90, 100)),
+}
+
+GRAVITY = 1
+MAX_FALL = TILE_SIZE - 1  # Быстрее — можно пролететь тайл насквозь
+PLAYER_SPEED = 5
+JUMP_HEIGHT = 15
+ENEMY_SPEED = 1.5
+FLYER_SPEED = 1.5   # Медленнее игрока: от летающего врага можно убежать
+FIELD_RADIUS = 14   # Столбцов поля направлений в каждую сторону: полэкрана и запас
+FIELD_INTERVAL = 20  # Поле пересчитывается не чаще раза в столько шагов (треть секунды)
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+
+
+class TileMap:
+    """Сетка тайлов, куски для отрисовки и проверка столкновений."""
+
+    def __init__(self, rows, tile_size=TILE_SIZE, chunk_tiles=CHUNK_TILES, max_chunks=MAX_CHUNKS):
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.max_chunks = max_chunks
+        self.height = len(rows)
+        self.width = max(len(row) for row in rows)
+
+        # Сетка: строка -> bytearray, 1 — твёрдый тайл. Поиск тайла — два индекса
+        self.kinds = [row.ljust(self.width, EMPTY) for row in rows]
+        self.solid = [bytearray(1 if tile in SOLID else 0 for tile in row) for row in self.kinds]
+
+        self.spawns = {PLAYER_START: [], ENEMY_SPAWN: [], FLYER_SPAWN: []}
+        for row, line in enumerate(self.kinds):
+            for col, tile in enumerate(line):
+                if tile in self.spawns:
+                    self.spawns[tile].append((col * tile_size, row * tile_size))
+
+        self.chunks = OrderedDict()  # номер куска -> Surface (LRU)
+        self.tile_images = None
+
+    @classmethod
+    def load(cls, path, **options):
+        with open(path, encoding="utf-8") as file:
+            rows = [line.rstrip("\n") for line in file if line.strip()]
+        return cls(rows, **options)
+
+    @property
+    def pixel_width(self):
+        return self.width * self.tile_size
+
+    @property
+    def pixel_height(self):
+        return self.height * self.tile_size
+
+    @property
+    def chunk_width(self):
+        return self.chunk_tiles * self.tile_size
+
+    def is_solid(self, col, row):
+        """Твёрдый ли тайл. За левым и правым краем — стена, сверху и снизу — пусто."""
+        if col < 0 or col >= self.width:
+            return True
+        if row < 0 or row >= self.height:
+            return False
+        return self.solid[row][col] == 1
+
+    def solid_at(self, x, y):
+        return self.is_solid(int(x // self.tile_size), int(y // self.tile_size))
+
+    # ----- Столкновения -----
+
+    def move(self, body, dx, dy):
+        """Двигает тело на (dx, dy) с остановкой о твёрдые тайлы.
+
+        Сначала по x, потом по y — так тело скользит вдоль стен и пола.
+        Возвращает (упёрлось в стену, стоит на земле).
+        """
+        ts = self.tile_size
+        hit_wall = False
+        on_ground = False
+
+        if dx:
+            body.x += dx
+            top = int(body.y // ts)
+            bottom = int((body.y + body.h - 1) // ts)
+            if dx > 0:
+                col = int((body.x + body.w - 1) // ts)
+                if any(self.is_solid(col, row) for row in range(top, bottom + 1)):
+                    body.x = col * ts - body.w
+                    hit_wall = True
+            else:
+                col = int(body.x // ts)
+                if any(self.is_solid(col, row) for row in range(top, bottom + 1)):
+                    body.x = (col + 1) * ts
+                    hit_wall = True
+
+        if dy:
+            body.y += dy
+            left = int(body.x // ts)
+            right = int((body.x + body.w - 1) // ts)
+            if dy > 0:
+                row = int((body.y + body.h - 1) // ts)
+                if any(self.is_solid(col, row) for col in range(left, right + 1)):
+                    body.y = row * ts - body.h
+                    on_ground = True
+            else:
+                row = int(body.y // ts)
+                if any(self.is_solid(col, row) for col in range(left, right + 1)):
+                    body.y = (row + 1) * ts
+
+        return hit_wall, on_ground
+
+    # ----- Отрисовка -----
+
+    def build_tile_images(self):
+        ts = self.tile_size
+        images = {}
+        for kind, (fill, top) in TILE_COLORS.items():
+            # Два вида тайла: внутри толщи и верхний (с травой или кромкой)
+            image = pygame.Surface((ts, ts))
+            image.fill(fill)
+            images[kind, False] = to_display_format(image)
+            image = image.copy()
+            image.fill(top, (0, 0, ts, ts // 5))
+            images[kind, True] = to_display_format(image)
+        return images
+
+    def render_chunk(self, index):
+        """Рисует кусок карты целиком: небо и все его тайлы."""
+        if self.tile_images is None:
+            self.tile_images = self.build_tile_images()
+        ts = self.tile_size
+        surface = pygame.Surface((self.chunk_width, self.pixel_height))
+        surface.fill(SKY)
+        first = index * self.chunk_tiles
+        last = min(first + self.chunk_tiles, self.width)
+        for row, line in enumerate(self.kinds):
+            above = self.kinds[row - 1] if row else None
+            for col in range(first, last):
+                kind = line[col]
+                if kind not in TILE_COLORS:
+                    continue
+                top = above is None or above[col] != kind
+                surface.blit(self.tile_images[kind, top], ((col - first) * ts, row * ts))
+        return to_display_format(surface)
+
+    def chunk(self, index):
+        """Готовый кусок из кэша; самый давно не нужный выкидывается."""
+        surface = self.chunks.get(index)
+        if surface is None:
+            surface = self.chunks[index] = self.render_chunk(index)
+            if len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(index)
+        return surface
+
+    def visible_chunks(self, camera):
+        """Номера кусков, попавших в камеру."""
+        first = max(0, int(camera.x) // self.chunk_width)
+        last = min((int(camera.x) + camera.width - 1) // self.chunk_width,
+                   (self.width - 1) // self.chunk_tiles)
+        return range(first, last + 1)
+
+    def draw(self, surface, camera):
+        """Копирует на экран только видимые куски. Возвращает их число."""
+        cam_x = int(camera.x)
+        chunks = self.visible_chunks(camera)
+        surface.blits([(self.chunk(index), (index * self.chunk_width - cam_x, 0)) for index in chunks],
+                      doreturn=False)
+        return len(chunks)
+
+
+class Camera:
+    """Окно в мир: плавно следует за целью и не выходит за края уровня."""
+
+    def __init__(self, width, height, world_width, smoothing=0.15):
+        self.width = width
+        self.height = height
+        self.world_width = world_width
+        self.smoothing = smoothing
+        self.x = 0.0
+
+    def follow(self, target_x, snap=False):
+        goal = target_x - self.width / 2
+        self.x = goal if snap else self.x + (goal - self.x) * self.smoothing
+        self.x = max(0.0, min(self.x, self.world_width - self.width))
+
+    def visible(self, x, w):
+        return x + w > self.x and x < self.x + self.width
+
+
+class Body:
+    """Прямоугольное тело с координатами float: игрок или враг."""
+
+    __slots__ = ("x", "y", "w", "h", "vx", "vy", "on_ground", "chunk", "dead", "flying", "home")
+
+    def __init__(self, x, y, w, h, flying=False):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.vx = 0.0
+        self.vy = 0.0
+        self.on_ground = False
+        self.chunk = -1  # В какой корзине кусков лежит (для врагов)
+        self.dead = False
+        self.flying = flying  # Летает без гравитации по полю направлений
+        self.home = (x, y)    # Куда возвращается летающий враг, когда игрок начинает заново
+
+    def overlaps(self, other):
+        return (self.x < other.x + other.w and other.x < self.x + self.w
+                and self.y < other.y + other.h and other.y < self.y + self.h)
+
+    def fall(self, tilemap):
+        """Гравитация и движение с остановкой о тайлы."""
+        self.vy = min(self.vy + GRAVITY, MAX_FALL)
+        hit_wall, self.on_ground = tilemap.move(self, self.vx, self.vy)
+        if self.on_ground or (self.vy < 0 and tilemap.solid_at(self.x + self.w / 2, self.y - 1)):
+            self.vy = 0
+        return hit_wall
+
+
+class LevelGame:
+    """Уровень с прокруткой: игрок, враги в корзинах кусков и камера."""
+
+    def __init__(self, tilemap, view_size=(800, 600)):
+        self.map = tilemap
+        self.camera = Camera(view_size[0], view_size[1], tilemap.pixel_width)
+        starts = tilemap.spawns[PLAYER_START] or [(tilemap.tile_size, 0)]
+        self.start = starts[0]
+        self.player = Body(self.start[0], self.start[1], 30, 40)
+        self.jumps = 0
+
+        # Враги по корзинам: номер куска -> список. Спящие враги лежат и не считаются
+        self.buckets = {}
+        for x, y in tilemap.spawns[ENEMY_SPAWN]:
+            enemy = Body(x + 5, y + 10, 30, 30)
+            enemy.vx = -ENEMY_SPEED
+            self.place(enemy)
+        self.flyers = [Body(x + 5, y + 5, 30, 30, flying=True) for x, y in tilemap.spawns[FLYER_SPAWN]]
+        for flyer in self.flyers:
+            self.place(flyer)
+        self.total_enemies = len(tilemap.spawns[ENEMY_SPAWN]) + len(tilemap.spawns[FLYER_SPAWN])
+        self.active = []
+        # Одно поле направлений к игроку на всех летающих врагов. Дальше
+        # FIELD_RADIUS столбцов от игрока враги ждут, пока он подойдёт
+        self.field = FlowField(tilemap, radius=FIELD_RADIUS)
+        self.next_field_update = 0
+
+        self.camera.follow(self.player.x, snap=True)
+        self.running = True
+        self.frame = 0
+        self.kills = 0
+        self.deaths = 0
+        self.active_total = 0  # Для статистики: сумма активных врагов по кадрам
+
+    def chunk_of(self, body):
+        return int(body.x + body.w / 2) // self.map.chunk_width
+
+    def place(self, enemy):
+        """Перекладывает врага в корзину куска, где он сейчас стоит."""
+        chunk = self.chunk_of(enemy)
+        if chunk != enemy.chunk:
+            if enemy.chunk in self.buckets:
+                self.buckets[enemy.chunk].remove(enemy)
+            self.buckets.setdefault(chunk, []).append(enemy)
+            enemy.chunk = chunk
+
+    def active_enemies(self):
+        """Враги в видимых кусках и в ACTIVE_MARGIN кусках вокруг."""
+        chunks = self.map.visible_chunks(self.camera)
+        active = []
+        for index in range(chunks.start - ACTIVE_MARGIN, chunks.stop + ACTIVE_MARGIN):
+            active.extend(self.buckets.get(index, ()))
+        return active
+
+    def respawn(self):
+        player = self.player
+        player.x, player.y = self.start
+        player.vx = player.vy = 0
+        self.camera.follow(player.x, snap=True)
+        self.deaths += 1
+        # Летающие враги не караулят игрока у старта
+        for flyer in self.flyers:
+            if not flyer.dead:
+                flyer.x, flyer.y = flyer.home
+                self.place(flyer)
+
+    def step(self, inputs):
+        """Один шаг: тот же FrameInput, что у World (влево, вправо, прыжок)."""
+        self.frame += 1
+        if inputs.quit:
+            self.running = False
+        tilemap = self.map
+        player = self.player
+
+        player.vx = (inputs.right - inputs.left) * PLAYER_SPEED
+        if player.on_ground:
+            self.jumps = 0
+        if inputs.jump and self.jumps < 2:
+            player.vy = -JUMP_HEIGHT
+            self.jumps += 1
+        player.fall(tilemap)
+        if player.y > tilemap.pixel_height:
+            self.respawn()  # Упал в яму
+
+        # Только враги рядом с камерой
+        self.active = active = self.active_enemies()
+        self.active_total += len(active)
+        field = self.field
+        if self.frame >= self.next_field_update and any(enemy.flying for enemy in active):
+            # Только при смене клетки игрока и не чаще раза в FIELD_INTERVAL шагов
+            if field.update(player.x + player.w / 2, player.y + player.h / 2):
+                self.next_field_update = self.frame + FIELD_INTERVAL
+        for enemy in active:
+            if enemy.flying:
+                # Куда лететь из клетки, где центр врага, — один индекс в поле
+                dx, dy = field.steer(enemy.x + enemy.w / 2, enemy.y + enemy.h / 2)
+                tilemap.move(enemy, dx * FLYER_SPEED, dy * FLYER_SPEED)
+            else:
+                hit_wall = enemy.fall(tilemap)
+                # Разворот у стены или на краю обрыва
+                front_x = enemy.x + enemy.w + 1 if enemy.vx > 0 else enemy.x - 1
+                at_edge = enemy.on_ground and not tilemap.solid_at(front_x, enemy.y + enemy.h + 1)
+                if hit_wall or at_edge:
+                    enemy.vx = -enemy.vx
+            if enemy.y > tilemap.pixel_height:
+                enemy.dead = True
+            elif enemy.overlaps(player):
+                if player.vy > 0 and player.y + player.h - player.vy <= enemy.y + 1:
+                    enemy.dead = True  # Прыжок сверху
+                    player.vy = -JUMP_HEIGHT / 2
+                    self.kills += 1
+                else:
+                    self.respawn()
+                    break
+            if not enemy.dead:
+                self.place(enemy)
+
+        for enemy in active:
+            if enemy.dead and enemy.chunk in self.buckets:
+                self.buckets[enemy.chunk].remove(enemy)
+                enemy.chunk = -1
+
+        self.camera.follow(player.x + player.w / 2)
+
+    def draw(self, surface):
+        camera = self.camera
+        cam_x = int(camera.x)
+        self.map.draw(surface, camera)
+        for enemy in self.active:
+            if not enemy.dead and camera.visible(enemy.x, enemy.w):
+                color = (100, 100, 255) if enemy.flying else (200, 0, 0)
+                surface.fill(color, (enemy.x - cam_x, enemy.y, enemy.w, enemy.h))
+        player = self.player
+        surface.fill((60, 60, 60), (player.x - cam_x, player.y, player.w, player.h))
+
+
+def bot_input(game, rng):
+    """Бот для запуска без окна: бежит вправо и прыгает перед стенами и ямами."""
+    from game import FrameInput
+
+    player = game.player
+    tilemap = game.map
+    ahead = player.x + player.w + TILE_SIZE
+    wall = tilemap.solid_at(ahead, player.y + player.h / 2)
+    gap = not tilemap.solid_at(ahead, player.y + player.h + 1)
+    return FrameInput(
+        right=True,
+        jump=player.on_ground and (wall or gap or rng.random() < 0.02),
+    )
+
+
+def main():
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="Уровень из тайлов с прокруткой")
+    parser.add_argument("level", nargs="?", default=os.path.join(LEVELS_DIR, "level1.txt"))
+    parser.add_argument("--headless", action="store_true", help="без окна: играет бот, печатается время")
+    parser.add_argument("--frames", type=int, default=6000)
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Уровень с прокруткой")
+
+    tilemap = TileMap.load(args.level)
+    game = LevelGame(tilemap, screen.get_size())
+
+    if args.headless:
+        rng = random.Random(0)
+        step_time = draw_time = 0.0
+        for _ in range(args.frames):
+            start = time.perf_counter()
+            game.step(bot_input(game, rng))
+            step_time += time.perf_counter() - start
+            start = time.perf_counter()
+            game.draw(screen)
+            draw_time += time.perf_counter() - start
+        frames = args.frames
+        print(f"Уровень {tilemap.width}×{tilemap.height} тайлов, врагов {game.total_enemies}")
+        print(f"Шаг {step_time / frames * 1000:.3f} мс, отрисовка {draw_time / frames * 1000:.3f} мс на кадр")
+        print(f"Активных врагов в среднем {game.active_total / frames:.1f}, кусков в кэше {len(tilemap.chunks)}, "
+              f"пересчётов поля направлений {game.field.recomputes}")
+        print(f"Игрок дошёл до x={game.player.x:.0f} из {tilemap.pixel_width}, "
+              f"убито врагов {game.kills}, падений и столкновений {game.deaths}")
+        return
+
+    from game import read_input
+
+    clock = pygame.time.Clock()
+    while game.running:
+        game.step(read_input())
+        game.draw(screen)
+        pygame.display.flip()
+        clock.tick(60)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
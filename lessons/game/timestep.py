@@ -0,0 +1,73 @@
+"""Фиксированный шаг симуляции и отрисовка с интерполяцией.
+
+Раньше один кадр = один шаг физики: гравитация и скорости прибавлялись
+"за кадр", и если кадр тормозил, замедлялась вся игра. Теперь реальное
+время копится в аккумуляторе, а симуляция делает столько шагов
+длиной 1/60 с, сколько в него поместилось:
+
+    timestep = FixedTimestep(step_rate=60)
+    while running:
+        frame_seconds = clock.tick(RENDER_FPS) / 1000
+        for inputs in timestep.steps(frame_seconds, read_input()):
+            world.step(inputs)
+        world.draw(screen, timestep.alpha)
+
+На медленной машине за кадр выполнится 2–3 шага, и игра идёт
+с правильной скоростью. На быстрой — кадров больше, чем шагов, и между
+шагами позиции рисуются с интерполяцией (alpha — доля следующего шага).
+"""
+
+STEP_RATE = 60  # Шагов симуляции в секунду — физика настроена под это число
+MAX_STEPS = 5   # Не больше шагов за кадр, иначе отставание только растёт
+
+
+def lerp(a, b, t):
+    """Точка между a и b: t = 0 — a, t = 1 — b."""
+    return a + (b - a) * t
+
+
+class FixedTimestep:
+    """Аккумулятор реального времени для шагов фиксированной длины."""
+
+    def __init__(self, step_rate=STEP_RATE, max_steps=MAX_STEPS):
+        self.dt = 1 / step_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.pending = None  # Ввод кадра, на котором не было ни одного шага
+
+    def advance(self, frame_seconds):
+        """Добавляет время кадра и возвращает, сколько шагов симуляции сделать."""
+        self.accumulator += frame_seconds
+        steps = 0
+        while self.accumulator >= self.dt and steps < self.max_steps:
+            self.accumulator -= self.dt
+            steps += 1
+
+        if steps == self.max_steps and self.accumulator >= self.dt:
+            # Машина не успевает: выбрасываем долг, чтобы не копить его вечно
+            self.accumulator %= self.dt
+
+        self.alpha = self.accumulator / self.dt
+        return steps
+
+    def steps(self, frame_seconds, inputs):
+        """Ввод для каждого шага этого кадра.
+
+        Нажатия (прыжок, выстрел) достаются только первому шагу, остальные
+        шаги получают лишь зажатые клавиши. Если в кадре не было ни одного
+        шага, нажатия переносятся на следующий кадр и не теряются.
+        """
+        if self.pending is not None:
+            inputs.merge_events(self.pending)
+            self.pending = None
+
+        count = self.advance(frame_seconds)
+        if count == 0:
+            self.pending = inputs
+            return
+
+        yield inputs
+        held = inputs.held()
+        for _ in range(count - 1):
+            yield held
@@ -0,0 +1,355 @@
+"""Векторизованное хранилище врагов и снарядов на NumPy.
+
+Обычная игра хранит каждого врага объектом, и каждый кадр вызывает
+enemy.position_update() по одному. Здесь все координаты, скорости и флаги
+лежат в массивах NumPy ("структура массивов"), а весь кадр считается
+несколькими операциями над массивами сразу — так волна может вырасти
+с 5 врагов (MAX_ENEMIES) до тысяч.
+
+NumPy не обязателен для игры: без него этот модуль просто недоступен.
+
+    enemies = EnemyArrays(capacity=5000)
+    enemies.spawn(x, y, FLYER)
+    enemies.update(player_x, player_y, ground_y)
+    enemies.remove_off_screen(screen_width)
+
+Запуск для проверки скорости:
+    python vectorized.py --enemies 5000 --projectiles 1000
+"""
+import argparse
+import time
+
+from motion import PATTERNS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен — работаем без векторизации
+    np = None
+
+# Типы врагов
+WALKER = 0
+FLYER = 1
+
+ENEMY_SIZE = 40
+PROJECTILE_SIZE = 24
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("Для векторизованного режима нужен NumPy: pip install numpy")
+
+
+class EnemyArrays:
+    """Враги в массивах: x, y, направление, скорость, тип, фаза полёта."""
+
+    def __init__(self, capacity, size=ENEMY_SIZE, pattern="wave"):
+        require_numpy()
+        self.capacity = capacity
+        self.size = size
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.direction = np.ones(capacity, dtype=np.int8)
+        self.speed = np.zeros(capacity, dtype=np.float32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.phase = np.zeros(capacity, dtype=np.int32)
+        # Смещения по y из готовой траектории (motion.py): синус не считается
+        self.fly_dy = np.asarray(PATTERNS[pattern].dy, dtype=np.float32)
+
+    def spawn(self, x, y, kind=WALKER):
+        """Добавляет врага. Возвращает False, если места нет."""
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.kind[i] = kind
+        self.speed[i] = 2 if kind == WALKER else 1.5
+        self.direction[i] = 1
+        self.phase[i] = 0
+        self.count += 1
+        return True
+
+    def update(self, player_x, player_y, ground_y):
+        """Все враги идут к игроку; летающие качаются по синусоиде."""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        direction = self.direction[:n]
+
+        direction[:] = np.where(x < player_x, 1, -1)
+        x += self.speed[:n] * direction
+
+        walkers = self.kind[:n] == WALKER
+        y[walkers] = ground_y - self.size
+
+        flyers = ~walkers
+        phase = self.phase[:n]
+        phase[flyers] = (phase[flyers] + 1) % len(self.fly_dy)
+        fly_y = player_y + self.fly_dy[phase[flyers]] - 20
+        y[flyers] = np.clip(fly_y, 50, ground_y - self.size)
+
+    def keep(self, mask):
+        """Оставляет только врагов, где mask == True (сжатие на месте)."""
+        n = self.count
+        keep = np.flatnonzero(mask[:n])
+        m = len(keep)
+        for array in (self.x, self.y, self.direction, self.speed, self.kind, self.phase):
+            array[:m] = array[keep]
+        self.count = m
+
+    def remove_off_screen(self, screen_width, margin=50):
+        x = self.x[:self.count]
+        self.keep((x + self.size >= -margin) & (x <= screen_width + margin))
+
+    def draw(self, surface, color=(200, 0, 0)):
+        """Рисует врагов прямоугольниками."""
+        size = self.size
+        for x, y in zip(self.x[:self.count].tolist(), self.y[:self.count].tolist()):
+            surface.fill(color, (int(x), int(y), size, size))
+
+
+class ProjectileArrays:
+    """Снаряды в массивах: позиция, скорость и флаги полёта."""
+
+    def __init__(self, capacity, size=PROJECTILE_SIZE, gravity=0.6):
+        require_numpy()
+        self.capacity = capacity
+        self.size = size
+        self.gravity = gravity
+        self.count = 0
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.stuck = np.zeros(capacity, dtype=bool)
+        self.hit_surface = np.zeros(capacity, dtype=bool)
+
+    def launch(self, x, y, target_x, target_y, speed=10):
+        """Запускает снаряд к цели. Возвращает False, если места нет."""
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        dx = target_x - x
+        dy = target_y - y
+        length = (dx * dx + dy * dy) ** 0.5
+        self.pos[i] = (x, y)
+        self.vel[i] = (dx / length * speed, dy / length * speed) if length > 0 else (0, 0)
+        self.active[i] = True
+        self.stuck[i] = False
+        self.hit_surface[i] = False
+        self.count += 1
+        return True
+
+    def update(self, ground_y, screen_width):
+        """Полёт, рикошет от стен и потолка, падение с трением — для всех сразу."""
+        n = self.count
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        moving = self.active[:n] & ~self.stuck[:n]
+        hit = self.hit_surface[:n]
+        stuck = self.stuck[:n]
+        size = self.size
+
+        # Фаза 1: прямой полёт
+        flying = moving & ~hit
+        pos[flying] += vel[flying]
+
+        left = flying & (pos[:, 0] <= 0)
+        right = flying & (pos[:, 0] + size >= screen_width)
+        ceiling = flying & (pos[:, 1] <= 0)
+        vel[left | right, 0] *= -0.4
+        vel[ceiling, 1] *= -0.4
+        hit |= left | right | ceiling
+
+        landed = flying & (pos[:, 1] + size >= ground_y)
+        pos[landed, 1] = ground_y - size
+        vel[landed, 1] = 0
+        stuck |= landed
+
+        # Фаза 2: падение после рикошета (гравитация + трение)
+        falling = moving & hit & ~stuck
+        vel[falling, 1] += self.gravity
+        pos[falling] += vel[falling]
+
+        fast = falling & (np.abs(vel[:, 0]) > 0.1)
+        vel[fast, 0] *= 0.92
+        vel[falling & ~fast, 0] = 0
+
+        landed = falling & (pos[:, 1] + size >= ground_y)
+        pos[landed, 1] = ground_y - size
+        vel[landed] = 0
+        stuck |= landed
+
+    def ricochet(self, indices):
+        """Отскок снарядов, попавших во врага: по оси с большей скоростью."""
+        vel = self.vel[indices]
+        horizontal = np.abs(vel[:, 0]) > np.abs(vel[:, 1])
+        vel[horizontal, 0] *= -0.4
+        vel[~horizontal, 1] *= -0.4
+        self.vel[indices] = vel
+        self.hit_surface[indices] = True
+
+    def keep(self, mask):
+        n = self.count
+        keep = np.flatnonzero(mask[:n])
+        m = len(keep)
+        for array in (self.pos, self.vel, self.active, self.stuck, self.hit_surface):
+            array[:m] = array[keep]
+        self.count = m
+
+    def remove_inactive(self):
+        self.keep(self.active)
+
+    def draw(self, surface, color=(50, 50, 50)):
+        size = self.size
+        for x, y in self.pos[:self.count].tolist():
+            surface.fill(color, (int(x), int(y), size, size))
+
+
+def find_hits(projectiles, enemies, chunk=1024):
+    """Пары (снаряд, враг), чьи квадраты пересекаются. Только летящие снаряды.
+
+    Возвращает два массива индексов одинаковой длины. Проверка идёт
+    матрицей "снаряды × враги" кусками по chunk снарядов, чтобы не
+    занимать много памяти на больших волнах.
+    """
+    n_p = projectiles.count
+    n_e = enemies.count
+    empty = np.zeros(0, dtype=np.intp)
+    if n_p == 0 or n_e == 0:
+        return empty, empty
+
+    flying = np.flatnonzero(
+        projectiles.active[:n_p] & ~projectiles.stuck[:n_p] & ~projectiles.hit_surface[:n_p]
+    )
+    if len(flying) == 0:
+        return empty, empty
+
+    ps = projectiles.size
+    es = enemies.size
+    ex = enemies.x[:n_e]
+    ey = enemies.y[:n_e]
+
+    p_hits = []
+    e_hits = []
+    for start in range(0, len(flying), chunk):
+        batch = flying[start:start + chunk]
+        px = projectiles.pos[batch, 0][:, None]
+        py = projectiles.pos[batch, 1][:, None]
+        overlap = (px < ex + es) & (px + ps > ex) & (py < ey + es) & (py + ps > ey)
+        p_index, e_index = np.nonzero(overlap)
+        p_hits.append(batch[p_index])
+        e_hits.append(e_index)
+
+    return np.concatenate(p_hits), np.concatenate(e_hits)
+
+
+SCALAR_PAIRS = 64  # Столько пар и меньше дешевле разобрать обычным циклом
+
+
+def assign_hits(p_hits, e_hits):
+    """Кто кого убил: то же, что цикл по снарядам в обычной игре.
+
+    Там снаряды идут по порядку, и каждый убивает первого ещё живого врага,
+    с которым пересёкся. Здесь это делается раундами над массивами пар
+    (отсортированы по снаряду, затем по врагу): снаряд выбирает первого
+    оставшегося врага, и выбор окончательный, если этого врага не задевает
+    ни один снаряд с меньшим номером, который ещё не выбрал. Самый первый
+    снаряд всегда выбирает окончательно. Когда пар остаётся мало, они
+    дорешиваются тем же циклом, что в обычной игре.
+
+    Возвращает (снаряды, враги) — пары "кто кого убил".
+    """
+    shooters = []
+    victims = []
+    while len(p_hits) > SCALAR_PAIRS:
+        # Самый младший снаряд, задевающий каждого врага
+        lowest_p = np.full(e_hits.max() + 1, p_hits[-1] + 1, dtype=p_hits.dtype)  # Пары отсортированы: p_hits[-1] — наибольший
+        np.minimum.at(lowest_p, e_hits, p_hits)
+
+        # Первый оставшийся враг каждого снаряда — начало его группы пар
+        first = np.flatnonzero(np.concatenate(([True], p_hits[1:] != p_hits[:-1])))
+        cand_p = p_hits[first]
+        cand_e = e_hits[first]
+        final = lowest_p[cand_e] == cand_p
+        done_p = cand_p[final]
+        done_e = cand_e[final]
+        shooters.append(done_p)
+        victims.append(done_e)
+
+        # Снаряды, которые выбрали, и убитые враги выбывают
+        chose = np.zeros(p_hits[-1] + 1, dtype=bool)
+        chose[done_p] = True
+        killed = np.zeros(len(lowest_p), dtype=bool)
+        killed[done_e] = True
+        keep = ~chose[p_hits] & ~killed[e_hits]
+        p_hits = p_hits[keep]
+        e_hits = e_hits[keep]
+
+    # Остаток — по порядку, как Projectile.update()
+    dead = set()
+    last_p = -1
+    tail_p = []
+    tail_e = []
+    for p, e in zip(p_hits.tolist(), e_hits.tolist()):
+        if p != last_p and e not in dead:
+            dead.add(e)
+            last_p = p
+            tail_p.append(p)
+            tail_e.append(e)
+    shooters.append(np.array(tail_p, dtype=np.intp))
+    victims.append(np.array(tail_e, dtype=np.intp))
+    return np.concatenate(shooters), np.concatenate(victims)
+
+
+def resolve_hits(projectiles, enemies):
+    """Каждый снаряд убивает одного врага: рикошет снаряда и удаление врагов.
+
+    Возвращает число убитых врагов.
+    """
+    p_hits, e_hits = find_hits(projectiles, enemies)
+    if len(p_hits) == 0:
+        return 0
+
+    shooters, e_killed = assign_hits(p_hits, e_hits)
+    projectiles.ricochet(shooters)
+
+    alive = np.ones(enemies.count, dtype=bool)
+    alive[e_killed] = False
+    enemies.keep(alive)
+    return len(e_killed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Скорость векторизованной волны врагов")
+    parser.add_argument("--enemies", type=int, default=5000)
+    parser.add_argument("--projectiles", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    require_numpy()
+    rng = np.random.default_rng(0)
+    screen_width, ground_y = 800, 500
+
+    enemies = EnemyArrays(args.enemies)
+    for i in range(args.enemies):
+        enemies.spawn(rng.uniform(-40, screen_width), ground_y - ENEMY_SIZE, kind=i % 2)
+    projectiles = ProjectileArrays(args.projectiles)
+    for _ in range(args.projectiles):
+        projectiles.launch(400, 450, rng.uniform(0, screen_width), rng.uniform(0, ground_y))
+
+    kills = 0
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        projectiles.update(ground_y, screen_width)
+        enemies.update(400, 450, ground_y)
+        kills += resolve_hits(projectiles, enemies)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.frames} кадров: {elapsed / args.frames * 1000:.3f} мс на кадр, убито {kills}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,29 @@
+import argparse
+import os
 import pygame
 import sys
-import math
 import random
 
+# Общие модули игры (кэш текста и др.) лежат в lessons/game
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "lessons", "game"))
+from hud import TextCache, HudLabel
+from collision import CollisionService
+from pool import ObjectPool
+from lifecycle import EntityList
+from surfaces import to_display_format
+from timestep import FixedTimestep, lerp
+from motion import PATTERNS, aim
+import particles
+from particles import ParticleSystem, HIT, RICOCHET, LANDING
+
 # Инициализация Pygame
 pygame.init()
 
 # Настройки окна
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Игра: Загрузчик ресурсов")
+FPS = 60  # Шагов симуляции в секунду
+RENDER_FPS = 144  # Кадров отрисовки в секунду (не больше)
 
 # Цвета
 WHITE = (255, 255, 255)
@@ -22,13 +35,24 @@ PLAYER_SPEED = 5
 JUMP_HEIGHT = 15
 GRAVITY = 1
 GROUND_Y = SCREEN_HEIGHT - 100
+PARTICLES = True  # Искры и пыль от снарядов (нужен NumPy, без него — выключено)
+
+# Пустой прямоугольник ни с чем не пересекается — им "выключают" убитых врагов
+NO_RECT = pygame.Rect(0, 0, 0, 0)
+
+# Траектории летающих врагов (см. motion.py). По умолчанию — прежняя синусоида;
+# другие включаются явно: World(assets, flyer_patterns=("wave", "zigzag")) или --flyer-patterns
+FLYER_PATTERNS = ("wave",)
 
 
 # ===== Класс: Загрузчик ресурсов =====
 class AssetLoader:
-    def __init__(self):
+    def __init__(self, assets_dir="assets"):
+        self.assets_dir = assets_dir  # Папка с картинками (по умолчанию — от текущей папки)
         self.sprites = {}
+        self.atlas = {}  # (имя, направление) -> готовый спрайт
         self.load_all()
+        self.build_atlas(["player_idle", "player_walk", "player_jump", "projectile"])
 
     def load_image(self, path, width, height):
         """Загружает изображение или возвращает заглушку"""
@@ -39,18 +63,42 @@ class AssetLoader:
             image = pygame.Surface((width, height), pygame.SRCALPHA)
             pygame.draw.rect(image, (100, 100, 100), (5, 5, width - 10, height - 10), border_radius=8)
             pygame.draw.circle(image, (255, 255, 255), (15, 15), 5)  # Глазик
-        return pygame.transform.scale(image, (width, height))
+        # Масштабированная копия — тоже в формате экрана, иначе blit будет медленным
+        return to_display_format(pygame.transform.scale(image, (width, height)))
 
     def load_all(self):
         """Загружаем все спрайты для игры"""
-        self.sprites["player_idle"] = self.load_image("assets/idle.png", PLAYER_SIZE, PLAYER_SIZE)
-        self.sprites["player_walk"] = self.load_image("assets/walk.png", PLAYER_SIZE, PLAYER_SIZE)
-        self.sprites["player_jump"] = self.load_image("assets/jump.png", PLAYER_SIZE, PLAYER_SIZE)
-        self.sprites["projectile"] = self.load_image("assets/projectile.png", 24, 24)
-
-    def get(self, name):
-        """Возвращает спрайт по имени"""
-        return self.sprites.get(name, None)
+        folder = self.assets_dir
+        self.sprites["player_idle"] = self.load_image(os.path.join(folder, "idle.png"), PLAYER_SIZE, PLAYER_SIZE)
+        self.sprites["player_walk"] = self.load_image(os.path.join(folder, "walk.png"), PLAYER_SIZE, PLAYER_SIZE)
+        self.sprites["player_jump"] = self.load_image(os.path.join(folder, "jump.png"), PLAYER_SIZE, PLAYER_SIZE)
+        self.sprites["projectile"] = self.load_image(os.path.join(folder, "projectile.png"), 24, 24)
+
+    def build_atlas(self, names):
+        """Заранее готовим отражённые копии спрайтов, чтобы не делать flip каждый кадр"""
+        for name in names:
+            image = self.sprites[name]
+            self.atlas[(name, "right")] = image
+            self.atlas[(name, "left")] = to_display_format(pygame.transform.flip(image, True, False))
+
+    def add_scaled(self, name, width, height):
+        """Добавляет в атлас копию спрайта другого размера (в обе стороны)"""
+        for direction in ("right", "left"):
+            image = pygame.transform.scale(self.atlas[(name, direction)], (width, height))
+            self.atlas[(name, direction, (width, height))] = to_display_format(image)
+
+    def audit(self, audit):
+        """Проверяет, что все картинки загрузчика в формате экрана (см. surfaces.py)"""
+        audit.check_all("sprites/", self.sprites)
+        audit.check_all("atlas/", self.atlas)
+
+    def get(self, name, direction="right", size=None):
+        """Возвращает спрайт по имени, направлению и размеру (если задан)"""
+        key = (name, direction) if size is None else (name, direction, size)
+        image = self.atlas.get(key)
+        if image is None:
+            image = self.sprites.get(name, None)
+        return image
 
 
 # ===== Класс: Игрок =====
@@ -65,6 +113,10 @@ class Player:
         self.direction = "right"
         self.assets = assets
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # Позиция на прошлом шаге — для плавной отрисовки между шагами
+        self.prev_x = x
+        self.prev_y = y
+        self.update_animation(moving=False)
 
     def move(self, direction):
         if direction == "left":
@@ -97,66 +149,74 @@ class Player:
 
         self.rect.y = self.y
 
-    def update_animation(self):
-        keys = pygame.key.get_pressed()
-        moving = keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]
-
+    def update_animation(self, moving):
         if self.is_jumping:
-            self.current_sprite = self.assets.get("player_jump")
+            name = "player_jump"
         elif moving:
-            self.current_sprite = self.assets.get("player_walk")
+            name = "player_walk"
         else:
-            self.current_sprite = self.assets.get("player_idle")
+            name = "player_idle"
 
-        if self.direction == "left":
-            self.flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
-        else:
-            self.flipped_sprite = self.current_sprite
+        # Отражённый спрайт уже лежит в атласе — просто берём нужный вариант
+        self.current_sprite = self.assets.get(name)
+        self.flipped_sprite = self.assets.get(name, self.direction)
 
-    def draw(self, surface):
-        surface.blit(self.flipped_sprite, (self.x, self.y))
+    def draw(self, surface, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        surface.blit(self.flipped_sprite, (x, y))
 
 
 # ===== Класс: Снаряд — сюрикен с рикошетом =====
 class Projectile:
-    def __init__(self, x, y, target_pos, assets, speed=10):
+    # Фиксированный набор полей: объекты снарядов живут в пуле и переиспользуются
+    __slots__ = ("rect", "prev_pos", "assets", "active", "stuck", "velocity", "hit_surface", "gravity")
+
+    def __init__(self, x=0, y=0, target_pos=None, assets=None, speed=10):
         self.rect = pygame.Rect(x, y, 24, 24)
+        self.prev_pos = (x, y)
         self.assets = assets
-        self.active = True
+        self.active = False
         self.stuck = False
+        self.velocity = pygame.math.Vector2(0, 0)
+        self.hit_surface = False
+        self.gravity = 0.6
 
-        direction = pygame.math.Vector2(target_pos[0] - x, target_pos[1] - y)
-        if direction.length() > 0:
-            self.velocity = direction.normalize() * speed
-        else:
-            self.velocity = pygame.math.Vector2(0, 0)
+        if target_pos is not None:
+            self.launch(x, y, target_pos, speed)
+
+    def launch(self, x, y, target_pos, speed=10):
+        """Запускает снаряд из (x, y) к target_pos, не создавая новых объектов."""
+        self.rect.topleft = (x, y)
+        self.prev_pos = (x, y)
+        self.velocity.update(aim(target_pos[0] - x, target_pos[1] - y, speed))
 
+        self.active = True
+        self.stuck = False
         self.hit_surface = False
-        self.gravity = 0.6
 
-    def update(self, ground_y, enemies):
+    def update(self, ground_y, enemy_rects):
+        """Двигает снаряд. Возвращает индекс убитого врага или -1.
+
+        enemy_rects — список прямоугольников врагов (параллельно списку врагов).
+        """
+        hit_index = -1
         if self.stuck or not self.active:
-            return
+            return hit_index
 
         if not self.hit_surface:
             # Двигаем снаряд
             self.rect.x += self.velocity.x
             self.rect.y += self.velocity.y
 
-            # Проверка на попадание во врага
-            for enemy in enemies[:]:
-                if self.rect.colliderect(enemy.rect):
-                    # Убиваем врага
-                    enemies.remove(enemy)
+            # Проверка на попадание во врага — один вызов по всем врагам сразу
+            index = self.rect.collidelist(enemy_rects)
+            if index != -1:
+                # Убиваем врага: до конца кадра в него больше никто не попадёт
+                enemy_rects[index] = NO_RECT
+                hit_index = index
 
-                    # Рикошет: отскакиваем в противоположную сторону
-                    if abs(self.velocity.x) > abs(self.velocity.y):
-                        self.velocity.x *= -0.4  # Отскок по горизонтали
-                    else:
-                        self.velocity.y *= -0.4  # Отскок по вертикали
-
-                    self.hit_surface = True  # После удара — начинаем падать
-                    break  # Только одно столкновение за раз
+                self.ricochet()
 
             # Отскок от стен
             if self.rect.left <= 0:
@@ -193,18 +253,31 @@ class Projectile:
             if self.rect.bottom >= ground_y:
                 self.rect.bottom = ground_y
                 self.stuck = True
-                self.velocity = pygame.math.Vector2(0, 0)
+                self.velocity.update(0, 0)
+
+        return hit_index
+
+    def ricochet(self):
+        """Отскок от врага в противоположную сторону по оси с большей скоростью."""
+        if abs(self.velocity.x) > abs(self.velocity.y):
+            self.velocity.x *= -0.4  # Отскок по горизонтали
+        else:
+            self.velocity.y *= -0.4  # Отскок по вертикали
+        self.hit_surface = True  # После удара — начинаем падать
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         if not self.active:
             return
+        x = lerp(self.prev_pos[0], self.rect.x, alpha)
+        y = lerp(self.prev_pos[1], self.rect.y, alpha)
         sprite = self.assets.get("projectile")
         if sprite:
-            draw_x = self.rect.x - (sprite.get_width() // 2 - self.rect.width // 2)
-            draw_y = self.rect.y - (sprite.get_height() // 2 - self.rect.height // 2)
+            draw_x = x - (sprite.get_width() // 2 - self.rect.width // 2)
+            draw_y = y - (sprite.get_height() // 2 - self.rect.height // 2)
             surface.blit(sprite, (draw_x, draw_y))
         else:
-            pygame.draw.circle(surface, (50, 50, 50), self.rect.center, 12)
+            center = (x + self.rect.width // 2, y + self.rect.height // 2)
+            pygame.draw.circle(surface, (50, 50, 50), center, 12)
 
     def is_close_to_player(self, player_rect, threshold=40):
         return self.stuck and self.rect.colliderect(player_rect.inflate(threshold, threshold))
@@ -213,20 +286,23 @@ class Projectile:
         self.active = False
         self.stuck = False
         self.hit_surface = False
-        self.velocity = pygame.math.Vector2(0, 0)
+        self.velocity.update(0, 0)
 
 
 # ===== Класс: Враг =====
 class Enemy:
-    def __init__(self, x, y, enemy_type="walker"):
+    def __init__(self, x, y, enemy_type="walker", pattern="wave"):
         self.rect = pygame.Rect(x, y, 40, 40)
+        self.prev_pos = (x, y)  # Позиция на прошлом шаге — для плавной отрисовки
         self.type = enemy_type  # "walker" или "flyer"
         self.speed = 2 if enemy_type == "walker" else 1.5
         self.health = 1
         self.direction = 1  # 1 = вправо, -1 = влево
+        self.dead = False  # Помечен на удаление (см. lifecycle.py)
 
-        self.fly_offset = 0
-        self.fly_angle = 0
+        # Траектория полёта — общий список шагов, у врага только номер фазы
+        self.path = PATTERNS[pattern].steps
+        self.phase = 0
 
     def update(self, player_x, player_y, ground_y):
         if self.rect.x < player_x:
@@ -239,134 +315,326 @@ class Enemy:
         if self.type == "walker":
             self.rect.y = ground_y - self.rect.height
         else:
-            self.fly_angle += 0.1
-            self.fly_offset = math.sin(self.fly_angle) * 15
-            self.rect.y = player_y + self.fly_offset - 20
+            self.phase = (self.phase + 1) % len(self.path)
+            dx, dy = self.path[self.phase]
+            self.rect.x += dx
+            self.rect.y = player_y + dy - 20
             self.rect.y = max(50, min(self.rect.y, ground_y - self.rect.height))
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        x = lerp(self.prev_pos[0], self.rect.x, alpha)
+        y = lerp(self.prev_pos[1], self.rect.y, alpha)
         if self.type == "walker":
-            pygame.draw.rect(surface, (200, 0, 0), self.rect)  # Красный квадрат
+            pygame.draw.rect(surface, (200, 0, 0), (x, y, self.rect.width, self.rect.height))  # Красный квадрат
         else:
-            pygame.draw.circle(surface, (100, 100, 255), self.rect.center, 20)  # Синий круг
+            pygame.draw.circle(surface, (100, 100, 255), (x + 20, y + 20), 20)  # Синий круг
 
     def is_off_screen(self):
         return self.rect.right < -50 or self.rect.left > SCREEN_WIDTH + 50
 
 
-# ===== Инициализация =====
-asset_loader = AssetLoader()
-player = Player(x=100, y=GROUND_Y - PLAYER_SIZE, assets=asset_loader)
+# ===== Ввод за один кадр =====
+class FrameInput:
+    """Ввод игрока за кадр: зажатые клавиши, прыжок и точка выстрела (или None)."""
 
-# Снаряды
-projectiles = []
-max_projectiles = 3
+    def __init__(self, left=False, right=False, jump=False, shoot=None, quit=False):
+        self.left = left
+        self.right = right
+        self.jump = jump
+        self.shoot = shoot
+        self.quit = quit
 
-# Жизни
-player_lives = 3
-lives_font = pygame.font.SysFont("Arial", 30)
+    @property
+    def moving(self):
+        return self.left or self.right
 
-# Враги
-enemies = []
-spawn_timer = 0
-spawn_delay = 180  # Каждые 3 секунды (60 FPS)
+    def held(self):
+        """Только зажатые клавиши — для второго и следующих шагов кадра."""
+        return FrameInput(left=self.left, right=self.right, quit=self.quit)
 
-# ===== Основной цикл =====
-clock = pygame.time.Clock()
-running = True
+    def merge_events(self, earlier):
+        """Добавляет нажатия из ввода, который ещё не дошёл до симуляции."""
+        self.jump = self.jump or earlier.jump
+        if self.shoot is None:
+            self.shoot = earlier.shoot
+        self.quit = self.quit or earlier.quit
 
-while running:
-    dt = clock.tick(60)
-    screen.fill(WHITE)
 
-    # Рисуем землю
-    pygame.draw.line(screen, RED, (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 3)
+def read_input():
+    """Собирает FrameInput из событий и клавиатуры pygame."""
+    inputs = FrameInput()
 
-    # События
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
-            running = False
+            inputs.quit = True
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
-                player.jump()
+                inputs.jump = True
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Левая кнопка мыши
-                active_count = len([p for p in projectiles if p.active])
-                if active_count < max_projectiles:
-                    pos = player.x + PLAYER_SIZE // 2, player.y + PLAYER_SIZE // 2
-                    projectile = Projectile(pos[0], pos[1], pygame.mouse.get_pos(), asset_loader)
-                    projectiles.append(projectile)
+                inputs.shoot = pygame.mouse.get_pos()
 
-    # Управление
     keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        player.move("left")
-    if keys[pygame.K_RIGHT]:
-        player.move("right")
-
-    # Логика игрока
-    player.apply_gravity()
-    player.update_animation()
-
-    # Обновление снарядов
-    player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
-
-    for projectile in projectiles:
-        projectile.update(GROUND_Y, enemies)  # Передаём enemies!
-        projectile.draw(screen)
-
-        # Подбор, если застрял
-        if projectile.stuck and projectile.is_close_to_player(player_rect):
-            projectile.reset()
-
-    # Спавн врагов
-    spawn_timer += 1
-    if spawn_timer >= spawn_delay:
-        spawn_timer = 0
-        side = random.choice(["left", "right"])
-        enemy_type = random.choice(["walker", "flyer"])
-
-        if enemy_type == "walker":
-            y = GROUND_Y - 40
-        else:
-            y = random.randint(100, GROUND_Y - 100)
+    inputs.left = keys[pygame.K_LEFT]
+    inputs.right = keys[pygame.K_RIGHT]
+    return inputs
 
-        x = -40 if side == "left" else SCREEN_WIDTH + 40
-        enemies.append(Enemy(x, y, enemy_type))
 
-    # Обновление врагов
-    for enemy in enemies[:]:
-        enemy.update(player.x, player.y, GROUND_Y)
-        enemy.draw(screen)
+# ===== Класс: Мир игры =====
+class World:
+    """Состояние игры и один шаг симуляции — без окна и без часов."""
 
-        # Столкновение с игроком
-        if enemy.rect.colliderect(player.rect):
+    def __init__(self, assets, flyer_patterns=FLYER_PATTERNS):
+        self.assets = assets
+        self.flyer_patterns = flyer_patterns
+        self.player = Player(x=100, y=GROUND_Y - PLAYER_SIZE, assets=assets)
+
+        # Снаряды: пул из max_projectiles объектов, созданных один раз
+        self.max_projectiles = 3
+        self.projectile_pool = ObjectPool(lambda: Projectile(assets=assets), self.max_projectiles)
+        self.projectiles = self.projectile_pool.active
+
+        # Жизни
+        self.player_lives = 3
+
+        # Враги
+        self.enemies = EntityList()  # Удаление — пометкой и одним проходом в конце шага
+        self.collisions = CollisionService()
+        self.spawn_timer = 0
+        self.spawn_delay = 180  # Каждые 3 секунды (60 FPS)
+        self.flyers_spawned = 0  # Для выбора траектории из flyer_patterns по очереди
+
+        # Частицы только для красоты: на симуляцию не влияют
+        self.particles = None
+        if PARTICLES and particles.available():
+            self.particles = ParticleSystem()
+
+        self.running = True
+        self.game_over = False
+        self.frame = 0
+
+    def step(self, inputs):
+        """Один кадр симуляции по вводу inputs (FrameInput)."""
+        self.frame += 1
+        player = self.player
+
+        # Позиции до шага — между ними и новыми рисуются промежуточные кадры
+        player.prev_x = player.x
+        player.prev_y = player.y
+        for projectile in self.projectiles:
+            projectile.prev_pos = projectile.rect.topleft
+        for enemy in self.enemies:
+            enemy.prev_pos = enemy.rect.topleft
+
+        # События
+        if inputs.quit:
+            self.running = False
+        if inputs.jump:
+            player.jump()
+        if inputs.shoot is not None:
+            projectile = self.projectile_pool.acquire()  # None — все снаряды заняты
+            if projectile is not None:
+                pos = player.x + PLAYER_SIZE // 2, player.y + PLAYER_SIZE // 2
+                projectile.launch(pos[0], pos[1], inputs.shoot)
+
+        # Управление
+        if inputs.left:
+            player.move("left")
+        if inputs.right:
+            player.move("right")
+
+        # Логика игрока
+        player.apply_gravity()
+        player.update_animation(inputs.moving)
+
+        # Обновление снарядов
+        player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
+
+        # Прямоугольники врагов — параллельный список для пакетной проверки.
+        # Враги ещё не двигались в этом кадре.
+        enemies = self.enemies.items
+        enemy_rects = [enemy.rect for enemy in enemies]
+
+        fx = self.particles
+        for projectile in self.projectiles:
+            flying = not projectile.hit_surface and not projectile.stuck
+            was_stuck = projectile.stuck
+            hit_index = projectile.update(GROUND_Y, enemy_rects)
+            if hit_index != -1:
+                enemy = enemies[hit_index]
+                self.enemies.kill(enemy)
+                if fx is not None:
+                    fx.burst(*enemy.rect.center, HIT)
+            if fx is not None:
+                if flying and projectile.hit_surface and hit_index == -1:
+                    fx.burst(*projectile.rect.center, RICOCHET)  # Рикошет от стены
+                if projectile.stuck and not was_stuck:
+                    # Воткнулся в землю — с прямого полёта или после рикошета
+                    fx.burst(*projectile.rect.midbottom, LANDING)
+
+            # Подбор, если застрял
+            if projectile.stuck and projectile.is_close_to_player(player_rect):
+                projectile.reset()
+
+        # Подобранные снаряды возвращаются в пул
+        self.projectile_pool.compact()
+
+        # Спавн врагов
+        self.spawn_timer += 1
+        if self.spawn_timer >= self.spawn_delay:
+            self.spawn_timer = 0
+            side = random.choice(["left", "right"])
+            enemy_type = random.choice(["walker", "flyer"])
+
+            if enemy_type == "walker":
+                y = GROUND_Y - 40
+            else:
+                y = random.randint(100, GROUND_Y - 100)
+
+            x = -40 if side == "left" else SCREEN_WIDTH + 40
+            pattern = self.flyer_patterns[self.flyers_spawned % len(self.flyer_patterns)]
+            if enemy_type == "flyer":
+                self.flyers_spawned += 1
+            self.enemies.spawn(Enemy(x, y, enemy_type, pattern))  # Появится в конце шага
+
+        # Обновление врагов
+        for enemy in enemies:
+            if not enemy.dead:
+                enemy.update(player.x, player.y, GROUND_Y)
+
+        # Столкновение с игроком — один вызов collidelistall по всем врагам
+        self.collisions.sync("enemies", enemies)
+        hits = self.collisions.hits(player.rect, "enemies")
+
+        for index in hits:
+            enemy = enemies[index]
+            if enemy.dead:
+                continue  # Уже сбит снарядом в этом шаге
+            self.enemies.kill(enemy)
             # Отталкивание
             knockback = 50 if enemy.type == "walker" else 30
             player.x += knockback * (-1 if player.direction == "right" else 1)
             player.x = max(0, min(player.x, SCREEN_WIDTH - player.width))
 
             # Потеря жизни
-            player_lives -= 1
-            enemies.remove(enemy)
-
-            if player_lives <= 0:
-                print("Игра окончена!")
-                running = False
-
-        # Удаление ушедших за экран
-        if enemy.is_off_screen():
-            enemies.remove(enemy)
-
-    # Отрисовка игрока
-    player.draw(screen)
+            self.player_lives -= 1
 
-    # Отображение жизней
-    lives_text = lives_font.render(f"Жизни: {player_lives}", True, (0, 0, 0))
-    screen.blit(lives_text, (10, 10))
+        if self.player_lives <= 0:
+            self.game_over = True
 
-    pygame.display.flip()
+        for enemy in enemies:
+            if enemy.is_off_screen():
+                self.enemies.kill(enemy)
 
-# Выход
-pygame.quit()
-sys.exit()
\ No newline at end of file
+        # Мёртвые уходят из списка одним проходом, новые враги добавляются
+        self.enemies.sweep()
+
+        if fx is not None:
+            fx.update()
+
+    def draw(self, surface, lives_label, alpha=1.0):
+        """Рисует мир на surface. alpha — доля пути от прошлого шага к текущему."""
+        surface.fill(WHITE)
+
+        # Рисуем землю
+        pygame.draw.line(surface, RED, (0, GROUND_Y), (SCREEN_WIDTH, GROUND_Y), 3)
+
+        for projectile in self.projectiles:
+            projectile.draw(surface, alpha)
+
+        for enemy in self.enemies:
+            enemy.draw(surface, alpha)
+
+        if self.particles is not None:
+            self.particles.draw(surface, alpha)
+
+        # Отрисовка игрока
+        self.player.draw(surface, alpha)
+
+        # Отображение жизней
+        lives_label.draw(surface, (10, 10), self.player_lives)
+
+
+def random_input(world, rng):
+    """Случайный ввод для запуска без окна."""
+    return FrameInput(
+        left=rng.random() < 0.3,
+        right=rng.random() < 0.3,
+        jump=rng.random() < 0.02,
+        shoot=(rng.randint(0, SCREEN_WIDTH), rng.randint(0, GROUND_Y)) if rng.random() < 0.03 else None,
+    )
+
+
+def run_headless(frames, seed=0, flyer_patterns=FLYER_PATTERNS):
+    """Крутит симуляцию frames кадров без окна и без ограничения FPS.
+
+    После проигрыша мир создаётся заново — так можно прожить часы игры.
+    """
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    random.seed(seed)
+    rng = random.Random(seed)
+    assets = AssetLoader()
+    world = World(assets, flyer_patterns)
+    games = 1
+
+    for _ in range(frames):
+        world.step(random_input(world, rng))
+        if world.game_over:
+            world = World(assets, flyer_patterns)
+            games += 1
+
+    print(f"Прожито кадров: {frames}, сыграно игр: {games}")
+
+
+def main(flyer_patterns=FLYER_PATTERNS):
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Игра: Загрузчик ресурсов")
+
+    # ===== Инициализация =====
+    asset_loader = AssetLoader()
+    world = World(asset_loader, flyer_patterns)
+    text_cache = TextCache()
+    lives_label = HudLabel(text_cache, "Жизни: {}", (0, 0, 0), size=30, name="Arial", system=True)
+
+    # ===== Основной цикл =====
+    clock = pygame.time.Clock()
+    # Время кадра копится в аккумуляторе и тратится шагами по 1/FPS секунды:
+    # при просадке FPS игра не замедляется, а на быстрой машине кадров больше
+    timestep = FixedTimestep(step_rate=FPS)
+
+    while world.running:
+        dt = clock.tick(RENDER_FPS)
+        for inputs in timestep.steps(dt / 1000, read_input()):
+            world.step(inputs)
+            if world.game_over:
+                break
+        world.draw(screen, lives_label, timestep.alpha)
+        pygame.display.flip()
+
+        if world.game_over:
+            print("Игра окончена!")
+            world.running = False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Игра про ниндзя-кота")
+    parser.add_argument("--headless", action="store_true", help="без окна и без ограничения FPS")
+    parser.add_argument("--frames", type=int, default=FPS * 60 * 60, help="сколько кадров прожить без окна")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--flyer-patterns", nargs="+", choices=sorted(PATTERNS), default=FLYER_PATTERNS,
+                        help="траектории летающих врагов по очереди (см. lessons/game/motion.py)")
+    args = parser.parse_args()
+    flyer_patterns = tuple(args.flyer_patterns)
+
+    if args.headless:
+        # Пустой видеодрайвер: окна нет, но convert_alpha() работает
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.quit()
+        pygame.display.init()
+        run_headless(args.frames, args.seed, flyer_patterns)
+    else:
+        main(flyer_patterns)
+
+    # Выход
+    pygame.quit()
+    sys.exit()